@@ -0,0 +1,117 @@
+"""
+Benchmark battlelog flattening: per-battle Pydantic models vs columnar Polars.
+
+Usage:
+    PYTHONPATH=src uv run python benchmarks/bench_battlelog_flatten.py --battles 100000
+"""
+
+import argparse
+import random
+import time
+
+import polars as pl
+
+from brawlstar_project.entities.player.models import BattlelogData
+from brawlstar_project.processing.utils import (
+    flatten_battlelog_data,
+    flatten_battlelogs,
+)
+
+BATTLES_PER_PLAYER = 25
+MODES = ["brawlBall", "gemGrab", "knockout", "heist", "bounty"]
+BRAWLERS = ["SHELLY", "COLT", "BULL", "BROCK", "RICO", "SPIKE", "CROW"]
+
+
+def _player(tag: str, rng: random.Random) -> dict:
+    return {
+        "tag": tag,
+        "name": f"player-{tag}",
+        "brawler": {
+            "id": rng.randint(16000000, 16000080),
+            "name": rng.choice(BRAWLERS),
+            "power": rng.randint(1, 11),
+            "trophies": rng.randint(0, 1000),
+        },
+    }
+
+
+def generate_battlelogs(n_battles: int, seed: int = 42) -> list[tuple[str, dict]]:
+    """Generate validated 3v3 battlelogs, 25 battles per player."""
+    rng = random.Random(seed)
+    payloads = []
+    n_players = max(1, n_battles // BATTLES_PER_PLAYER)
+    for i in range(n_players):
+        player_tag = f"#P{i:07d}"
+        items = []
+        for j in range(min(BATTLES_PER_PLAYER, n_battles - i * BATTLES_PER_PLAYER)):
+            teams = [
+                [_player(f"#T{i}{j}{k}", rng) for k in range(3)],
+                [_player(f"#O{i}{j}{k}", rng) for k in range(3)],
+            ]
+            teams[rng.randint(0, 1)][rng.randint(0, 2)] = _player(player_tag, rng)
+            mode = rng.choice(MODES)
+            items.append(
+                {
+                    "battleTime": f"20250711T16{j:02d}54.000Z",
+                    "event": {"id": 15000000 + j, "mode": mode, "map": "Center Stage"},
+                    "battle": {
+                        "mode": mode,
+                        "type": "ranked",
+                        "result": rng.choice(["victory", "defeat", "draw"]),
+                        "duration": rng.randint(60, 180),
+                        "starPlayer": rng.choice(teams[0]),
+                        "teams": teams,
+                    },
+                }
+            )
+        payload = BattlelogData.model_validate({"items": items}).model_dump()
+        payloads.append((player_tag, payload))
+    return payloads
+
+
+def _timed(label: str, func) -> tuple[pl.DataFrame, float]:
+    start = time.perf_counter()
+    df = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.3f}s")
+    return df, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--battles", type=int, default=100_000)
+    args = parser.parse_args()
+
+    payloads = generate_battlelogs(args.battles)
+    print(f"Flattening {args.battles} battles from {len(payloads)} battlelogs\n")
+
+    pydantic_df, pydantic_s = _timed(
+        "Pydantic models (validate=True)",
+        lambda: pl.concat(
+            [flatten_battlelog_data(data, tag) for tag, data in payloads]
+        ),
+    )
+    rows_df, rows_s = _timed(
+        "Plain rows (validate=False)",
+        lambda: pl.concat(
+            [
+                flatten_battlelog_data(data, tag, validate=False)
+                for tag, data in payloads
+            ]
+        ),
+    )
+    columnar_df, columnar_s = _timed(
+        "Columnar Polars (flatten_battlelogs)", lambda: flatten_battlelogs(payloads)
+    )
+
+    for df in (rows_df, columnar_df):
+        assert df.schema == pydantic_df.schema
+        assert df.drop("extracted_at").equals(pydantic_df.drop("extracted_at"))
+    print(
+        f"\nColumnar speedup: {pydantic_s / columnar_s:.1f}x vs Pydantic, "
+        f"{rows_s / columnar_s:.1f}x vs plain rows (outputs identical)"
+    )
+
+
+if __name__ == "__main__":
+    main()
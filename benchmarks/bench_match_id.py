@@ -0,0 +1,73 @@
+"""
+Benchmark match_id generation: per-row map_elements vs native Polars expressions.
+
+Usage:
+    PYTHONPATH=src uv run python benchmarks/bench_match_id.py --rows 1000000
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+import polars as pl
+
+from brawlstar_project.processing.cleaned import FactMatchesProcessor, match_id_expr
+
+MAPS = ["Center Stage", "Hard Rock Mine", "Snake-Prairie", "Pinball Dreams"]
+
+
+def generate_battles(n_rows: int) -> pl.DataFrame:
+    """Generate processed battlelog rows with a Datetime battle_time."""
+    start = datetime(2025, 7, 1)
+    return pl.DataFrame(
+        {
+            "player_tag": [f"#P{i % 50_000:07d}" for i in range(n_rows)],
+            "battle_time": [start + timedelta(minutes=i) for i in range(n_rows)],
+            "map_name": [MAPS[i % len(MAPS)] for i in range(n_rows)],
+        }
+    )
+
+
+def _timed(label: str, func) -> tuple[pl.Series, float]:
+    start = time.perf_counter()
+    series = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.3f}s")
+    return series, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = generate_battles(args.rows)
+    processor = FactMatchesProcessor()
+    print(f"Generating match_id for {args.rows} rows\n")
+
+    python_ids, python_s = _timed(
+        "map_elements(generate_match_id)",
+        lambda: df.select(
+            pl.struct(["player_tag", "battle_time", "map_name"])
+            .map_elements(
+                lambda x: processor.generate_match_id(
+                    x["player_tag"], x["battle_time"], x["map_name"]
+                ),
+                return_dtype=pl.String,
+            )
+            .alias("match_id")
+        )["match_id"],
+    )
+    native_ids, native_s = _timed(
+        "match_id_expr",
+        lambda: df.select(match_id_expr(df.schema["battle_time"]).alias("match_id"))[
+            "match_id"
+        ],
+    )
+
+    assert native_ids.equals(python_ids)
+    print(f"\nNative speedup: {python_s / native_s:.1f}x (outputs identical)")
+
+
+if __name__ == "__main__":
+    main()
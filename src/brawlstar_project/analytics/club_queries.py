@@ -1,11 +1,38 @@
 import duckdb
 
+from brawlstar_project.analytics.duckdb_utils import parquet_columns, parquet_source
+
+
+def _club_battles(path) -> str:
+    """
+    One row per (club, battle), as a SQL subquery over fact_matches.
+
+    Club members playing the same battle each log it, so fact_matches holds
+    it once per member: club aggregates count battles, not rows. Rows built
+    before ``battle_id`` existed, and tables written without the column,
+    fall back to a per-player key. When members played on opposing teams,
+    the result is taken from the member with the smallest player tag.
+    """
+    player_key = "player_tag || '|' || CAST(battle_time AS VARCHAR)"
+    if "battle_id" in parquet_columns(path):
+        battle_key = f"COALESCE(battle_id, {player_key})"
+    else:
+        battle_key = player_key
+    return f"""(
+        SELECT club_tag,
+               {battle_key} AS battle_key,
+               MIN(battle_time) AS battle_time,
+               ARG_MIN(battle_result, player_tag) AS battle_result
+        FROM {parquet_source(path)}
+        GROUP BY club_tag, battle_key
+    )"""
+
 
 def get_club_winrate(path, club_tag: str):
     query = f"""
         SELECT club_tag, COUNT(*) AS total_games,
                SUM(CASE WHEN battle_result = 'victory' THEN 1 ELSE 0 END) AS wins
-        FROM read_parquet('{path}')
+        FROM {_club_battles(path)}
         WHERE club_tag = '{club_tag}'
         GROUP BY club_tag
     """
@@ -22,7 +49,7 @@ def get_club_winrate_last_day(path, club_tag: str):
         SELECT
             SUM(CASE WHEN battle_result = 'victory' THEN 1 ELSE 0 END) * 1.0 / COUNT(*) AS winrate,
             COUNT(*) AS games_played
-        FROM read_parquet('{path}')
+        FROM {_club_battles(path)}
         WHERE club_tag = '{club_tag}' AND battle_time::DATE = CURRENT_DATE
     """
     con = duckdb.connect()
@@ -39,7 +66,7 @@ def get_club_winloss_by_day(path, club_tag: str):
             battle_time::DATE AS day,
             SUM(CASE WHEN battle_result = 'victory' THEN 1 ELSE 0 END) AS wins,
             SUM(CASE WHEN battle_result = 'defeat' THEN 1 ELSE 0 END) AS losses
-        FROM read_parquet('{path}')
+        FROM {_club_battles(path)}
         WHERE club_tag = '{club_tag}'
         GROUP BY day
         ORDER BY day
@@ -57,7 +84,7 @@ def get_club_comparison_by_winrate(path):
         SELECT club_tag,
                COUNT(*) AS games_played,
                SUM(CASE WHEN battle_result = 'victory' THEN 1 ELSE 0 END) * 1.0 / COUNT(*) AS winrate
-        FROM read_parquet('{path}')
+        FROM {_club_battles(path)}
         WHERE club_tag IS NOT NULL
         GROUP BY club_tag
         ORDER BY winrate DESC
@@ -73,7 +100,7 @@ def get_club_comparison_by_winrate(path):
 def get_club_member_participation(path, club_tag: str):
     query = f"""
         SELECT player_tag, COUNT(*) AS games_played
-        FROM read_parquet('{path}')
+        FROM {parquet_source(path)}
         WHERE club_tag = '{club_tag}'
         GROUP BY player_tag
         ORDER BY games_played DESC
@@ -90,7 +117,7 @@ def get_club_member_participation(path, club_tag: str):
 def get_club_activity_over_time(path, club_tag: str):
     query = f"""
         SELECT battle_time::DATE AS day, COUNT(*) AS games_played
-        FROM read_parquet('{path}')
+        FROM {_club_battles(path)}
         WHERE club_tag = '{club_tag}'
         GROUP BY day
         ORDER BY day
@@ -110,7 +137,7 @@ def get_club_winrate_last_n(path, club_tag: str, n: int = 100):
             COUNT(*) AS games_played
         FROM (
             SELECT battle_result
-            FROM read_parquet('{path}')
+            FROM {_club_battles(path)}
             WHERE club_tag = '{club_tag}'
             ORDER BY battle_time DESC
             LIMIT {n}
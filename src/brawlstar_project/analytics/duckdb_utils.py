@@ -1,10 +1,51 @@
 from functools import wraps
+from pathlib import Path
 
 import duckdb
 
 from brawlstar_project.constants.paths import get_data_root
 
 
+def parquet_source(path) -> str:
+    """
+    DuckDB table function reading a Parquet table, as a SQL fragment.
+
+    Incremental gold tables (e.g. fact_matches.parquet) are hive-partitioned
+    directories: their part files are globbed and the partition columns
+    restored from the path. Plain Parquet files are read as-is.
+
+    Args:
+        path: Parquet file or hive-partitioned directory
+
+    Returns:
+        ``read_parquet(...)`` expression to use in a FROM clause
+    """
+    if Path(path).is_dir():
+        return (
+            f"read_parquet('{path}/**/*.parquet', "
+            f"hive_partitioning = true, union_by_name = true)"
+        )
+    return f"read_parquet('{path}')"
+
+
+def parquet_columns(path) -> set[str]:
+    """
+    Column names of a Parquet table, read from its metadata.
+
+    Args:
+        path: Parquet file or hive-partitioned directory
+
+    Returns:
+        Names of the columns ``parquet_source(path)`` exposes
+    """
+    con = duckdb.connect()
+    try:
+        rows = con.execute(f"DESCRIBE SELECT * FROM {parquet_source(path)}").fetchall()
+    finally:
+        con.close()
+    return {row[0] for row in rows}
+
+
 def duckdb_query(func):
     """
     Decorator to handle DuckDB connection management. The decorated function should accept a DuckDB connection as its first argument and return the result (usually a DataFrame).
@@ -1,10 +1,12 @@
 import duckdb
 
+from brawlstar_project.analytics.duckdb_utils import parquet_source
+
 
 def get_most_popular_map(path):
     query = f"""
         SELECT map_name, COUNT(*) AS games_played
-        FROM read_parquet('{path}')
+        FROM {parquet_source(path)}
         GROUP BY map_name
         ORDER BY games_played DESC
         LIMIT 1
@@ -20,7 +22,7 @@ def get_most_popular_map(path):
 def get_game_mode_distribution(path):
     query = f"""
         SELECT battle_mode, COUNT(*) AS games_played
-        FROM read_parquet('{path}')
+        FROM {parquet_source(path)}
         GROUP BY battle_mode
         ORDER BY games_played DESC
     """
@@ -37,7 +39,7 @@ def get_winrate_by_game_mode(path):
         SELECT battle_mode,
                COUNT(*) AS games_played,
                SUM(CASE WHEN battle_result = 'victory' THEN 1 ELSE 0 END) * 1.0 / COUNT(*) AS winrate
-        FROM read_parquet('{path}')
+        FROM {parquet_source(path)}
         GROUP BY battle_mode
         ORDER BY games_played DESC
     """
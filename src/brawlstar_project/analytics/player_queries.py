@@ -1,12 +1,13 @@
 import duckdb
 
+from brawlstar_project.analytics.duckdb_utils import parquet_source
 from brawlstar_project.constants.paths import get_data_root
 
 
 def get_player_matches(path, player_tag: str, n_matches: int = 25):
     query = f"""
         SELECT *
-        FROM read_parquet('{path}')
+        FROM {parquet_source(path)}
         WHERE player_tag = '{player_tag}'
         ORDER BY battle_time DESC
         LIMIT {n_matches}
@@ -26,7 +27,7 @@ def get_player_winrate_last_n(path, player_tag: str, n: int = 25):
             COUNT(*) AS games_played
         FROM (
             SELECT battle_result
-            FROM read_parquet('{path}')
+            FROM {parquet_source(path)}
             WHERE player_tag = '{player_tag}'
             ORDER BY battle_time DESC
             LIMIT {n}
@@ -45,7 +46,7 @@ def get_player_vs_club_winrate(path, player_tag: str, n: int = 25):
     path = data_root / "fact_matches.parquet"
     # Get player's club
     club_query = f"""
-        SELECT club_tag FROM read_parquet('{path}') WHERE player_tag = '{player_tag}' AND club_tag IS NOT NULL LIMIT 1
+        SELECT club_tag FROM {parquet_source(path)} WHERE player_tag = '{player_tag}' AND club_tag IS NOT NULL LIMIT 1
     """
     con = duckdb.connect()
     try:
@@ -60,7 +61,7 @@ def get_player_vs_club_winrate(path, player_tag: str, n: int = 25):
         SELECT SUM(CASE WHEN battle_result = 'victory' THEN 1 ELSE 0 END) * 1.0 / COUNT(*) AS winrate
         FROM (
             SELECT battle_result
-            FROM read_parquet('{path}')
+            FROM {parquet_source(path)}
             WHERE player_tag = '{player_tag}'
             ORDER BY battle_time DESC
             LIMIT {n}
@@ -77,7 +78,7 @@ def get_player_vs_club_winrate(path, player_tag: str, n: int = 25):
     # Club winrate (all games for this club)
     club_query = f"""
         SELECT SUM(CASE WHEN battle_result = 'victory' THEN 1 ELSE 0 END) * 1.0 / COUNT(*) AS winrate
-        FROM read_parquet('{path}')
+        FROM {parquet_source(path)}
         WHERE club_tag = '{club_tag}'
     """
     con = duckdb.connect()
@@ -100,7 +101,7 @@ def get_player_winrate_by_map(path, player_tag: str):
         SELECT map_name,
                COUNT(*) AS games_played,
                SUM(CASE WHEN battle_result = 'victory' THEN 1 ELSE 0 END) * 1.0 / COUNT(*) AS winrate
-        FROM read_parquet('{path}')
+        FROM {parquet_source(path)}
         WHERE player_tag = '{player_tag}'
         GROUP BY map_name
         ORDER BY games_played DESC
@@ -120,7 +121,7 @@ def get_player_winrate_by_mode(path, player_tag: str, n: int = 25):
                SUM(CASE WHEN battle_result = 'victory' THEN 1 ELSE 0 END) * 1.0 / COUNT(*) AS winrate
         FROM (
             SELECT battle_mode, battle_result
-            FROM read_parquet('{path}')
+            FROM {parquet_source(path)}
             WHERE player_tag = '{player_tag}'
             ORDER BY battle_time DESC
             LIMIT {n}
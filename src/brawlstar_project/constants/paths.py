@@ -29,6 +29,8 @@ DATA_INGESTED_DIR = PROJECT_ROOT / "data" / "ingested"
 DATA_RAW_DIR = PROJECT_ROOT / "data" / "raw"
 DATA_PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
 DATA_CLEANED_DIR = PROJECT_ROOT / "data" / "cleaned"
+DATA_CACHE_DIR = PROJECT_ROOT / "data" / "cache"
+DATA_JOURNAL_DIR = PROJECT_ROOT / "data" / "journal"
 
 
 def get_data_root() -> Path:
@@ -1,5 +1,6 @@
 import re
 from pathlib import Path
+from typing import Optional
 
 import polars as pl
 
@@ -13,15 +14,43 @@ class Club(TagEntity):
                 "Club tag must contain only uppercase letters A-Z and digits 0-9"
             )
 
-    def load_club_data(self, base_dir: Path, days: int = 1) -> pl.DataFrame:
-        return self._load_past_days_data(base_dir, "club.parquet", days)
+    def load_club_data(
+        self,
+        base_dir: Path,
+        days: int = 1,
+        columns: Optional[list[str]] = None,
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """
+        Load this entity's club profiles over the last ``days`` days.
+
+        Args:
+            base_dir: Raw data directory
+            days: Number of days back from today, today included
+            columns: Columns to load (all when None)
+            lazy: Return a LazyFrame instead of a collected DataFrame
+        """
+        return self._load_past_days_data(
+            base_dir, "club.parquet", days, columns=columns, lazy=lazy
+        )
 
-    def load_club_members_data(self, base_dir: Path, days: int = 1) -> pl.DataFrame:
+    def load_club_members_data(
+        self,
+        base_dir: Path,
+        days: int = 1,
+        columns: Optional[list[str]] = None,
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
         """
         Load club members data (all members of the club, no filtering by tag).
         """
         return self._load_past_days_data(
-            base_dir, "club_members.parquet", days, filter_by_tag=False
+            base_dir,
+            "club_members.parquet",
+            days,
+            filter_by_tag=False,
+            columns=columns,
+            lazy=lazy,
         )
 
     @staticmethod
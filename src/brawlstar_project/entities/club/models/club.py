@@ -25,12 +25,16 @@ class ClubData(BaseModel):
     members: list[ClubMember] = Field(description="List of club members")
 
 
-def create_flattened_club_data(club_data: dict) -> "FlattenedClubData":
+def create_flattened_club_data(
+    club_data: dict, validate: bool = True
+) -> "FlattenedClubData":
     """
     Create flattened club data from raw API response.
 
     Args:
         club_data: Raw club data from Brawl Stars API
+        validate: Validate the output with Pydantic. Pass False for data
+            already validated at ingest (as saved by the ingested stage)
 
     Returns:
         Flattened club data model
@@ -46,6 +50,13 @@ def create_flattened_club_data(club_data: dict) -> "FlattenedClubData":
         "extracted_at": extracted_at,
     }
 
+    if not validate:
+        return FlattenedClubData.model_construct(
+            **{
+                name: flattened_data.get(name)
+                for name in FlattenedClubData.model_fields
+            }
+        )
     return FlattenedClubData.model_validate(flattened_data)
 
 
@@ -32,13 +32,16 @@ class ClubMembersData(BaseModel):
 
 
 def create_flattened_club_members_data(
-    members_data: dict,
+    members_data: dict, validate: bool = True
 ) -> "FlattenedClubMembersData":
     """
     Create flattened club members data from raw API response.
 
     Args:
-        members_data: Raw club members data from Brawl Stars API
+        members_data: Raw club members data from Brawl Stars API, or a
+            ClubMembersData dump when ``validate`` is False
+        validate: Validate input and output with Pydantic. Pass False for data
+            already validated at ingest (as saved by the ingested stage)
 
     Returns:
         Flattened club members data model
@@ -46,23 +49,33 @@ def create_flattened_club_members_data(
     # Compute missing fields
     extracted_at = datetime.now().isoformat()
 
-    # First validate the raw data to get proper ClubMember objects
-    club_members_data = ClubMembersData.model_validate(members_data)
+    if validate:
+        # First validate the raw data to get proper ClubMember objects
+        members_data = ClubMembersData.model_validate(members_data).model_dump()
 
     # Flatten each member's icon data
     flattened_items = []
-    for member in club_members_data.items:
+    for member in members_data.get("items") or []:
         flattened_member = {
-            "tag": member.tag,
-            "name": member.name,
-            "name_color": member.name_color,
-            "role": member.role,
-            "trophies": member.trophies,
-            "icon_id": member.icon.id,
+            "tag": member["tag"],
+            "name": member["name"],
+            "name_color": member.get("name_color"),
+            "role": member["role"],
+            "trophies": member["trophies"],
+            "icon_id": member["icon"]["id"],
             "extracted_at": extracted_at,
         }
         flattened_items.append(flattened_member)
 
+    if not validate:
+        return FlattenedClubMembersData.model_construct(
+            items=[
+                FlattenedClubMember.model_construct(**member)
+                for member in flattened_items
+            ],
+            extracted_at=extracted_at,
+        )
+
     # Create data with computed fields
     flattened_data = {
         "items": flattened_items,
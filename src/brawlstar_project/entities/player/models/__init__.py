@@ -8,6 +8,7 @@ from .battlelog import (
     FlattenedBattleData,
     StarPlayer,
     create_flattened_battle_data,
+    create_flattened_battle_rows,
 )
 from .player import (
     Brawler,
@@ -26,6 +27,7 @@ __all__ = [
     "BattlelogData",
     "FlattenedBattleData",
     "create_flattened_battle_data",
+    "create_flattened_battle_rows",
     "Battle",
     "BattleDetails",
     "BattleEvent",
@@ -112,6 +112,11 @@ class FlattenedBattleData(BaseModel):
     is_star_player: bool = Field(
         alias="isStarPlayer", description="Whether player was star player"
     )
+    participant_tags: str = Field(
+        default="",
+        alias="participantTags",
+        description="Sorted, comma-separated tags of every player in the battle",
+    )
 
     # Timestamp
     extracted_at: datetime = Field(description="Data extraction timestamp")
@@ -121,82 +126,114 @@ class FlattenedBattleData(BaseModel):
     )
 
 
+def participant_tags(details: dict, player_tag: str) -> str:
+    """
+    Canonical participant list of a battle: the same for every player in it.
+
+    Args:
+        details: Battle details dump (teams, or players in solo modes)
+        player_tag: Tag of the battlelog owner, always a participant
+
+    Returns:
+        Sorted, comma-separated unique player tags
+    """
+    tags = {player_tag}
+    for team in details.get("teams") or []:
+        tags.update(player["tag"] for player in team)
+    tags.update(player["tag"] for player in details.get("players") or [])
+    return ",".join(sorted(tags))
+
+
+def _flatten_battle(battle: dict, player_tag: str, extracted_at: datetime) -> dict:
+    """Flatten one Battle dump into FlattenedBattleData field names."""
+    details = battle["battle"]
+    event = battle["event"]
+
+    # Find the player in the battle and extract team information
+    player_battle_info = None
+    team_size = 0
+    opponent_count = 0
+
+    teams = details.get("teams") or []
+    if teams:
+        for team in teams:
+            team_size = len(team)
+            for player in team:
+                if player["tag"] == player_tag:
+                    player_battle_info = player
+                    break
+            if player_battle_info:
+                break
+        opponent_count = sum(len(team) for team in teams) - team_size
+
+    # Check if player was star player
+    star_player = details.get("starPlayer")
+    is_star_player = bool(star_player and star_player["tag"] == player_tag)
+
+    # Extract brawler information
+    brawler = player_battle_info["brawler"] if player_battle_info else None
+
+    return {
+        "battle_time": battle["battleTime"],
+        "event_mode": event.get("mode") or "unknown",
+        "event_map": event.get("map") or "unknown",
+        "battle_mode": details["mode"],
+        "battle_type": details["type"],
+        "battle_result": details.get("result") or "unknown",
+        "battle_duration": details.get("duration") or 0,
+        "player_tag": player_tag,
+        "player_name": player_battle_info["name"] if player_battle_info else "",
+        "brawler_name": brawler["name"] if brawler else "",
+        "brawler_power": brawler["power"] if brawler else 0,
+        "brawler_trophies": brawler["trophies"] if brawler else 0,
+        "team_size": team_size,
+        "opponent_count": opponent_count,
+        "is_star_player": is_star_player,
+        "participant_tags": participant_tags(details, player_tag),
+        "extracted_at": extracted_at,
+    }
+
+
 def create_flattened_battle_data(
-    raw_data: dict, player_tag: str
+    raw_data: dict, player_tag: str, validate: bool = True
 ) -> List[FlattenedBattleData]:
     """
     Create flattened battle data from raw API response.
 
     Args:
-        raw_data: Raw battlelog data from Brawl Stars API
+        raw_data: Raw battlelog data from Brawl Stars API, or a BattlelogData
+            dump when ``validate`` is False
         player_tag: Player tag for reference
+        validate: Validate input and output with Pydantic. Pass False for data
+            already validated at ingest (as saved by the ingested stage)
 
     Returns:
         List of FlattenedBattleData instances
     """
-    # Parse raw data with BattlelogData model for validation
-    battlelog_data = BattlelogData.model_validate(raw_data)
-
-    flattened_battles = []
-
-    for battle in battlelog_data.items:
-        # Find the player in the battle
-        player_battle_info = None
-        team_size = 0
-        opponent_count = 0
-        is_star_player = False
-
-        # Extract team information
-        team_size = 0
-        opponent_count = 0
-        player_battle_info = None
-
-        teams = battle.battle.teams or []
-        if teams:
-            for team in teams:
-                team_size = len(team)
-                for player in team:
-                    if player.tag == player_tag:
-                        player_battle_info = player
-                        break
-                if player_battle_info:
-                    break
-            opponent_count = sum(len(team) for team in teams) - team_size
-
-        # Check if player was star player
-        if battle.battle.starPlayer and battle.battle.starPlayer.tag == player_tag:
-            is_star_player = True
-
-        # Extract brawler information
-        brawler_name = ""
-        brawler_power = 0
-        brawler_trophies = 0
-
-        if player_battle_info:
-            brawler_name = player_battle_info.brawler.name
-            brawler_power = player_battle_info.brawler.power
-            brawler_trophies = player_battle_info.brawler.trophies
-
-        # Create flattened battle data
-        flattened_dict = {
-            "battleTime": battle.battleTime,
-            "eventMode": battle.event.mode or "unknown",
-            "eventMap": battle.event.map or "unknown",
-            "battleMode": battle.battle.mode,
-            "battleType": battle.battle.type,
-            "battleResult": battle.battle.result or "unknown",
-            "battleDuration": battle.battle.duration or 0,
-            "playerTag": player_tag,
-            "playerName": player_battle_info.name if player_battle_info else "",
-            "brawlerName": brawler_name,
-            "brawlerPower": brawler_power,
-            "brawlerTrophies": brawler_trophies,
-            "teamSize": team_size,
-            "opponentCount": opponent_count,
-            "isStarPlayer": is_star_player,
-            "extracted_at": datetime.now(),
-        }
-
-        flattened_battles.append(FlattenedBattleData.model_validate(flattened_dict))
-
-    return flattened_battles
+    if validate:
+        # Parse raw data with BattlelogData model for validation
+        raw_data = BattlelogData.model_validate(raw_data).model_dump()
+
+    flattened = create_flattened_battle_rows(raw_data, player_tag)
+
+    if not validate:
+        return [FlattenedBattleData.model_construct(**battle) for battle in flattened]
+    return [FlattenedBattleData.model_validate(battle) for battle in flattened]
+
+
+def create_flattened_battle_rows(battlelog_data: dict, player_tag: str) -> List[dict]:
+    """
+    Flatten already validated battlelog data without building any model.
+
+    Args:
+        battlelog_data: BattlelogData dump, as saved by the ingested stage
+        player_tag: Player tag for reference
+
+    Returns:
+        One dict per battle, keyed and ordered like FlattenedBattleData.model_dump()
+    """
+    extracted_at = datetime.now()
+    return [
+        _flatten_battle(battle, player_tag, extracted_at)
+        for battle in battlelog_data.get("items") or []
+    ]
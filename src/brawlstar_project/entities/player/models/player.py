@@ -35,7 +35,9 @@ class Brawler(BaseModel):
 class PlayerData(BaseModel):
     """Model for complete player data from Brawl Stars API."""
 
-    model_config = ConfigDict(extra="allow")  # Allow extra fields from API
+    # Allow extra fields from API; populate_by_name lets a saved model_dump()
+    # (field names instead of API aliases) validate to the same data
+    model_config = ConfigDict(extra="allow", populate_by_name=True)
 
     # Basic player info
     tag: str = Field(description="Player tag")
@@ -120,44 +122,53 @@ class FlattenedPlayerData(BaseModel):
     )
 
 
-def create_flattened_player_data(raw_data: dict) -> FlattenedPlayerData:
+def create_flattened_player_data(
+    raw_data: dict, validate: bool = True
+) -> FlattenedPlayerData:
     """
     Create flattened player data from raw API response.
 
     Args:
-        raw_data: Raw player data from Brawl Stars API
+        raw_data: Raw player data from Brawl Stars API, or a PlayerData dump
+            when ``validate`` is False
+        validate: Validate input and output with Pydantic. Pass False for data
+            already validated at ingest (as saved by the ingested stage)
 
     Returns:
         FlattenedPlayerData instance with validated data
     """
-    # Parse raw data with PlayerData model for validation
-    player_data = PlayerData.model_validate(raw_data)
+    if validate:
+        # Parse raw data with PlayerData model for validation
+        player_data = PlayerData.model_validate(raw_data).model_dump()
+    else:
+        player_data = raw_data
 
     # Calculate derived fields
-    total_brawlers = len(player_data.brawlers)
-    maxed_brawlers = sum(1 for b in player_data.brawlers if b.power == 11)
-    total_brawler_trophies = sum(b.trophies for b in player_data.brawlers)
+    brawlers = player_data.get("brawlers") or []
+    club = player_data.get("club")
 
     # Create flattened data
     flattened_dict = {
-        "tag": player_data.tag,
-        "name": player_data.name,
-        "nameColor": player_data.nameColor or "",
-        "trophies": player_data.trophies,
-        "highestTrophies": player_data.highestTrophies,
-        "expLevel": player_data.expLevel,
-        "expPoints": player_data.expPoints,
-        "3vs3Victories": player_data.three_vs_three_victories or 0,
-        "soloVictories": player_data.solo_victories or 0,
-        "duoVictories": player_data.duo_victories or 0,
-        "bestRoboRumbleTime": player_data.best_robo_rumble_time or 0,
-        "bestTimeAsBigBrawler": player_data.best_time_as_big_brawler or 0,
-        "club_name": player_data.club.name if player_data.club else "",
-        "club_tag": player_data.club.tag if player_data.club else "",
-        "total_brawlers": total_brawlers,
-        "maxed_brawlers": maxed_brawlers,
-        "total_brawler_trophies": total_brawler_trophies,
+        "tag": player_data["tag"],
+        "name": player_data["name"],
+        "name_color": player_data.get("nameColor") or "",
+        "trophies": player_data["trophies"],
+        "highest_trophies": player_data["highestTrophies"],
+        "exp_level": player_data["expLevel"],
+        "exp_points": player_data["expPoints"],
+        "three_vs_three_victories": player_data.get("three_vs_three_victories") or 0,
+        "solo_victories": player_data.get("solo_victories") or 0,
+        "duo_victories": player_data.get("duo_victories") or 0,
+        "best_robo_rumble_time": player_data.get("best_robo_rumble_time") or 0,
+        "best_time_as_big_brawler": player_data.get("best_time_as_big_brawler") or 0,
+        "club_name": club["name"] if club else "",
+        "club_tag": club["tag"] if club else "",
+        "total_brawlers": len(brawlers),
+        "maxed_brawlers": sum(1 for b in brawlers if b["power"] == 11),
+        "total_brawler_trophies": sum(b["trophies"] for b in brawlers),
         "extracted_at": datetime.now(),
     }
 
+    if not validate:
+        return FlattenedPlayerData.model_construct(**flattened_dict)
     return FlattenedPlayerData.model_validate(flattened_dict)
@@ -1,5 +1,6 @@
 import re
 from pathlib import Path
+from typing import Optional
 
 import polars as pl
 
@@ -15,11 +16,45 @@ class Player(TagEntity):
                 "Player tag must contain only uppercase letters A-Z and digits 0-9"
             )
 
-    def load_player_data(self, base_dir: Path, days: int = 1) -> pl.DataFrame:
-        return self._load_past_days_data(base_dir, "player.parquet", days)
+    def load_player_data(
+        self,
+        base_dir: Path,
+        days: int = 1,
+        columns: Optional[list[str]] = None,
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """
+        Load this entity's player profiles over the last ``days`` days.
+
+        Args:
+            base_dir: Raw data directory
+            days: Number of days back from today, today included
+            columns: Columns to load (all when None)
+            lazy: Return a LazyFrame instead of a collected DataFrame
+        """
+        return self._load_past_days_data(
+            base_dir, "player.parquet", days, columns=columns, lazy=lazy
+        )
 
-    def load_battlelog_data(self, base_dir: Path, days: int = 1) -> pl.DataFrame:
-        return self._load_past_days_data(base_dir, "battlelog.parquet", days)
+    def load_battlelog_data(
+        self,
+        base_dir: Path,
+        days: int = 1,
+        columns: Optional[list[str]] = None,
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """
+        Load this entity's battles over the last ``days`` days.
+
+        Args:
+            base_dir: Raw data directory
+            days: Number of days back from today, today included
+            columns: Columns to load (all when None)
+            lazy: Return a LazyFrame instead of a collected DataFrame
+        """
+        return self._load_past_days_data(
+            base_dir, "battlelog.parquet", days, columns=columns, lazy=lazy
+        )
 
     @staticmethod
     def process_player_df(df: pl.DataFrame) -> pl.DataFrame:
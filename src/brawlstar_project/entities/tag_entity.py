@@ -3,14 +3,25 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, Optional
 
 import polars as pl
 
+from brawlstar_project.processing.utils.dataset import dataset_path, scan_dataset
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s %(levelname)s [%(name)s] %(message)s"
 )
 
+# Column holding the entity's tag in each daily file; club member rows carry
+# only the member's tag, so they cannot be filtered by club
+TAG_COLUMNS = {
+    "player.parquet": "tag",
+    "battlelog.parquet": "player_tag",
+    "club.parquet": "tag",
+    "club_members.parquet": None,
+}
+
 
 @dataclass
 class TagEntity(ABC):
@@ -40,58 +51,82 @@ class TagEntity(ABC):
 
     @staticmethod
     def _build_parquet_path(base_dir: Path, filename: str, date_str: str) -> Path:
-        # Determine data type from filename
-        if filename in ["player.parquet", "battlelog.parquet"]:
-            data_type = "player"
-        elif filename in ["club.parquet", "club_members.parquet"]:
-            data_type = "club"
-        else:
-            raise ValueError(f"Unknown filename: {filename}")
-
-        return base_dir / data_type / date_str / filename
-
-    @staticmethod
-    def _read_parquet(path: Path) -> pl.DataFrame:
-        return pl.read_parquet(path)
-
-    def _filter_or_annotate(self, df: pl.DataFrame) -> pl.DataFrame:
-        if "tag" in df.columns:
-            return df.filter(pl.col("tag") == self.tag)
-        else:
-            return df.with_columns(pl.lit(self.tag).alias("entity_tag"))
-
-    @staticmethod
-    def _add_date_column(df: pl.DataFrame, date_str: str) -> pl.DataFrame:
-        return df.with_columns(pl.lit(date_str).alias("date"))
-
-    def _load_single_day(
-        self, base_dir: Path, filename: str, date_str: str, filter_by_tag: bool = True
-    ) -> pl.DataFrame | None:
-        parquet_path = self._build_parquet_path(base_dir, filename, date_str)
-
-        if not parquet_path.exists():
-            logging.warning(f"No file found for date {date_str}: {parquet_path}")
+        return dataset_path(base_dir, filename, date_str)
+
+    def _scan_past_days(
+        self,
+        base_dir: Path,
+        filename: str,
+        days: int,
+        filter_by_tag: bool = True,
+        columns: Optional[list[str]] = None,
+    ) -> pl.LazyFrame | None:
+        """
+        Build one lazy scan of a daily file over the last ``days`` days.
+
+        Partitions outside the range are pruned from their ``date=`` directory
+        names, and the tag filter and column selection are pushed down into
+        the Parquet reader, so only matching row groups and requested columns
+        are read.
+
+        Args:
+            base_dir: Raw data directory
+            filename: Daily Parquet file name (e.g. "battlelog.parquet")
+            days: Number of days back from today, today included
+            filter_by_tag: Keep only the rows of this entity
+            columns: Columns to load (all when None); "date" is always added
+
+        Returns:
+            LazyFrame with a "date" column, newest day first, or None if no
+            partition falls in the range
+        """
+        dates = list(self._date_range(days))
+        if not dates:
+            return None
+        lf = scan_dataset(base_dir, filename, start=dates[-1], end=dates[0])
+        if lf is None:
+            logging.warning(
+                f"No {filename} found from {dates[-1]} to {dates[0]} in {base_dir}"
+            )
             return None
-
-        df = self._read_parquet(parquet_path)
 
         if filter_by_tag:
-            df = self._filter_or_annotate(df)
-
-        df = self._add_date_column(df, date_str)
-        return df
+            tag_column = TAG_COLUMNS[filename]
+            if tag_column is not None:
+                lf = lf.filter(pl.col(tag_column) == self.tag)
+            if tag_column != "tag":
+                lf = lf.with_columns(pl.lit(self.tag).alias("entity_tag"))
+        if columns is not None:
+            lf = lf.select(*columns, "date")
+        return lf.select(pl.exclude("date"), "date").sort(
+            "date", descending=True, maintain_order=True
+        )
 
     def _load_past_days_data(
-        self, base_dir: Path, filename: str, days: int, filter_by_tag: bool = True
-    ) -> pl.DataFrame:
-        dfs = []
-        for date_str in self._date_range(days):
-            df = self._load_single_day(base_dir, filename, date_str, filter_by_tag)
-            if df is not None and df.height > 0:
-                dfs.append(df)
-
-        if dfs:
-            return pl.concat(dfs)
-        else:
+        self,
+        base_dir: Path,
+        filename: str,
+        days: int,
+        filter_by_tag: bool = True,
+        columns: Optional[list[str]] = None,
+        lazy: bool = False,
+    ) -> pl.DataFrame | pl.LazyFrame:
+        """
+        Load the last ``days`` days of a daily file for this entity.
+
+        Args:
+            base_dir: Raw data directory
+            filename: Daily Parquet file name
+            days: Number of days back from today, today included
+            filter_by_tag: Keep only the rows of this entity
+            columns: Columns to load (all when None)
+            lazy: Return the LazyFrame instead of collecting it
+
+        Returns:
+            DataFrame, or LazyFrame if ``lazy``; empty if no file exists
+        """
+        lf = self._scan_past_days(base_dir, filename, days, filter_by_tag, columns)
+        if lf is None:
             logging.info("No data found for the given period.")
-            return pl.DataFrame()
+            return pl.LazyFrame() if lazy else pl.DataFrame()
+        return lf if lazy else lf.collect()
@@ -1,17 +1,41 @@
+from .base_dimension_processor import BaseDimensionProcessor, EagerDimensionProcessor
+from .build_context import GoldBuildContext
+from .dag import DagTask, TaskResult, raise_on_failure, run_dag
+from .dim_battles import DimBattlesProcessor, process_dim_battles
 from .dim_clubs import DimClubsProcessor, process_dim_clubs
 from .dim_game_modes import DimGameModesProcessor, process_dim_game_modes
 from .dim_maps import DimMapsProcessor, process_dim_maps
 from .dim_players import DimPlayersProcessor, process_dim_players
-from .fact_matches import FactMatchesProcessor, process_fact_matches
+from .fact_matches import (
+    FactMatchesProcessor,
+    battle_id_expr,
+    match_id_expr,
+    process_fact_matches,
+)
+from .fact_store import FactStore
 from .main import process_gold_layer
+from .scd2 import SCD2Store
 
 __all__ = [
     "FactMatchesProcessor",
+    "FactStore",
+    "SCD2Store",
+    "GoldBuildContext",
+    "DagTask",
+    "TaskResult",
+    "run_dag",
+    "raise_on_failure",
+    "match_id_expr",
+    "battle_id_expr",
+    "BaseDimensionProcessor",
+    "EagerDimensionProcessor",
+    "DimBattlesProcessor",
     "DimPlayersProcessor",
     "DimClubsProcessor",
     "DimGameModesProcessor",
     "DimMapsProcessor",
     "process_fact_matches",
+    "process_dim_battles",
     "process_dim_players",
     "process_dim_clubs",
     "process_dim_game_modes",
@@ -1,4 +1,5 @@
 import logging
+import os
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
@@ -6,6 +7,9 @@ from typing import Optional
 
 import polars as pl
 
+from .build_context import GoldBuildContext
+from .scd2 import SCD2Store
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,10 +19,49 @@ class BaseDimensionProcessor(ABC):
 
     All dimension processors should inherit from this class and implement
     the abstract methods to ensure consistent behavior.
+
+    Dimensions setting ``history_key`` also keep an SCD type 2 history (see
+    ``SCD2Store``) next to the daily snapshot: a new version is opened when
+    one of the ``history_tracked`` columns changes.
+
+    Dimensions are built lazily: ``build_dimension`` turns a LazyFrame scan
+    of the source into a LazyFrame, so a standalone ``process`` reads only
+    the columns it uses. Sources are scanned through a ``GoldBuildContext``:
+    processors given the same context share their sources, which a gold
+    build loads once with the columns listed in ``source_columns`` by the
+    processors reading them (see ``process_gold_layer``). Dimensions
+    without history are streamed to their output file with ``sink_parquet``;
+    the others are collected, saved and merged into their history.
+    Dimensions built from a materialized DataFrame derive from
+    ``EagerDimensionProcessor`` instead.
+
+    Args:
+        date: Date partition to process (YYYY-MM-DD). Defaults to today.
+        history: Merge the snapshot into the history, if the dimension has one
+        context: Build context shared with other processors, defaults to a
+            private one
     """
 
-    def __init__(self, date: Optional[str] = None):
+    # Entity key of the SCD type 2 history, None for no history
+    history_key: Optional[list[str]] = None
+    # Columns whose changes open a new version in the history
+    history_tracked: list[str] = []
+    # Stream the table to its output file when nothing else needs the rows;
+    # False for dimensions overriding save_dimension
+    sink_output: bool = True
+    # Processed daily files read by the dimension (inputs of its build task),
+    # each with the columns it uses: a gold build loads only those columns
+    source_columns: dict[str, tuple[str, ...]] = {}
+
+    def __init__(
+        self,
+        date: Optional[str] = None,
+        history: bool = True,
+        context: Optional[GoldBuildContext] = None,
+    ):
         self.date = date or datetime.today().strftime("%Y-%m-%d")
+        self.history = history
+        self.context = context or GoldBuildContext(self.date)
         self.logger = logging.getLogger(self.__class__.__name__)
 
     @abstractmethod
@@ -42,15 +85,15 @@ class BaseDimensionProcessor(ABC):
         pass
 
     @abstractmethod
-    def build_dimension(self, source_df: pl.DataFrame) -> pl.DataFrame:
+    def build_dimension(self, source_df: pl.LazyFrame) -> pl.LazyFrame:
         """
-        Build the dimension table from source data.
+        Build the dimension table plan from source data.
 
         Args:
-            source_df: Source DataFrame loaded from processed data
+            source_df: Lazy scan of the processed source data
 
         Returns:
-            DataFrame with dimension table data
+            LazyFrame with dimension table data
         """
         pass
 
@@ -64,21 +107,104 @@ class BaseDimensionProcessor(ABC):
         """
         pass
 
+    def get_history_path(self) -> Path:
+        """
+        Get the path of the SCD type 2 history of this dimension.
+
+        Returns:
+            ``<dimension>_history.parquet`` directory next to the snapshot
+        """
+        return self.get_output_path().with_name(
+            f"{self.get_dimension_name()}_history.parquet"
+        )
+
+    def get_history_store(self) -> Optional[SCD2Store]:
+        """
+        Get the SCD type 2 history store, if this dimension keeps one.
+
+        Returns:
+            SCD2Store, or None if the dimension has no ``history_key``
+        """
+        if self.history_key is None:
+            return None
+        return SCD2Store(
+            self.get_history_path(), key=self.history_key, tracked=self.history_tracked
+        )
+
+    def scan_source_data(self) -> Optional[pl.LazyFrame]:
+        """
+        Lazily scan source data from processed files, through the build context.
+
+        Returns:
+            Source LazyFrame, or None if the source file is missing
+        """
+        source = self.context.scan(self.get_source_path())
+        if source is None:
+            self.logger.warning(f"Source data not found: {self.get_source_path()}")
+        return source
+
     def load_source_data(self) -> pl.DataFrame:
         """
         Load source data from processed files.
 
         Returns:
-            Source DataFrame
+            Source DataFrame (empty if the source file is missing)
         """
-        source_path = self.get_source_path()
-
-        if not source_path.exists():
-            self.logger.warning(f"Source data not found: {source_path}")
+        source = self.scan_source_data()
+        if source is None:
             return pl.DataFrame()
+        self.logger.info(f"Loading source data from {self.get_source_path()}")
+        return source.collect()
+
+    def build_plan(self) -> Optional[pl.LazyFrame]:
+        """
+        Build the lazy plan of the dimension table from the shared source scan.
+
+        Returns:
+            LazyFrame of the dimension table, or None if the source is missing
+        """
+        source = self.scan_source_data()
+        if source is None:
+            return None
+        return self.build_dimension(source)
+
+    def streams_output(self) -> bool:
+        """
+        Check whether the table is streamed to disk rather than collected.
+
+        Returns:
+            True unless the dimension saves its rows itself or merges them
+            into its history
+        """
+        keeps_history = self.history and self.history_key is not None
+        return self.sink_output and not keeps_history
+
+    def sink_dimension(self, plan: pl.LazyFrame):
+        """
+        Stream a dimension plan to the output file with ``sink_parquet``.
 
-        self.logger.info(f"Loading source data from {source_path}")
-        return pl.read_parquet(source_path)
+        The plan is streamed to a temporary file next to the output, which
+        replaces the output only if it has rows: like ``save_dimension``, an
+        empty table leaves the previous file untouched.
+
+        Args:
+            plan: Dimension table plan (from ``build_plan``)
+        """
+        name = self.get_dimension_name()
+        output_path = self.get_output_path()
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        self.logger.info(f"Streaming {name} to {output_path}")
+        try:
+            plan.sink_parquet(tmp_path)
+            rows = pl.scan_parquet(tmp_path).select(pl.len()).collect().item()
+            if not rows:
+                self.logger.warning(f"No {name} data to save")
+                return
+            os.replace(tmp_path, output_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        self.logger.info(f"{name} saved successfully ({rows} rows)")
 
     def save_dimension(self, dim_df: pl.DataFrame):
         """
@@ -94,10 +220,24 @@ class BaseDimensionProcessor(ABC):
         output_path = self.get_output_path()
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self.logger.info(f"Saving {self.get_dimension_name()} to {output_path}")
+        name = self.get_dimension_name()
+        self.logger.info(f"Saving {name} ({dim_df.height} rows) to {output_path}")
         dim_df.write_parquet(str(output_path))
         self.logger.info(f"{self.get_dimension_name()} saved successfully")
 
+        history_store = self.get_history_store()
+        if self.history and history_store is not None:
+            latest = history_store.latest_date()
+            if latest is not None and latest > self.date:
+                # Backfill: the history only moves forward
+                self.logger.warning(
+                    f"⚠️ Not merging {self.date} into the {name} history, "
+                    f"which is already at {latest}"
+                )
+                return
+            self.logger.info(f"Merging {self.get_dimension_name()} into its history")
+            history_store.merge(dim_df.drop("_process_date"), self.date)
+
     def process(self):
         """
         Complete pipeline to build and save dimension table.
@@ -106,19 +246,53 @@ class BaseDimensionProcessor(ABC):
             f"Processing {self.get_dimension_name()} for date: {self.date}"
         )
 
-        # Load source data
-        source_df = self.load_source_data()
-
-        if source_df.is_empty():
+        # Build the dimension table
+        plan = self.build_plan()
+        if plan is None:
             self.logger.warning(
                 f"No source data available for {self.get_dimension_name()}"
             )
             return
 
-        # Build the dimension table
-        dim_df = self.build_dimension(source_df)
-
         # Save to cleaned data
-        self.save_dimension(dim_df)
+        if self.streams_output():
+            self.sink_dimension(plan)
+        else:
+            self.save_dimension(plan.collect())
 
         self.logger.info(f"{self.get_dimension_name()} processing complete")
+
+
+class EagerDimensionProcessor(BaseDimensionProcessor):
+    """
+    Adapter for dimension processors built from a materialized DataFrame.
+
+    ``build_dimension`` receives the whole source DataFrame and returns a
+    DataFrame, as before the lazy contract. The source is read when the plan
+    is built, so such dimensions get no projection pushdown.
+    """
+
+    @abstractmethod
+    def build_dimension(self, source_df: pl.DataFrame) -> pl.DataFrame:
+        """
+        Build the dimension table from source data.
+
+        Args:
+            source_df: Source DataFrame loaded from processed data
+
+        Returns:
+            DataFrame with dimension table data
+        """
+        pass
+
+    def build_plan(self) -> Optional[pl.LazyFrame]:
+        """
+        Build the dimension table eagerly and wrap it as a LazyFrame.
+
+        Returns:
+            LazyFrame over the built table, or None if the source is missing
+        """
+        source = self.scan_source_data()
+        if source is None:
+            return None
+        return self.build_dimension(source.collect()).lazy()
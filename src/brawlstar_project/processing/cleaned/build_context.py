@@ -0,0 +1,108 @@
+"""
+Shared sources of a gold-layer build.
+
+Several gold tables are built from the same processed files (battlelog for
+fact_matches, dim_game_modes, dim_maps and dim_battles; player for
+fact_matches and dim_players). A ``GoldBuildContext`` scans each file once
+and hands the same LazyFrame to every processor; ``load`` reads a file into
+memory once before the processors run (as ``process_gold_layer`` does, one
+task per file). When the processed stage ran in the same process, its
+DataFrames can be handed to the context so the gold build does not read
+them back from disk.
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+import polars as pl
+
+from brawlstar_project.constants.paths import DATA_PROCESSED_DIR
+from brawlstar_project.processing.utils.dataset import dataset_path
+
+logger = logging.getLogger(__name__)
+
+
+class GoldBuildContext:
+    """
+    Processed sources of one gold build, each scanned once.
+
+    Args:
+        date: Date partition to process (YYYY-MM-DD). Defaults to today.
+        frames: Processed daily file name -> DataFrame already in memory,
+            used instead of scanning that file
+    """
+
+    def __init__(
+        self,
+        date: Optional[str] = None,
+        frames: Optional[dict[str, pl.DataFrame]] = None,
+    ):
+        self.date = date or datetime.today().strftime("%Y-%m-%d")
+        self._scans: dict[Path, Optional[pl.LazyFrame]] = {}
+        for filename, df in (frames or {}).items():
+            logger.info(f"Using in-memory {filename}")
+            self._scans[dataset_path(DATA_PROCESSED_DIR, filename, self.date)] = (
+                df.lazy()
+            )
+
+    def scan(self, path: Path) -> Optional[pl.LazyFrame]:
+        """
+        Lazily scan a Parquet file, reusing the scan of earlier calls.
+
+        Args:
+            path: Parquet file to scan
+
+        Returns:
+            Shared LazyFrame, or None if the file does not exist
+        """
+        path = Path(path)
+        if path not in self._scans:
+            if path.exists():
+                logger.info(f"Scanning {path}")
+                self._scans[path] = pl.scan_parquet(path)
+            else:
+                self._scans[path] = None
+        return self._scans[path]
+
+    def source(self, filename: str) -> Optional[pl.LazyFrame]:
+        """
+        Shared scan of a processed daily file of the build date.
+
+        Args:
+            filename: Daily file name (e.g. "battlelog.parquet")
+
+        Returns:
+            Shared LazyFrame, or None if the partition has no such file
+        """
+        return self.scan(dataset_path(DATA_PROCESSED_DIR, filename, self.date))
+
+    def load(
+        self, filename: str, columns: Optional[Iterable[str]] = None
+    ) -> Optional[pl.DataFrame]:
+        """
+        Read a processed daily file into memory once, for every later plan.
+
+        Plans built afterwards from ``source(filename)`` (including by other
+        threads) run on the in-memory frame instead of reading the file, so
+        it must hold every column they use.
+
+        Args:
+            filename: Daily file name (e.g. "battlelog.parquet")
+            columns: Columns to read, those missing from the file being
+                skipped; all columns by default
+
+        Returns:
+            Loaded DataFrame, or None if the partition has no such file
+        """
+        path = dataset_path(DATA_PROCESSED_DIR, filename, self.date)
+        source = self.scan(path)
+        if source is None:
+            return None
+        if columns is not None:
+            available = source.collect_schema()
+            source = source.select([name for name in columns if name in available])
+        df = source.collect()
+        self._scans[path] = df.lazy()
+        return df
@@ -0,0 +1,180 @@
+"""
+Small DAG executor for the cleaned stage.
+
+Each task declares the datasets it reads (``inputs``) and writes
+(``outputs``); a task runs once every task producing one of its inputs has
+succeeded. Independent tasks run concurrently in a thread pool, which is
+effective here because Polars releases the GIL while it works. A failing
+task does not stop the others: only the tasks depending on it are skipped.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DagTask:
+    """
+    Unit of work of a DAG run.
+
+    Args:
+        name: Unique task name
+        run: Callable doing the work
+        inputs: Datasets read; those not produced by any task are external
+        outputs: Datasets written
+    """
+
+    name: str
+    run: Callable[[], object]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+
+
+@dataclass
+class TaskResult:
+    """Outcome of one task: status is "ok", "failed" or "skipped"."""
+
+    name: str
+    status: str
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def task_dependencies(tasks: Iterable[DagTask]) -> dict[str, set[str]]:
+    """
+    Resolve the tasks each task waits for, from their inputs and outputs.
+
+    Args:
+        tasks: Tasks of the DAG
+
+    Returns:
+        Task name -> names of the tasks producing its inputs
+
+    Raises:
+        ValueError: On duplicate task names or outputs, or on a cycle
+    """
+    tasks = list(tasks)
+    producers: dict[str, str] = {}
+    for task in tasks:
+        for output in task.outputs:
+            if output in producers:
+                raise ValueError(
+                    f"{output!r} is written by both {producers[output]!r} "
+                    f"and {task.name!r}"
+                )
+            producers[output] = task.name
+
+    dependencies: dict[str, set[str]] = {}
+    for task in tasks:
+        if task.name in dependencies:
+            raise ValueError(f"Duplicate task name {task.name!r}")
+        dependencies[task.name] = {
+            producers[name]
+            for name in task.inputs
+            if name in producers and producers[name] != task.name
+        }
+
+    # Kahn's algorithm: every task must become ready at some point
+    remaining = {name: set(deps) for name, deps in dependencies.items()}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Dependency cycle between {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return dependencies
+
+
+def _run_task(task: DagTask) -> TaskResult:
+    start = time.perf_counter()
+    try:
+        task.run()
+    except Exception as e:
+        seconds = time.perf_counter() - start
+        logger.error(f"❌ {task.name} failed after {seconds:.2f}s: {e}")
+        return TaskResult(task.name, "failed", seconds, str(e))
+    return TaskResult(task.name, "ok", time.perf_counter() - start)
+
+
+def run_dag(
+    tasks: Iterable[DagTask], max_workers: Optional[int] = None
+) -> dict[str, TaskResult]:
+    """
+    Run tasks in dependency order, independent ones concurrently.
+
+    Args:
+        tasks: Tasks of the DAG
+        max_workers: Thread pool size, defaults to the ThreadPoolExecutor
+            default
+
+    Returns:
+        Task name -> result, in completion order
+    """
+    tasks = {task.name: task for task in tasks}
+    waiting = task_dependencies(tasks.values())
+    results: dict[str, TaskResult] = {}
+    running: dict[Future, str] = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while waiting or running:
+            # Skip the dependents of failed tasks, then start every ready task
+            skipped = True
+            while skipped:
+                skipped = False
+                for name, deps in list(waiting.items()):
+                    failed = [
+                        dep
+                        for dep in sorted(deps)
+                        if dep in results and results[dep].status != "ok"
+                    ]
+                    if failed:
+                        logger.warning(f"⏭️ Skipping {name}: {failed[0]} did not run")
+                        results[name] = TaskResult(
+                            name, "skipped", error=f"{failed[0]} did not run"
+                        )
+                        del waiting[name]
+                        skipped = True
+            for name, deps in list(waiting.items()):
+                if all(dep in results for dep in deps):
+                    running[pool.submit(_run_task, tasks[name])] = name
+                    del waiting[name]
+
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                results[result.name] = result
+                del running[future]
+
+    log_task_report(results.values())
+    return results
+
+
+def raise_on_failure(results: dict[str, TaskResult]) -> None:
+    """
+    Fail a DAG run whose tasks did not all succeed.
+
+    Args:
+        results: Task name -> result, as returned by ``run_dag``
+
+    Raises:
+        RuntimeError: If a task failed or was skipped
+    """
+    failed = [name for name, result in results.items() if result.status != "ok"]
+    if failed:
+        raise RuntimeError(f"{len(failed)} task(s) did not succeed: {failed}")
+
+
+def log_task_report(results: Iterable[TaskResult]) -> None:
+    """Log the wall time and status of every task."""
+    for result in results:
+        icon = {"ok": "✅", "failed": "❌", "skipped": "⏭️"}[result.status]
+        logger.info(f"⏱️ {icon} {result.name}: {result.seconds:.2f}s")
@@ -0,0 +1,118 @@
+import logging
+from pathlib import Path
+
+import polars as pl
+
+from brawlstar_project.constants.paths import DATA_CLEANED_DIR, DATA_PROCESSED_DIR
+from brawlstar_project.processing.utils.dataset import dataset_path
+
+from .base_dimension_processor import BaseDimensionProcessor
+from .fact_matches import battle_id_expr
+from .fact_store import FactStore
+
+logger = logging.getLogger(__name__)
+
+
+class DimBattlesProcessor(BaseDimensionProcessor):
+    """
+    Processor for building dim_battles from processed battlelog data.
+
+    One row per battle, keyed by ``battle_id``: a battle played by several
+    tracked players appears in each of their battlelogs, and in fact_matches
+    once per player, but only once here. Like fact_matches, the table is a
+    ``battle_time_date``-partitioned store that keeps the whole history.
+    """
+
+    # Rows are merged into the store by save_dimension
+    sink_output = False
+    source_columns = {
+        "battlelog.parquet": (
+            "battle_time",
+            "player_tag",
+            "participant_tags",
+            "battle_mode",
+            "event_mode",
+            "map_name",
+            "battle_type",
+            "battle_duration",
+        )
+    }
+
+    def get_source_path(self) -> Path:
+        """Get the path to processed battlelog data."""
+        return dataset_path(DATA_PROCESSED_DIR, "battlelog.parquet", self.date)
+
+    def get_output_path(self) -> Path:
+        """Get the output path for dim_battles (a partitioned directory)."""
+        return DATA_CLEANED_DIR / "dim_battles.parquet"
+
+    def get_store(self) -> FactStore:
+        """Get the partitioned dim_battles store."""
+        return FactStore(
+            self.get_output_path(), key=["battle_id"], partition_by="battle_time_date"
+        )
+
+    def build_dimension(self, source_df: pl.LazyFrame) -> pl.LazyFrame:
+        """Build dim_battles by collapsing each battle's rows into one."""
+        self.logger.info("Building dim_battles table...")
+        schema = source_df.collect_schema()
+        if "participant_tags" not in schema:
+            # Flattened before participant tags were recorded
+            source_df = source_df.with_columns(
+                pl.col("player_tag").alias("participant_tags")
+            )
+            schema = source_df.collect_schema()
+
+        dim_battles_df = (
+            source_df.with_columns(battle_id_expr(schema).alias("battle_id"))
+            .group_by("battle_id", maintain_order=True)
+            .agg(
+                pl.col("battle_time").first(),
+                pl.col("battle_time").first().dt.date().alias("battle_time_date"),
+                pl.col("battle_mode").first(),
+                pl.col("event_mode").first(),
+                pl.col("map_name").first(),
+                pl.col("battle_type").first(),
+                pl.col("battle_duration").first(),
+                pl.col("participant_tags").first(),
+                pl.col("player_tag").n_unique().alias("tracked_players"),
+            )
+            .with_columns(
+                pl.col("participant_tags")
+                .str.split(",")
+                .list.len()
+                .alias("participant_count"),
+                # Add _process_date column as a date type
+                pl.lit(self.date)
+                .str.strptime(pl.Date, "%Y-%m-%d")
+                .alias("_process_date"),
+            )
+        )
+
+        return dim_battles_df
+
+    def save_dimension(self, dim_df: pl.DataFrame):
+        """Merge the date's battles into the dim_battles store."""
+        if dim_df.is_empty():
+            self.logger.warning("No dim_battles data to save")
+            return
+
+        self.logger.info(f"Merging dim_battles into {self.get_output_path()}")
+        self.get_store().upsert(dim_df, batch_id=self.date)
+        self.logger.info("dim_battles saved successfully")
+
+    def get_dimension_name(self) -> str:
+        """Get the dimension name."""
+        return "dim_battles"
+
+
+# Convenience function, as for the other dimensions
+def process_dim_battles(date=None):
+    """
+    Convenience function to process dim_battles using the processor.
+
+    Args:
+        date: Date partition to process (YYYY-MM-DD). Defaults to today.
+    """
+    processor = DimBattlesProcessor(date)
+    processor.process()
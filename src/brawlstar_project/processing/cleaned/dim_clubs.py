@@ -3,6 +3,9 @@ from pathlib import Path
 
 import polars as pl
 
+from brawlstar_project.constants.paths import DATA_CLEANED_DIR, DATA_PROCESSED_DIR
+from brawlstar_project.processing.utils.dataset import dataset_path
+
 from .base_dimension_processor import BaseDimensionProcessor
 
 logger = logging.getLogger(__name__)
@@ -11,19 +14,38 @@ logger = logging.getLogger(__name__)
 class DimClubsProcessor(BaseDimensionProcessor):
     """
     Processor for building dim_clubs dimension table from processed data.
+
+    The history (``dim_clubs_history.parquet``) tracks every club attribute.
     """
 
+    source_columns = {
+        "club.parquet": (
+            "tag",
+            "name",
+            "description",
+            "trophies",
+            "required_trophies",
+            "member_count",
+        )
+    }
+    history_key = ["tag"]
+    history_tracked = [
+        "name",
+        "description",
+        "trophies",
+        "required_trophies",
+        "member_count",
+    ]
+
     def get_source_path(self) -> Path:
         """Get the path to processed club data."""
-        processed_base = Path("data/processed")
-        return processed_base / "club" / self.date / "club.parquet"
+        return dataset_path(DATA_PROCESSED_DIR, "club.parquet", self.date)
 
     def get_output_path(self) -> Path:
         """Get the output path for dim_clubs."""
-        cleaned_base = Path("data/cleaned")
-        return cleaned_base / "dim_clubs.parquet"
+        return DATA_CLEANED_DIR / "dim_clubs.parquet"
 
-    def build_dimension(self, source_df: pl.DataFrame) -> pl.DataFrame:
+    def build_dimension(self, source_df: pl.LazyFrame) -> pl.LazyFrame:
         """Build dim_clubs table from club data."""
         self.logger.info("Building dim_clubs table...")
 
@@ -47,7 +69,6 @@ class DimClubsProcessor(BaseDimensionProcessor):
             pl.lit(self.date).str.strptime(pl.Date, "%Y-%m-%d").alias("_process_date")
         )
 
-        self.logger.info(f"Built dim_clubs table with {len(dim_clubs_df)} rows")
         return dim_clubs_df
 
     def get_dimension_name(self) -> str:
@@ -56,12 +77,13 @@ class DimClubsProcessor(BaseDimensionProcessor):
 
 
 # Convenience function for backward compatibility
-def process_dim_clubs(date=None):
+def process_dim_clubs(date=None, history=True):
     """
     Convenience function to process dim_clubs using the processor.
 
     Args:
         date: Date partition to process (YYYY-MM-DD). Defaults to today.
+        history: Merge the snapshot into dim_clubs_history
     """
-    processor = DimClubsProcessor(date)
+    processor = DimClubsProcessor(date, history=history)
     processor.process()
@@ -4,6 +4,7 @@ from pathlib import Path
 import polars as pl
 
 from brawlstar_project.constants.paths import DATA_CLEANED_DIR, DATA_PROCESSED_DIR
+from brawlstar_project.processing.utils.dataset import dataset_path
 
 from .base_dimension_processor import BaseDimensionProcessor
 
@@ -15,15 +16,17 @@ class DimGameModesProcessor(BaseDimensionProcessor):
     Processor for building dim_game_modes dimension table from processed battlelog data.
     """
 
+    source_columns = {"battlelog.parquet": ("battle_mode",)}
+
     def get_source_path(self) -> Path:
         """Get the path to processed battlelog data."""
-        return DATA_PROCESSED_DIR / "player" / self.date / "battlelog.parquet"
+        return dataset_path(DATA_PROCESSED_DIR, "battlelog.parquet", self.date)
 
     def get_output_path(self) -> Path:
         """Get the output path for dim_game_modes."""
         return DATA_CLEANED_DIR / "dim_game_modes.parquet"
 
-    def build_dimension(self, source_df: pl.DataFrame) -> pl.DataFrame:
+    def build_dimension(self, source_df: pl.LazyFrame) -> pl.LazyFrame:
         """Build dim_game_modes table by extracting unique game modes."""
         self.logger.info("Building dim_game_modes table...")
         dim_game_modes_df = source_df.select("battle_mode").unique(
@@ -35,9 +38,6 @@ class DimGameModesProcessor(BaseDimensionProcessor):
             pl.lit(self.date).str.strptime(pl.Date, "%Y-%m-%d").alias("_process_date")
         )
 
-        self.logger.info(
-            f"Built dim_game_modes table with {len(dim_game_modes_df)} rows"
-        )
         return dim_game_modes_df
 
     def get_dimension_name(self) -> str:
@@ -4,6 +4,7 @@ from pathlib import Path
 import polars as pl
 
 from brawlstar_project.constants.paths import DATA_CLEANED_DIR, DATA_PROCESSED_DIR
+from brawlstar_project.processing.utils.dataset import dataset_path
 
 from .base_dimension_processor import BaseDimensionProcessor
 
@@ -15,15 +16,17 @@ class DimMapsProcessor(BaseDimensionProcessor):
     Processor for building dim_maps dimension table from processed battlelog data.
     """
 
+    source_columns = {"battlelog.parquet": ("map_name",)}
+
     def get_source_path(self) -> Path:
         """Get the path to processed battlelog data."""
-        return DATA_PROCESSED_DIR / "player" / self.date / "battlelog.parquet"
+        return dataset_path(DATA_PROCESSED_DIR, "battlelog.parquet", self.date)
 
     def get_output_path(self) -> Path:
         """Get the output path for dim_maps."""
         return DATA_CLEANED_DIR / "dim_maps.parquet"
 
-    def build_dimension(self, source_df: pl.DataFrame) -> pl.DataFrame:
+    def build_dimension(self, source_df: pl.LazyFrame) -> pl.LazyFrame:
         """Build dim_maps table by extracting unique maps."""
         self.logger.info("Building dim_maps table...")
         dim_maps_df = source_df.select("map_name").unique(subset=["map_name"])
@@ -33,7 +36,6 @@ class DimMapsProcessor(BaseDimensionProcessor):
             pl.lit(self.date).str.strptime(pl.Date, "%Y-%m-%d").alias("_process_date")
         )
 
-        self.logger.info(f"Built dim_maps table with {len(dim_maps_df)} rows")
         return dim_maps_df
 
     def get_dimension_name(self) -> str:
@@ -4,6 +4,7 @@ from pathlib import Path
 import polars as pl
 
 from brawlstar_project.constants.paths import DATA_CLEANED_DIR, DATA_PROCESSED_DIR
+from brawlstar_project.processing.utils.dataset import dataset_path
 
 from .base_dimension_processor import BaseDimensionProcessor
 
@@ -13,17 +14,43 @@ logger = logging.getLogger(__name__)
 class DimPlayersProcessor(BaseDimensionProcessor):
     """
     Processor for building dim_players dimension table from processed data.
+
+    The history (``dim_players_history.parquet``) tracks name, club, role,
+    trophies and experience changes.
     """
 
+    source_columns = {
+        "player.parquet": (
+            "tag",
+            "name",
+            "club_tag",
+            "trophies",
+            "highest_trophies",
+            "exp_level",
+            "exp_points",
+        ),
+        "club_members.parquet": ("tag", "role"),
+    }
+    history_key = ["tag"]
+    history_tracked = [
+        "name",
+        "club_tag",
+        "club_role",
+        "trophies",
+        "highest_trophies",
+        "exp_level",
+        "exp_points",
+    ]
+
     def get_source_path(self) -> Path:
         """Get the path to processed player data."""
-        return DATA_PROCESSED_DIR / "player" / self.date / "player.parquet"
+        return dataset_path(DATA_PROCESSED_DIR, "player.parquet", self.date)
 
     def get_output_path(self) -> Path:
         """Get the output path for dim_players."""
         return DATA_CLEANED_DIR / "dim_players.parquet"
 
-    def build_dimension(self, source_df: pl.DataFrame) -> pl.DataFrame:
+    def build_dimension(self, source_df: pl.LazyFrame) -> pl.LazyFrame:
         """Build dim_players table from player data with club role."""
         self.logger.info("Building dim_players table...")
 
@@ -50,13 +77,11 @@ class DimPlayersProcessor(BaseDimensionProcessor):
         ]
 
         # Load club members data to get roles
-        club_members_path = (
-            Path("data/processed") / "club" / self.date / "club_members.parquet"
+        club_members_path = dataset_path(
+            DATA_PROCESSED_DIR, "club_members.parquet", self.date
         )
-        if club_members_path.exists():
-            self.logger.info(f"Loading club members data from {club_members_path}")
-            club_members_df = pl.read_parquet(club_members_path)
-
+        club_members_df = self.context.scan(club_members_path)
+        if club_members_df is not None:
             # Join player data with club members data to get role
             dim_players_df = (
                 source_df.select(INPUT_SOURCE_COLS)
@@ -80,7 +105,7 @@ class DimPlayersProcessor(BaseDimensionProcessor):
             )
             # Add empty club_role column and reorder
             dim_players_df = dim_players_df.with_columns(
-                pl.lit(None).alias("club_role")
+                pl.lit(None, dtype=pl.String).alias("club_role")
             ).select(OUTPUT_DIM_PLAYERS_COLS)
 
         # Add _process_date column as a date type
@@ -88,7 +113,6 @@ class DimPlayersProcessor(BaseDimensionProcessor):
             pl.lit(self.date).str.strptime(pl.Date, "%Y-%m-%d").alias("_process_date")
         )
 
-        self.logger.info(f"Built dim_players table with {len(dim_players_df)} rows")
         return dim_players_df
 
     def get_dimension_name(self) -> str:
@@ -97,12 +121,13 @@ class DimPlayersProcessor(BaseDimensionProcessor):
 
 
 # Convenience function for backward compatibility
-def process_dim_players(date=None):
+def process_dim_players(date=None, history=True):
     """
     Convenience function to process dim_players using the processor.
 
     Args:
         date: Date partition to process (YYYY-MM-DD). Defaults to today.
+        history: Merge the snapshot into dim_players_history
     """
-    processor = DimPlayersProcessor(date)
+    processor = DimPlayersProcessor(date, history=history)
     processor.process()
@@ -5,21 +5,149 @@ from typing import Optional
 
 import polars as pl
 
+from brawlstar_project.constants.paths import DATA_CLEANED_DIR, DATA_PROCESSED_DIR
+from brawlstar_project.processing.cleaned.build_context import GoldBuildContext
+from brawlstar_project.processing.cleaned.fact_store import FactStore
+from brawlstar_project.processing.utils.dataset import dataset_path
+
 logger = logging.getLogger(__name__)
 
 
+def match_id_expr(battle_time_dtype: pl.DataType) -> pl.Expr:
+    """
+    Native Polars version of ``FactMatchesProcessor.generate_match_id``.
+
+    Builds ``<player_tag>-<yyyyMMdd>-<map_name>`` from the ``player_tag``,
+    ``battle_time`` and ``map_name`` columns without calling Python per row.
+
+    Args:
+        battle_time_dtype: Dtype of the ``battle_time`` column; temporal
+            columns are formatted, anything else goes through the string
+            fallback of ``generate_match_id``
+
+    Returns:
+        String expression, to be aliased (e.g. "match_id")
+    """
+    battle_time = pl.col("battle_time")
+    if battle_time_dtype.is_temporal():
+        date_str = battle_time.dt.strftime("%Y%m%d")
+    else:
+        text = battle_time.cast(pl.String)
+        date_str = (
+            pl.when(text.str.contains("T", literal=True))
+            .then(
+                text.str.split("T").list.first().str.replace_all("-", "", literal=True)
+            )
+            .otherwise(text.str.slice(0, 8))
+        )
+    return pl.concat_str(
+        [
+            pl.col("player_tag").str.replace_all("#", "", literal=True),
+            # generate_match_id formats a missing timestamp as str(None)
+            date_str.fill_null("None"),
+            pl.col("map_name")
+            .str.replace_all(" ", "_", literal=True)
+            .str.replace_all("-", "_", literal=True),
+        ],
+        separator="-",
+    )
+
+
+def battle_id_expr(schema: pl.Schema) -> pl.Expr:
+    """
+    Canonical battle key, the same in the battlelog of every participant.
+
+    Builds ``<yyyyMMddTHHmmss>|<battle_mode>|<map_name>|<participant_tags>``.
+    Unlike ``match_id``, it tells apart two battles of a player on the same
+    map and day, and identifies one battle seen by several tracked players.
+
+    Args:
+        schema: Schema of the battlelog frame. Battlelogs flattened before
+            ``participant_tags`` existed fall back to the player's own tag,
+            which keeps their key unique per player and battle
+
+    Returns:
+        String expression, to be aliased (e.g. "battle_id")
+    """
+    battle_time = pl.col("battle_time")
+    if schema["battle_time"].is_temporal():
+        battle_time = battle_time.dt.strftime("%Y%m%dT%H%M%S")
+    participants = (
+        pl.col("participant_tags")
+        if "participant_tags" in schema
+        else pl.col("player_tag")
+    )
+    return pl.concat_str(
+        [
+            battle_time.cast(pl.String).fill_null(""),
+            pl.col("battle_mode").fill_null(""),
+            pl.col("map_name").fill_null(""),
+            participants.fill_null(""),
+        ],
+        separator="|",
+    )
+
+
+# A player's battle is identified by the player and the battle time
+FACT_MATCHES_KEY = ["player_tag", "battle_time"]
+
+
 class FactMatchesProcessor:
     """
     Processor for building fact_matches table from processed data.
+
+    By default, each date's rows are merged into the date-partitioned
+    ``fact_matches.parquet`` store (see ``FactStore``), so the table keeps the
+    whole history. With ``incremental=False`` the table is overwritten with
+    the date's rows only.
+
+    Sources are scanned through a ``GoldBuildContext``, which can be shared
+    with the dimension processors of the same build.
     """
 
-    def __init__(self, date: Optional[str] = None):
+    # Processed daily files read by the fact table (inputs of its build task),
+    # each with the columns it uses: a gold build loads only those columns
+    source_columns = {
+        "battlelog.parquet": (
+            "battle_time",
+            "player_tag",
+            "participant_tags",
+            "map_name",
+            "battle_mode",
+            "battle_result",
+        ),
+        "player.parquet": ("tag", "club_tag"),
+    }
+
+    def __init__(
+        self,
+        date: Optional[str] = None,
+        incremental: bool = True,
+        context: Optional[GoldBuildContext] = None,
+    ):
         self.date = date or datetime.today().strftime("%Y-%m-%d")
+        self.incremental = incremental
+        self.context = context or GoldBuildContext(self.date)
         self.logger = logging.getLogger(__name__)
 
+    def get_output_path(self) -> Path:
+        """Get the output path for fact_matches (a directory in incremental mode)."""
+        return DATA_CLEANED_DIR / "fact_matches.parquet"
+
+    def get_store(self) -> FactStore:
+        """Get the partitioned fact_matches store."""
+        return FactStore(
+            self.get_output_path(),
+            key=FACT_MATCHES_KEY,
+            partition_by="battle_time_date",
+        )
+
     def generate_match_id(self, player_tag: str, battle_time, map_name: str) -> str:
         """
-        Generate unique match ID with structure: <player_tag>-<yyyyMMdd>-<map_name>.
+        Generate match ID with structure: <player_tag>-<yyyyMMdd>-<map_name>.
+
+        Two games of a player on the same map and day share a match ID; use
+        ``battle_id`` to identify a battle.
 
         Args:
             player_tag: Player tag (e.g., "#GQJRYV0JQ")
@@ -56,31 +184,27 @@ class FactMatchesProcessor:
 
         return f"{clean_player_tag}-{date_str}-{clean_map}"
 
-    def build_fact_matches(self) -> pl.DataFrame:
+    def build_plan(self) -> Optional[pl.LazyFrame]:
         """
-        Build fact_matches table from processed battlelog and player data.
+        Build the lazy fact_matches plan from the battlelog and player scans.
 
         Returns:
-            DataFrame with fact_matches data
+            LazyFrame with fact_matches data, or None if a source is missing
         """
-        # Load processed data
-        processed_base = Path("data/processed")
-        battlelog_path = processed_base / "player" / self.date / "battlelog.parquet"
-        player_path = processed_base / "player" / self.date / "player.parquet"
+        battlelog_path = dataset_path(
+            DATA_PROCESSED_DIR, "battlelog.parquet", self.date
+        )
+        player_path = dataset_path(DATA_PROCESSED_DIR, "player.parquet", self.date)
 
-        if not battlelog_path.exists():
+        battlelog_df = self.context.scan(battlelog_path)
+        if battlelog_df is None:
             self.logger.warning(f"Battlelog data not found: {battlelog_path}")
-            return pl.DataFrame()
+            return None
 
-        if not player_path.exists():
+        player_df = self.context.scan(player_path)
+        if player_df is None:
             self.logger.warning(f"Player data not found: {player_path}")
-            return pl.DataFrame()
-
-        self.logger.info(f"Loading battlelog data from {battlelog_path}")
-        battlelog_df = pl.read_parquet(battlelog_path)
-
-        self.logger.info(f"Loading player data from {player_path}")
-        player_df = pl.read_parquet(player_path)
+            return None
 
         # Join battlelog with player data to get club information
         self.logger.info("Joining battlelog with player data...")
@@ -91,24 +215,21 @@ class FactMatchesProcessor:
             how="left",
         )
 
-        # Generate match_id and battle_time_date, then select fact table columns
+        # Generate match_id, battle_id and battle_time_date, then select columns
         self.logger.info(
-            "Generating match_id, battle_time_date and selecting fact table columns..."
+            "Generating match_id, battle_id and battle_time_date, selecting columns..."
         )
+        schema = fact_df.collect_schema()
         fact_matches_df = fact_df.with_columns(
             [
-                pl.struct(["player_tag", "battle_time", "map_name"])
-                .map_elements(
-                    lambda x: self.generate_match_id(
-                        x["player_tag"], x["battle_time"], x["map_name"]
-                    )
-                )
-                .alias("match_id"),
+                match_id_expr(schema["battle_time"]).alias("match_id"),
+                battle_id_expr(schema).alias("battle_id"),
                 pl.col("battle_time").dt.date().alias("battle_time_date"),
             ]
         ).select(
             [
                 "match_id",
+                "battle_id",
                 "battle_time",
                 "battle_time_date",
                 "player_tag",
@@ -120,10 +241,21 @@ class FactMatchesProcessor:
         )
 
         # Add _process_date column as a date type
-        fact_matches_df = fact_matches_df.with_columns(
+        return fact_matches_df.with_columns(
             pl.lit(self.date).str.strptime(pl.Date, "%Y-%m-%d").alias("_process_date")
         )
 
+    def build_fact_matches(self) -> pl.DataFrame:
+        """
+        Build fact_matches table from processed battlelog and player data.
+
+        Returns:
+            DataFrame with fact_matches data (empty if a source is missing)
+        """
+        plan = self.build_plan()
+        if plan is None:
+            return pl.DataFrame()
+        fact_matches_df = plan.collect()
         self.logger.info(f"Built fact_matches table with {len(fact_matches_df)} rows")
         return fact_matches_df
 
@@ -138,12 +270,22 @@ class FactMatchesProcessor:
             self.logger.warning("No fact_matches data to save")
             return
 
-        cleaned_base = Path("data/cleaned")
-        output_path = cleaned_base / "fact_matches.parquet"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        self.logger.info(f"Saving fact_matches to {output_path}")
-        fact_df.write_parquet(str(output_path))
+        output_path = self.get_output_path()
+        if self.incremental:
+            store = self.get_store()
+            if output_path.is_file():
+                self.logger.info(f"Moving {output_path} into the partitioned store")
+                store.import_file(output_path)
+            self.logger.info(
+                f"Merging {fact_df.height} fact_matches rows into {output_path}"
+            )
+            store.upsert(fact_df, batch_id=self.date)
+        else:
+            if output_path.is_dir():
+                self.get_store().drop()
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self.logger.info(f"Saving fact_matches to {output_path}")
+            fact_df.write_parquet(str(output_path))
         self.logger.info("Fact matches saved successfully")
 
     def process(self):
@@ -162,12 +304,13 @@ class FactMatchesProcessor:
 
 
 # Convenience function for backward compatibility
-def process_fact_matches(date: Optional[str] = None):
+def process_fact_matches(date: Optional[str] = None, incremental: bool = True):
     """
     Convenience function to process fact_matches using the processor.
 
     Args:
         date: Date partition to process (YYYY-MM-DD). Defaults to today.
+        incremental: Merge into the partitioned store instead of overwriting
     """
-    processor = FactMatchesProcessor(date)
+    processor = FactMatchesProcessor(date, incremental=incremental)
     processor.process()
@@ -0,0 +1,193 @@
+"""
+Incremental, date-partitioned store for fact tables.
+
+A fact table is kept as a hive-partitioned directory, e.g.
+
+    data/cleaned/fact_matches.parquet/battle_time_date=2025-07-11/part-2025-07-12.parquet
+
+Polars (``pl.scan_parquet``) and DuckDB
+(``read_parquet('.../fact_matches.parquet/**/*.parquet', hive_partitioning = true)``,
+see ``analytics.duckdb_utils.parquet_source``) read the directory as one
+table, with the partition column restored from the path.
+
+Each daily build inserts its rows into the partitions they belong to, as one
+part file per batch. Rows whose key is already stored by another batch are
+skipped, so overlapping inputs (a battlelog covers several days) are stored
+once, and re-running a batch replaces its own part file: re-runs are
+idempotent. Only the partitions touched by a batch are read, so a daily build
+costs the same whatever the history. Once a partition has accumulated more
+than ``max_parts`` part files, they are compacted into one.
+"""
+
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Sequence
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PARTS = 8
+# Hive partition value of rows whose partition column is null
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def get_fact_max_parts() -> int:
+    """Part files a partition may hold, from ``BRAWLSTARS_FACT_MAX_PARTS``."""
+    return int(os.getenv("BRAWLSTARS_FACT_MAX_PARTS", DEFAULT_MAX_PARTS))
+
+
+class FactStore:
+    """
+    Hive-partitioned fact table with idempotent batch inserts.
+
+    Args:
+        root: Table directory (e.g. ``DATA_CLEANED_DIR / "fact_matches.parquet"``)
+        key: Columns identifying a fact row
+        partition_by: Date column the table is partitioned on
+        max_parts: Part files a partition may hold before it is compacted,
+            defaults to ``get_fact_max_parts()``
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        key: Sequence[str],
+        partition_by: str,
+        max_parts: Optional[int] = None,
+    ):
+        self.root = Path(root)
+        self.key = list(key)
+        self.partition_by = partition_by
+        self.max_parts = max_parts if max_parts is not None else get_fact_max_parts()
+        self.staging_dir = self.root.with_name(f".{self.root.name}.staging")
+
+    def _partition_dir(self, value) -> Path:
+        name = NULL_PARTITION if value is None else str(value)
+        return self.root / f"{self.partition_by}={name}"
+
+    def partitions(self) -> list[Path]:
+        """Partition directories, in name order."""
+        if not self.root.is_dir():
+            return []
+        prefix = f"{self.partition_by}="
+        return sorted(
+            path
+            for path in self.root.iterdir()
+            if path.is_dir() and path.name.startswith(prefix)
+        )
+
+    @staticmethod
+    def _parts(partition_dir: Path) -> list[Path]:
+        return sorted(partition_dir.glob("part-*.parquet"))
+
+    def _publish(self, df: pl.DataFrame, target: Path) -> None:
+        """Write a part file atomically, staging it outside the table."""
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.staging_dir / f"{os.getpid()}-{target.name}"
+        df.write_parquet(tmp_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, target)
+
+    def upsert(self, df: pl.DataFrame, batch_id: str) -> dict[str, int]:
+        """
+        Insert a batch of rows, skipping keys stored by other batches.
+
+        Args:
+            df: Rows to insert (must contain the key and partition columns)
+            batch_id: Batch name (e.g. the process date); a batch inserted
+                again replaces its previous part files
+
+        Returns:
+            Stats: rows inserted, rows skipped as already stored, partitions
+            touched and partitions compacted
+        """
+        stats = {"inserted": 0, "skipped": 0, "partitions": 0, "compacted": 0}
+        part_name = f"part-{batch_id}.parquet"
+        df = df.unique(subset=self.key, keep="last", maintain_order=True)
+
+        for (value,), rows in df.group_by(self.partition_by, maintain_order=True):
+            partition_dir = self._partition_dir(value)
+            target = partition_dir / part_name
+            others = [path for path in self._parts(partition_dir) if path != target]
+            if others:
+                stored = pl.scan_parquet(others).select(self.key).unique().collect()
+                new_rows = rows.join(stored, on=self.key, how="anti", nulls_equal=True)
+            else:
+                new_rows = rows
+            stats["skipped"] += rows.height - new_rows.height
+            stats["partitions"] += 1
+
+            if new_rows.is_empty():
+                target.unlink(missing_ok=True)
+                continue
+            self._publish(new_rows, target)
+            stats["inserted"] += new_rows.height
+            if len(others) + 1 > self.max_parts:
+                self.compact_partition(partition_dir)
+                stats["compacted"] += 1
+
+        logger.info(
+            f"💾 {batch_id}: {stats['inserted']} rows inserted, "
+            f"{stats['skipped']} already stored, {stats['partitions']} partitions"
+        )
+        return stats
+
+    def compact_partition(self, partition_dir: Path) -> bool:
+        """
+        Merge the part files of one partition into a single file.
+
+        Returns:
+            True if the partition was rewritten
+        """
+        parts = self._parts(partition_dir)
+        if len(parts) < 2:
+            return False
+        merged = pl.concat(
+            [pl.read_parquet(path, hive_partitioning=False) for path in parts],
+            how="diagonal_relaxed",
+        )
+        stamp = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+        self._publish(merged, partition_dir / f"part-compacted-{stamp}.parquet")
+        for path in parts:
+            path.unlink()
+        return True
+
+    def compact(self) -> int:
+        """
+        Compact every partition holding several part files.
+
+        Returns:
+            Number of partitions compacted
+        """
+        compacted = sum(self.compact_partition(path) for path in self.partitions())
+        if compacted:
+            logger.info(f"🗜️ Compacted {compacted} partitions of {self.root}")
+        return compacted
+
+    def scan(self) -> pl.LazyFrame:
+        """Lazily scan the whole table, partition column included."""
+        return pl.scan_parquet(self.root, hive_partitioning=True)
+
+    def import_file(self, path: Path, batch_id: str = "imported") -> dict[str, int]:
+        """
+        Move a single-file table (the pre-store layout) into the store.
+
+        Args:
+            path: Parquet file holding the whole table; it is removed once its
+                rows are stored
+            batch_id: Batch name of the imported rows
+        """
+        imported = self.staging_dir / Path(path).name
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        os.replace(path, imported)
+        stats = self.upsert(pl.read_parquet(imported), batch_id)
+        imported.unlink()
+        return stats
+
+    def drop(self) -> None:
+        """Delete the whole table."""
+        shutil.rmtree(self.root, ignore_errors=True)
@@ -1,21 +1,38 @@
 """
 This script processes the gold layer (cleaned stage) for a given date.
 - Use --date to select the date partition (default: today).
+- fact_matches is merged into a date-partitioned store keeping all history;
+  --overwrite replaces it with the date's rows, --compact merges small files.
+- dim_players and dim_clubs also keep an SCD type 2 history
+  (<dimension>_history.parquet); --no-history skips it. A --date older than
+  the history (a backfill) updates the snapshots but not the history.
+- Independent tables are built concurrently; --workers sets the thread count.
 - Intended for batch, Airflow, or ad-hoc runs.
 - For full pipeline, use unified_main.py.
 """
 
 import argparse
 import logging
+from functools import partial
 from typing import Optional
 
+import polars as pl
+
 from brawlstar_project.processing.cleaned import (
+    DimBattlesProcessor,
     DimClubsProcessor,
     DimGameModesProcessor,
     DimMapsProcessor,
     DimPlayersProcessor,
     FactMatchesProcessor,
 )
+from brawlstar_project.processing.cleaned.build_context import GoldBuildContext
+from brawlstar_project.processing.cleaned.dag import (
+    DagTask,
+    TaskResult,
+    raise_on_failure,
+    run_dag,
+)
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
@@ -23,32 +40,97 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def process_gold_layer(date: Optional[str] = None):
-    """Process complete gold layer (fact + all dimensions)."""
+def process_gold_layer(
+    date: Optional[str] = None,
+    incremental: bool = True,
+    compact: bool = False,
+    history: bool = True,
+    max_workers: Optional[int] = None,
+    frames: Optional[dict[str, pl.DataFrame]] = None,
+) -> dict[str, TaskResult]:
+    """
+    Process complete gold layer (fact + all dimensions).
+
+    The build runs as a small DAG (see ``run_dag``): one task loads each
+    processed source into memory once, with only the columns the processors
+    declare in ``source_columns`` (see ``GoldBuildContext.load``), then
+    every table is built and saved by its own processor task as soon as its
+    sources are loaded, independent tables running concurrently, followed by
+    the optional compactions. Every task is timed, and a failing task only
+    skips the tasks depending on it; callers check the returned statuses
+    (see ``raise_on_failure``).
+
+    Args:
+        date: Date partition to process (YYYY-MM-DD). Defaults to today.
+        incremental: Merge fact_matches into its partitioned store instead of
+            overwriting it with the date's rows
+        compact: Compact every fact_matches and dim_battles partition afterwards
+        history: Merge dim_players and dim_clubs into their SCD type 2 history
+        max_workers: Number of threads running independent tasks
+        frames: Processed daily file name -> DataFrame already in memory
+            (see ``GoldBuildContext``)
+
+    Returns:
+        Task name -> result (status and wall time)
+    """
     logger.info(f"Processing complete gold layer for date: {date or 'today'}")
 
-    # Process fact table first
-    logger.info("Processing fact_matches table...")
-    fact_processor = FactMatchesProcessor(date)
-    fact_processor.process()
-
-    # Then process all dimensions
-    logger.info("Processing dimension tables...")
-    dimension_processors = [
-        DimPlayersProcessor(date),
-        DimClubsProcessor(date),
-        DimGameModesProcessor(date),
-        DimMapsProcessor(date),
-    ]
+    context = GoldBuildContext(date, frames=frames)
+    fact_processor = FactMatchesProcessor(
+        date, incremental=incremental, context=context
+    )
+    battles_processor = DimBattlesProcessor(date, context=context)
+    processors = {
+        "fact_matches": fact_processor,
+        "dim_players": DimPlayersProcessor(date, history=history, context=context),
+        "dim_clubs": DimClubsProcessor(date, history=history, context=context),
+        "dim_game_modes": DimGameModesProcessor(date, context=context),
+        "dim_maps": DimMapsProcessor(date, context=context),
+        "dim_battles": battles_processor,
+    }
 
-    for processor in dimension_processors:
-        try:
-            logger.info(f"Processing {processor.get_dimension_name()}...")
-            processor.process()
-        except Exception as e:
-            logger.error(f"Error processing {processor.get_dimension_name()}: {e}")
+    # Each source is loaded once, with the columns of every processor using it
+    source_columns: dict[str, set[str]] = {}
+    for processor in processors.values():
+        for filename, columns in processor.source_columns.items():
+            source_columns.setdefault(filename, set()).update(columns)
+    tasks = [
+        DagTask(
+            f"load {filename}",
+            partial(context.load, filename, columns=sorted(columns)),
+            outputs=(filename,),
+        )
+        for filename, columns in sorted(source_columns.items())
+    ]
+    tasks += [
+        DagTask(
+            name,
+            processor.process,
+            inputs=tuple(processor.source_columns),
+            outputs=(name,),
+        )
+        for name, processor in processors.items()
+    ]
+    if compact:
+        if incremental:
+            tasks.append(
+                DagTask(
+                    "compact fact_matches",
+                    fact_processor.get_store().compact,
+                    inputs=("fact_matches",),
+                )
+            )
+        tasks.append(
+            DagTask(
+                "compact dim_battles",
+                battles_processor.get_store().compact,
+                inputs=("dim_battles",),
+            )
+        )
 
+    results = run_dag(tasks, max_workers=max_workers)
     logger.info("Gold layer processing complete!")
+    return results
 
 
 def main():
@@ -57,9 +139,40 @@ def main():
         "--date",
         help="Date partition to process (YYYY-MM-DD). Defaults to today.",
     )
+    parser.add_argument(
+        "--overwrite",
+        action="store_true",
+        help="Overwrite fact_matches with this date's rows instead of merging",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Compact the fact_matches store after processing",
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help=(
+            "Do not merge dim_players and dim_clubs into their history "
+            "(always skipped for dates older than the history)"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of threads running independent tables (default: auto)",
+    )
     args = parser.parse_args()
 
-    process_gold_layer(args.date)
+    results = process_gold_layer(
+        args.date,
+        incremental=not args.overwrite,
+        compact=args.compact,
+        history=not args.no_history,
+        max_workers=args.workers,
+    )
+    # Exit non-zero (e.g. for Airflow) when a table was not built
+    raise_on_failure(results)
 
 
 if __name__ == "__main__":
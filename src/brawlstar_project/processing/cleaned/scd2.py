@@ -0,0 +1,256 @@
+"""
+Slowly changing dimension (type 2) history for dimension tables.
+
+Every version of an entity is a row with the day it became valid
+(``valid_from``) and the day it was superseded (``valid_to``, null while it
+is current). The table is a directory partitioned on ``is_current``, with
+both dates stored in the files:
+
+    data/cleaned/dim_players_history.parquet/is_current=true/current.parquet
+    data/cleaned/dim_players_history.parquet/is_current=false/closed-2025-07-12.parquet
+
+Current rows, one per entity, live in ``current.parquet``; each daily merge
+compares the day's snapshot with them only, by hashing the tracked columns,
+so its cost does not grow with history. Versions closed that day are written
+to that day's ``closed-<date>.parquet``. A point-in-time lookup only reads
+the files of versions closed after that day.
+
+DuckDB reads the table with ``read_parquet('<table>/*/*.parquet',
+hive_partitioning = true)``.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Sequence
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+VALID_FROM = "valid_from"
+VALID_TO = "valid_to"
+IS_CURRENT = "is_current"
+CURRENT_FILENAME = "current.parquet"
+CLOSED_PREFIX = "closed-"
+
+
+def _to_date(date: str) -> pl.Expr:
+    return pl.lit(date).str.strptime(pl.Date, "%Y-%m-%d")
+
+
+class SCD2Store:
+    """
+    Type 2 history of a dimension, merged from daily snapshots.
+
+    Args:
+        root: Table directory (e.g. ``dim_players_history.parquet``)
+        key: Columns identifying an entity
+        tracked: Columns whose changes open a new version; other columns are
+            carried along with the version
+    """
+
+    def __init__(self, root: Path, key: Sequence[str], tracked: Sequence[str]):
+        self.root = Path(root)
+        self.key = list(key)
+        self.tracked = list(tracked)
+        self.staging_dir = self.root.with_name(f".{self.root.name}.staging")
+
+    def _partition_dir(self, current: bool) -> Path:
+        return self.root / f"{IS_CURRENT}={str(current).lower()}"
+
+    @property
+    def current_path(self) -> Path:
+        """File holding the current version of every entity."""
+        return self._partition_dir(True) / CURRENT_FILENAME
+
+    def closed_path(self, date: str) -> Path:
+        """File holding the versions closed on a date."""
+        return self._partition_dir(False) / f"{CLOSED_PREFIX}{date}.parquet"
+
+    def closed_dates(self) -> list[str]:
+        """Dates on which versions were closed, oldest first."""
+        closed_dir = self._partition_dir(False)
+        if not closed_dir.is_dir():
+            return []
+        return sorted(
+            path.stem[len(CLOSED_PREFIX) :]
+            for path in closed_dir.glob(f"{CLOSED_PREFIX}*.parquet")
+        )
+
+    def _publish(self, df: pl.DataFrame, target: Path) -> None:
+        """Write a file atomically, staging it outside the table."""
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.staging_dir / f"{os.getpid()}-{target.name}"
+        df.write_parquet(tmp_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, target)
+
+    def current(self) -> pl.DataFrame:
+        """Current version of every entity (empty if nothing was merged yet)."""
+        if not self.current_path.exists():
+            return pl.DataFrame()
+        return pl.read_parquet(self.current_path, hive_partitioning=False)
+
+    def latest_date(self) -> Optional[str]:
+        """Day the newest current version became valid, or None if empty."""
+        if not self.current_path.exists():
+            return None
+        latest = (
+            pl.scan_parquet(self.current_path, hive_partitioning=False)
+            .select(pl.col(VALID_FROM).max())
+            .collect()
+            .item()
+        )
+        return None if latest is None else str(latest)
+
+    def _row_hash(self) -> pl.Expr:
+        return pl.struct(self.tracked).hash().alias("_row_hash")
+
+    def _align_tracked(
+        self, snapshot: pl.DataFrame, current: pl.DataFrame
+    ) -> tuple[pl.DataFrame, pl.DataFrame]:
+        """
+        Cast the tracked columns of both sides to common dtypes.
+
+        Struct hashes depend on the dtypes: an all-null column typed Null on
+        one side and String on the other would look like a change.
+        """
+        snapshot_casts, current_casts = {}, {}
+        for column in self.tracked:
+            left, right = snapshot.schema[column], current.schema[column]
+            if left == right:
+                continue
+            if left == pl.Null:
+                snapshot_casts[column] = right
+            elif right == pl.Null:
+                current_casts[column] = left
+            else:
+                snapshot_casts[column] = right
+        return snapshot.cast(snapshot_casts), current.cast(current_casts)
+
+    def merge(self, snapshot: pl.DataFrame, date: str) -> dict[str, int]:
+        """
+        Merge one day's snapshot into the history.
+
+        Entities whose tracked columns changed get their current version
+        closed on ``date`` and a new version valid from ``date``; new entities
+        get a first version. Entities missing from the snapshot keep their
+        current version. Merging the same day again is idempotent.
+
+        Args:
+            snapshot: One row per entity, with the key and tracked columns
+            date: Snapshot date (YYYY-MM-DD); dates must be merged in order
+
+        Returns:
+            Stats: entities inserted, changed and unchanged
+
+        Raises:
+            ValueError: If ``date`` is older than the history (see
+                ``latest_date``)
+        """
+        snapshot = snapshot.unique(subset=self.key, keep="last", maintain_order=True)
+        current = self.current()
+        new_versions = snapshot.with_columns(
+            _to_date(date).alias(VALID_FROM),
+            pl.lit(None, dtype=pl.Date).alias(VALID_TO),
+        )
+
+        if current.is_empty():
+            stats = {"inserted": snapshot.height, "changed": 0, "unchanged": 0}
+            self._publish(new_versions, self.current_path)
+            self._log(date, stats)
+            return stats
+
+        last_date = current[VALID_FROM].max()
+        if last_date is not None and str(last_date) > date:
+            raise ValueError(
+                f"Cannot merge {date} into {self.root}: history is at {last_date}"
+            )
+
+        # Hashes are computed on both sides at merge time, never stored: they
+        # only have to agree within one Polars version
+        left, right = self._align_tracked(snapshot, current)
+        compared = left.select(*self.key, self._row_hash()).join(
+            right.select(*self.key, self._row_hash(), VALID_FROM),
+            on=self.key,
+            how="left",
+            suffix="_current",
+            nulls_equal=True,
+        )
+        inserted = compared.filter(pl.col("_row_hash_current").is_null())
+        changed = compared.filter(
+            pl.col("_row_hash_current").is_not_null()
+            & (pl.col("_row_hash") != pl.col("_row_hash_current"))
+        )
+        stats = {
+            "inserted": inserted.height,
+            "changed": changed.height,
+            "unchanged": snapshot.height - inserted.height - changed.height,
+        }
+        if not stats["inserted"] and not stats["changed"]:
+            self._log(date, stats)
+            return stats
+
+        # A version opened on this very date is replaced, not closed
+        replaced = current.join(changed.select(self.key), on=self.key, how="semi")
+        closed = replaced.filter(pl.col(VALID_FROM) < _to_date(date)).with_columns(
+            _to_date(date).alias(VALID_TO)
+        )
+        if not closed.is_empty():
+            closed_path = self.closed_path(date)
+            if closed_path.exists():
+                previous = pl.read_parquet(closed_path, hive_partitioning=False)
+                closed = pl.concat([previous, closed], how="diagonal_relaxed").unique(
+                    subset=[*self.key, VALID_FROM], keep="last", maintain_order=True
+                )
+            self._publish(closed, closed_path)
+
+        opened = new_versions.join(
+            pl.concat([inserted, changed]).select(self.key), on=self.key, how="semi"
+        )
+        kept = current.join(replaced.select(self.key), on=self.key, how="anti")
+        self._publish(
+            pl.concat([kept, opened], how="diagonal_relaxed"), self.current_path
+        )
+        self._log(date, stats)
+        return stats
+
+    def _log(self, date: str, stats: dict[str, int]) -> None:
+        logger.info(
+            f"🕰️ {self.root.name} {date}: {stats['inserted']} new, "
+            f"{stats['changed']} changed, {stats['unchanged']} unchanged"
+        )
+
+    def _scan_versions(self, closed_after: Optional[str] = None) -> pl.LazyFrame:
+        """Scan the current versions and those closed after a date (or all)."""
+        paths = [
+            self.closed_path(date)
+            for date in self.closed_dates()
+            if closed_after is None or date > closed_after
+        ]
+        if self.current_path.exists():
+            paths.append(self.current_path)
+        if not paths:
+            return pl.LazyFrame(schema={VALID_FROM: pl.Date, VALID_TO: pl.Date})
+        # Concatenated on the union of their columns: snapshots may gain some
+        return pl.concat(
+            [pl.scan_parquet(path, hive_partitioning=False) for path in paths],
+            how="diagonal_relaxed",
+        )
+
+    def scan(self) -> pl.LazyFrame:
+        """Lazily scan every version, closed and current."""
+        return self._scan_versions()
+
+    def as_of(self, date: str) -> pl.LazyFrame:
+        """
+        Versions valid on a date, one per entity existing then.
+
+        Files of versions closed on or before ``date`` are not read.
+        """
+        day = _to_date(date)
+        return self._scan_versions(closed_after=date).filter(
+            (pl.col(VALID_TO).is_null() | (pl.col(VALID_TO) > day))
+            & (pl.col(VALID_FROM) <= day)
+        )
@@ -1,11 +1,20 @@
+import asyncio
 import logging
-import time
 from abc import abstractmethod
+from typing import Optional
 
 from brawlstar_project.entities.club import Club
 from brawlstar_project.entities.player import Player
 from brawlstar_project.processing.factory.base_factory import BaseFactory, BaseRunner
 from brawlstar_project.processing.ingested.api_client import BrawlStarsClient
+from brawlstar_project.processing.ingested.async_client import AsyncBrawlStarsClient
+from brawlstar_project.processing.ingested.journal import CheckpointJournal
+from brawlstar_project.processing.ingested.planner import (
+    IngestionPlan,
+    IngestionPlanner,
+    IngestionTask,
+)
+from brawlstar_project.processing.ingested.retry import counts_retries
 from brawlstar_project.processing.utils import (
     fetch_club_data,
     fetch_club_members_data,
@@ -41,6 +50,7 @@ class PlayerRunner(IngestionRunner):
     Runner for a single player.
     """
 
+    @counts_retries
     def run(self, client: BrawlStarsClient, tag: str, delay: float = 1.0) -> dict:
         logger.info(f"👤 Processing single player: {tag}")
         try:
@@ -67,6 +77,7 @@ class ClubRunner(IngestionRunner):
     Runner for a single club (info + members).
     """
 
+    @counts_retries
     def run(self, client: BrawlStarsClient, tag: str, delay: float = 1.0) -> dict:
         logger.info(f"🏛️ Processing single club: {tag}")
         try:
@@ -91,56 +102,34 @@ class ClubRunner(IngestionRunner):
 class ClubWithMembersRunner(IngestionRunner):
     """
     Runner for club and all its members.
+
+    Delegates to ``IngestionPlanner`` so the member list is fetched once and
+    each member's player and battlelog are fetched exactly once.
     """
 
+    @counts_retries
     def run(self, client: BrawlStarsClient, tag: str, delay: float = 1.0) -> dict:
         logger.info(f"🏛️ Processing club with all members: {tag}")
         try:
             club = Club(tag)
+            planner = IngestionPlanner(client)
 
-            logger.info("  📋 Fetching club data...")
-            fetch_club_data(client, club)
-
-            logger.info("  👥 Fetching club members data...")
-            club_members_data = fetch_club_members_data(client, club)
+            plan = planner.plan(club_tags=[club.tag])
+            if IngestionTask("club_members", club.tag) in plan.failed:
+                raise RuntimeError(f"could not fetch members of {club.tag}")
 
-            member_tags = [
-                member["tag"]
-                for member in club_members_data.get("items", [])
-                if "tag" in member
-            ]
+            member_tags = plan.members_by_club.get(club.tag, [])
             logger.info(f"  🎯 Found {len(member_tags)} club members to process")
 
-            successful, failed = 0, 0
+            planner.execute(plan, delay=delay)
 
-            for i, member_tag in enumerate(member_tags, 1):
-                logger.info(
-                    f"\n  👤 Processing member {i}/{len(member_tags)}: {member_tag}"
-                )
-                try:
-                    player = Player(member_tag)
-
-                    player_data = client.get_player(player.formatted_tag)
-                    save_player_data_partitioned(player_data, player.tag)
-
-                    battlelog_data = client.get_battlelog(player.formatted_tag)
-                    save_battlelog_data_partitioned(battlelog_data, player.tag)
-
-                    logger.info(f"    ✅ Completed data fetch for {member_tag}")
-                    successful += 1
-
-                    if i < len(member_tags):
-                        logger.info(f"    ⏳ Waiting {delay}s before next API call...")
-                        time.sleep(delay)
-
-                except Exception as e:
-                    logger.error(f"    ❌ Error processing {member_tag}: {e}")
-                    failed += 1
+            failed_tags = planner.failed_tags(plan, {"player", "battlelog"})
+            failed = sum(1 for member_tag in member_tags if member_tag in failed_tags)
 
             return {
                 "status": "success",
                 "total": len(member_tags),
-                "successful": successful,
+                "successful": len(member_tags) - failed,
                 "failed": failed,
             }
 
@@ -149,6 +138,82 @@ class ClubWithMembersRunner(IngestionRunner):
             return {"status": "error", "error": str(e)}
 
 
+class AsyncClubWithMembersRunner(IngestionRunner):
+    """
+    Async runner for clubs and all their members.
+
+    Requests are fanned out concurrently, bounded by ``concurrency`` in-flight
+    API calls, instead of fetching members one by one with a fixed sleep.
+    Like ``ClubWithMembersRunner``, it runs the de-duplicated task set of an
+    ``IngestionPlanner``: a member of several clubs is fetched once.
+
+    Args:
+        concurrency: Maximum number of in-flight API calls
+        journal: Checkpoint journal recording each completed task
+        resume: Skip tasks already in the journal or saved today
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 10,
+        journal: Optional[CheckpointJournal] = None,
+        resume: bool = False,
+    ):
+        self.concurrency = concurrency
+        self.journal = journal
+        self.resume = resume
+
+    @counts_retries
+    def run(
+        self,
+        client: AsyncBrawlStarsClient,  # type: ignore[override]
+        tag: str,
+        delay: float = 1.0,
+    ) -> dict:
+        """Synchronous entry point; ``delay`` is ignored in favour of concurrency."""
+        return asyncio.run(self.run_many(client, [tag]))[0]
+
+    async def run_many(
+        self, client: AsyncBrawlStarsClient, tags: list[str]
+    ) -> list[dict]:
+        """
+        Ingest several clubs concurrently, sharing one concurrency limit.
+
+        Returns:
+            list[dict]: one result per club tag, in input order
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        planner = IngestionPlanner(client, journal=self.journal, resume=self.resume)
+        logger.info(f"🏛️ Processing {len(tags)} clubs with all members (async)")
+        async with client:
+            plan = await planner.plan_async(club_tags=tags, semaphore=semaphore)
+            await planner.execute_async(plan, semaphore=semaphore)
+        return [self._club_result(planner, plan, tag) for tag in tags]
+
+    @staticmethod
+    def _club_result(planner: IngestionPlanner, plan: IngestionPlan, tag: str) -> dict:
+        try:
+            club = Club(tag)
+        except ValueError as e:
+            return {"status": "error", "error": str(e)}
+        for endpoint in ("club_members", "club"):
+            if IngestionTask(endpoint, club.tag) in plan.failed:
+                return {
+                    "status": "error",
+                    "error": f"could not fetch {endpoint} of {club.tag}",
+                }
+
+        member_tags = plan.members_by_club.get(club.tag, [])
+        failed_tags = planner.failed_tags(plan, {"player", "battlelog"})
+        failed = sum(1 for member_tag in member_tags if member_tag in failed_tags)
+        return {
+            "status": "success",
+            "total": len(member_tags),
+            "successful": len(member_tags) - failed,
+            "failed": failed,
+        }
+
+
 class RunnerFactory(BaseFactory):
     """
     Factory to obtain the appropriate IngestionRunner based on mode.
@@ -160,3 +225,4 @@ class RunnerFactory(BaseFactory):
         self.register("player", PlayerRunner)
         self.register("club", ClubRunner)
         self.register("club-players", ClubWithMembersRunner)
+        self.register("club-players-async", AsyncClubWithMembersRunner)
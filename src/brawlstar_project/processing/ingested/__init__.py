@@ -1,4 +1,22 @@
 from .api_client import BrawlStarsClient
+from .async_client import AsyncBrawlStarsClient
+from .cache import ResponseCache
 from .config import ConfigLoader
+from .journal import CheckpointJournal
+from .planner import IngestionPlan, IngestionPlanner, IngestionTask
+from .rate_limiter import TokenBucketRateLimiter
+from .retry import RetryBudget, RetryPolicy
 
-__all__ = ["BrawlStarsClient", "ConfigLoader"]
+__all__ = [
+    "BrawlStarsClient",
+    "AsyncBrawlStarsClient",
+    "CheckpointJournal",
+    "ConfigLoader",
+    "IngestionPlan",
+    "IngestionPlanner",
+    "IngestionTask",
+    "ResponseCache",
+    "TokenBucketRateLimiter",
+    "RetryBudget",
+    "RetryPolicy",
+]
@@ -1,41 +1,167 @@
+import logging
+import time
 from dataclasses import dataclass, field
+from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import ResponseCache
+from .rate_limiter import TokenBucketRateLimiter, parse_retry_after
+from .retry import RetryBudget, RetryPolicy, record_retry, retry_delay
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class BrawlStarsClient:
+    """
+    Synchronous Brawl Stars API client backed by a pooled, keep-alive session.
+
+    The client owns a single ``requests.Session`` so every call reuses the same
+    TCP+TLS connections. Use it as a context manager to release the pool at the
+    end of a run. An optional ``TokenBucketRateLimiter`` paces every call and
+    backs off on HTTP 429. Transient failures (5xx, 429, timeouts and
+    connection errors) are retried according to ``retry_policy``, within an
+    optional run-wide ``retry_budget``:
+
+        limiter = TokenBucketRateLimiter(rate=10, burst=10)
+        with BrawlStarsClient(api_key, base_url, rate_limiter=limiter) as client:
+            client.get_player("%23TAG")
+    """
+
     api_key: str
     base_url: str
+    pool_size: int = 10
+    timeout: float = 10.0
+    rate_limiter: Optional[TokenBucketRateLimiter] = None
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    retry_budget: Optional[RetryBudget] = None
+    cache: Optional[ResponseCache] = None
     headers: dict = field(init=False)
+    session: requests.Session = field(init=False, repr=False)
 
     def __post_init__(self):
         self.base_url = self.base_url.rstrip("/")
         self.headers = {"Authorization": f"Bearer {self.api_key}"}
+        self.session = self._build_session()
 
-    def _get(self, path: str) -> dict:
+    def _build_session(self) -> requests.Session:
+        """
+        Build a session with a sized connection pool.
+
+        Transport-level retries are disabled: every retry goes through
+        ``_get``, so it follows ``retry_policy`` and counts against
+        ``retry_budget``.
+
+        Returns:
+            Configured requests.Session
+        """
+        retry = Retry(total=0, raise_on_status=False)
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self.headers)
+        session.headers["Connection"] = "keep-alive"
+        return session
+
+    def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "BrawlStarsClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _get(
+        self, path: str, endpoint: Optional[str] = None, tag: Optional[str] = None
+    ) -> dict:
         """
         Internal helper to perform GET requests.
 
         Args:
             path: URL path (starting without /)
+            endpoint: Endpoint name used as response cache key
+            tag: Entity tag used as response cache key
 
         Returns:
-            Parsed JSON response as a Python dictionary.
+            Parsed JSON response as a Python dictionary, or a CachedPayload
+            when served from the response cache.
         """
+        cache = self.cache if endpoint is not None and tag is not None else None
+        request_headers = {}
+        if cache is not None:
+            cached, etag = cache.lookup(endpoint, tag)  # type: ignore[arg-type]
+            if cached is not None:
+                return cached
+            if etag:
+                request_headers["If-None-Match"] = etag
         url = f"{self.base_url}/{path.lstrip('/')}"
-        resp = requests.get(url, headers=self.headers)
+        limiter = self.rate_limiter
+        for attempt in range(self.retry_policy.max_attempts):
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                resp = self.session.get(
+                    url, timeout=self.timeout, headers=request_headers
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not self._can_retry(attempt):
+                    raise
+                logger.warning(f"    🔁 Retrying {path} after error: {e}")
+                time.sleep(retry_delay(self.retry_policy, attempt))
+                continue
+            if not self.retry_policy.should_retry_status(
+                resp.status_code
+            ) or not self._can_retry(attempt):
+                break
+            logger.warning(f"    🔁 Retrying {path} after HTTP {resp.status_code}")
+            time.sleep(
+                retry_delay(
+                    self.retry_policy,
+                    attempt,
+                    status_code=resp.status_code,
+                    retry_after=parse_retry_after(resp.headers.get("Retry-After")),
+                    rate_limiter=limiter,
+                )
+            )
+        if limiter is not None and resp.ok:
+            limiter.on_success()
+        if cache is not None and resp.status_code == 304:
+            return cache.revalidated(endpoint, tag)  # type: ignore[arg-type]
         resp.raise_for_status()
-        return resp.json()
+        data = resp.json()
+        if cache is not None:
+            cache.record_miss(endpoint)  # type: ignore[arg-type]
+            cache.store(endpoint, tag, data, resp.headers.get("ETag"))  # type: ignore[arg-type]
+        return data
+
+    def _can_retry(self, attempt: int) -> bool:
+        """Check attempts left and consume one retry from the run budget."""
+        if attempt + 1 >= self.retry_policy.max_attempts:
+            return False
+        if self.retry_budget is not None and not self.retry_budget.try_consume():
+            logger.warning("    ⚠️ Retry budget exhausted, not retrying")
+            return False
+        record_retry()
+        return True
 
     def get_player(self, player_tag: str) -> dict:
-        return self._get(f"players/{player_tag}")
+        return self._get(f"players/{player_tag}", "player", player_tag)
 
     def get_battlelog(self, player_tag: str) -> dict:
-        return self._get(f"players/{player_tag}/battlelog")
+        return self._get(f"players/{player_tag}/battlelog", "battlelog", player_tag)
 
     def get_club(self, club_tag: str) -> dict:
-        return self._get(f"clubs/{club_tag}")
+        return self._get(f"clubs/{club_tag}", "club", club_tag)
 
     def get_club_members(self, club_tag: str) -> dict:
-        return self._get(f"clubs/{club_tag}/members")
+        return self._get(f"clubs/{club_tag}/members", "club_members", club_tag)
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Optional
+
+import httpx
+
+from .cache import ResponseCache
+from .rate_limiter import TokenBucketRateLimiter, parse_retry_after
+from .retry import RetryBudget, RetryPolicy, record_retry, retry_delay
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AsyncBrawlStarsClient:
+    """
+    Asynchronous Brawl Stars API client, sibling of ``BrawlStarsClient``.
+
+    Exposes the same ``get_*`` surface as coroutines. The underlying
+    ``httpx.AsyncClient`` is created lazily inside the running event loop and
+    released by ``aclose()``, so a client can be reused across ``asyncio.run``
+    calls. Rate limiting and retries behave like the sync client, and a
+    ``TokenBucketRateLimiter`` or ``RetryBudget`` can be shared with it:
+
+        limiter = TokenBucketRateLimiter(rate=10, burst=10)
+        async with AsyncBrawlStarsClient(
+            api_key, base_url, rate_limiter=limiter
+        ) as client:
+            await client.get_player("%23TAG")
+    """
+
+    api_key: str
+    base_url: str
+    pool_size: int = 10
+    timeout: float = 10.0
+    rate_limiter: Optional[TokenBucketRateLimiter] = None
+    retry_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    retry_budget: Optional[RetryBudget] = None
+    cache: Optional[ResponseCache] = None
+    headers: dict = field(init=False)
+    _http: Optional[httpx.AsyncClient] = field(init=False, default=None, repr=False)
+
+    def __post_init__(self):
+        self.base_url = self.base_url.rstrip("/")
+        self.headers = {"Authorization": f"Bearer {self.api_key}"}
+
+    def _build_http_client(self) -> httpx.AsyncClient:
+        """
+        Build an httpx client with a sized keep-alive pool.
+
+        Returns:
+            Configured httpx.AsyncClient
+        """
+        limits = httpx.Limits(
+            max_connections=self.pool_size,
+            max_keepalive_connections=self.pool_size,
+        )
+        # No transport retries: every retry goes through the retry policy and budget
+        transport = httpx.AsyncHTTPTransport(retries=0, limits=limits)
+        return httpx.AsyncClient(
+            base_url=self.base_url + "/",
+            headers=self.headers,
+            transport=transport,
+            timeout=self.timeout,
+        )
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = self._build_http_client()
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "AsyncBrawlStarsClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def _get(
+        self, path: str, endpoint: Optional[str] = None, tag: Optional[str] = None
+    ) -> dict:
+        """
+        Internal helper to perform GET requests.
+
+        Args:
+            path: URL path (starting without /)
+            endpoint: Endpoint name used as response cache key
+            tag: Entity tag used as response cache key
+
+        Returns:
+            Parsed JSON response as a Python dictionary, or a CachedPayload
+            when served from the response cache.
+        """
+        cache = self.cache if endpoint is not None and tag is not None else None
+        request_headers = {}
+        if cache is not None:
+            cached, etag = cache.lookup(endpoint, tag)  # type: ignore[arg-type]
+            if cached is not None:
+                return cached
+            if etag:
+                request_headers["If-None-Match"] = etag
+        limiter = self.rate_limiter
+        for attempt in range(self.retry_policy.max_attempts):
+            if limiter is not None:
+                await limiter.acquire_async()
+            try:
+                resp = await self.http.get(path.lstrip("/"), headers=request_headers)
+            except httpx.TransportError as e:
+                if not self._can_retry(attempt):
+                    raise
+                logger.warning(f"    🔁 Retrying {path} after error: {e!r}")
+                await asyncio.sleep(retry_delay(self.retry_policy, attempt))
+                continue
+            if not self.retry_policy.should_retry_status(
+                resp.status_code
+            ) or not self._can_retry(attempt):
+                break
+            logger.warning(f"    🔁 Retrying {path} after HTTP {resp.status_code}")
+            await asyncio.sleep(
+                retry_delay(
+                    self.retry_policy,
+                    attempt,
+                    status_code=resp.status_code,
+                    retry_after=parse_retry_after(resp.headers.get("Retry-After")),
+                    rate_limiter=limiter,
+                )
+            )
+        if limiter is not None and resp.is_success:
+            limiter.on_success()
+        if cache is not None and resp.status_code == 304:
+            return cache.revalidated(endpoint, tag)  # type: ignore[arg-type]
+        resp.raise_for_status()
+        data = resp.json()
+        if cache is not None:
+            cache.record_miss(endpoint)  # type: ignore[arg-type]
+            cache.store(endpoint, tag, data, resp.headers.get("ETag"))  # type: ignore[arg-type]
+        return data
+
+    def _can_retry(self, attempt: int) -> bool:
+        """Check attempts left and consume one retry from the run budget."""
+        if attempt + 1 >= self.retry_policy.max_attempts:
+            return False
+        if self.retry_budget is not None and not self.retry_budget.try_consume():
+            logger.warning("    ⚠️ Retry budget exhausted, not retrying")
+            return False
+        record_retry()
+        return True
+
+    async def get_player(self, player_tag: str) -> dict:
+        return await self._get(f"players/{player_tag}", "player", player_tag)
+
+    async def get_battlelog(self, player_tag: str) -> dict:
+        return await self._get(
+            f"players/{player_tag}/battlelog", "battlelog", player_tag
+        )
+
+    async def get_club(self, club_tag: str) -> dict:
+        return await self._get(f"clubs/{club_tag}", "club", club_tag)
+
+    async def get_club_members(self, club_tag: str) -> dict:
+        return await self._get(f"clubs/{club_tag}/members", "club_members", club_tag)
@@ -0,0 +1,127 @@
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached response stays fresh, per endpoint.
+# 0 means "always revalidate with If-None-Match", None means "never cache".
+DEFAULT_CACHE_TTLS: dict[str, Optional[float]] = {
+    "player": 0,
+    "battlelog": None,
+    "club": 6 * 3600,
+    "club_members": 6 * 3600,
+}
+
+
+class CachedPayload(dict):
+    """API payload served from the response cache instead of the network."""
+
+    from_cache = True
+
+
+def is_cache_hit(data: dict) -> bool:
+    """Check whether a payload returned by a client came from the cache."""
+    return getattr(data, "from_cache", False)
+
+
+class ResponseCache:
+    """
+    On-disk HTTP response cache keyed by endpoint and tag.
+
+    Entries live in ``<cache_dir>/<endpoint>/<tag>.json`` with the response
+    body, its ETag and the time it was stored. Fresh entries are served without
+    a request; stale entries with an ETag are revalidated with If-None-Match.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttls: Optional[dict[str, Optional[float]]] = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.ttls = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "bytes_saved": 0}
+        self._lock = threading.Lock()
+
+    def _entry_path(self, endpoint: str, tag: str) -> Path:
+        clean_tag = tag.replace("%23", "").replace("#", "")
+        return self.cache_dir / endpoint / f"{clean_tag}.json"
+
+    def _count(self, key: str, nbytes: int = 0) -> None:
+        with self._lock:
+            self.stats[key] += 1
+            self.stats["bytes_saved"] += nbytes
+
+    def is_cacheable(self, endpoint: str) -> bool:
+        return self.ttls.get(endpoint) is not None
+
+    def _read_entry(self, endpoint: str, tag: str) -> Optional[dict]:
+        path = self._entry_path(endpoint, tag)
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+    def lookup(self, endpoint: str, tag: str) -> tuple[Optional[dict], Optional[str]]:
+        """
+        Look up a cached response.
+
+        Args:
+            endpoint: Endpoint name (e.g. "club", "battlelog")
+            tag: Entity tag, with or without "#"/"%23"
+
+        Returns:
+            (fresh payload or None, ETag to revalidate with or None)
+        """
+        if not self.is_cacheable(endpoint):
+            return None, None
+        entry = self._read_entry(endpoint, tag)
+        if entry is None:
+            return None, None
+        age = time.time() - entry.get("stored_at", 0)
+        if age < self.ttls[endpoint]:  # type: ignore[operator]
+            body = entry["body"]
+            self._count("hits", len(json.dumps(body)))
+            return CachedPayload(body), None
+        return None, entry.get("etag")
+
+    def revalidated(self, endpoint: str, tag: str) -> CachedPayload:
+        """
+        Refresh an entry after a 304 Not Modified and return its payload.
+        """
+        entry = self._read_entry(endpoint, tag) or {"body": {}}
+        self.store(endpoint, tag, entry["body"], entry.get("etag"))
+        self._count("revalidated", len(json.dumps(entry["body"])))
+        return CachedPayload(entry["body"])
+
+    def record_miss(self, endpoint: str) -> None:
+        if self.is_cacheable(endpoint):
+            self._count("misses")
+
+    def store(self, endpoint: str, tag: str, body: dict, etag: Optional[str]) -> None:
+        """Write an entry atomically (temp file + rename)."""
+        if not self.is_cacheable(endpoint):
+            return
+        path = self._entry_path(endpoint, tag)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"etag": etag, "stored_at": time.time(), "body": body}, f)
+        os.replace(tmp_path, path)
+
+    def log_stats(self) -> None:
+        logger.info(
+            f"🗄️ Response cache: {self.stats['hits']} hits, "
+            f"{self.stats['revalidated']} revalidated (304), "
+            f"{self.stats['misses']} misses, "
+            f"~{self.stats['bytes_saved'] / 1024:.1f} KiB not downloaded"
+        )
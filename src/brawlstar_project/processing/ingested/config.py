@@ -8,6 +8,13 @@ from dotenv import load_dotenv
 class ConfigLoader:
     api_key: str
     base_url: str = "https://api.brawlstars.com/v1/"
+    pool_size: int = 10
+    rate_limit: float = 10.0
+    rate_burst: int = 10
+    request_timeout: float = 10.0
+    max_attempts: int = 4
+    retry_budget: int = 200
+    response_cache: bool = True
 
     @classmethod
     def from_env(cls, env_file: str = ".env"):
@@ -15,11 +22,40 @@ class ConfigLoader:
 
         api_key = os.getenv("BRAWLSTARS_API_KEY")
         base_url = os.getenv("BRAWLSTARS_BASE_URL", "https://api.brawlstars.com/v1/")
+        pool_size = int(os.getenv("BRAWLSTARS_POOL_SIZE", "10"))
+        rate_limit = float(os.getenv("BRAWLSTARS_RATE_LIMIT", "10"))
+        rate_burst = int(os.getenv("BRAWLSTARS_RATE_BURST", "10"))
+        request_timeout = float(os.getenv("BRAWLSTARS_REQUEST_TIMEOUT", "10"))
+        max_attempts = int(os.getenv("BRAWLSTARS_MAX_ATTEMPTS", "4"))
+        retry_budget = int(os.getenv("BRAWLSTARS_RETRY_BUDGET", "200"))
+        response_cache = os.getenv("BRAWLSTARS_RESPONSE_CACHE", "1") != "0"
 
-        config = cls(api_key, base_url=base_url)  # type: ignore
+        config = cls(
+            api_key,  # type: ignore
+            base_url=base_url,
+            pool_size=pool_size,
+            rate_limit=rate_limit,
+            rate_burst=rate_burst,
+            request_timeout=request_timeout,
+            max_attempts=max_attempts,
+            retry_budget=retry_budget,
+            response_cache=response_cache,
+        )
         config.validate()
         return config
 
     def validate(self):
         if not self.api_key:
             raise ValueError("BRAWLSTARS_API_KEY is missing in .env")
+        if self.pool_size < 1:
+            raise ValueError("BRAWLSTARS_POOL_SIZE must be at least 1")
+        if self.rate_limit <= 0:
+            raise ValueError("BRAWLSTARS_RATE_LIMIT must be positive")
+        if self.rate_burst < 1:
+            raise ValueError("BRAWLSTARS_RATE_BURST must be at least 1")
+        if self.request_timeout <= 0:
+            raise ValueError("BRAWLSTARS_REQUEST_TIMEOUT must be positive")
+        if self.max_attempts < 1:
+            raise ValueError("BRAWLSTARS_MAX_ATTEMPTS must be at least 1")
+        if self.retry_budget < 0:
+            raise ValueError("BRAWLSTARS_RETRY_BUDGET must be positive or zero")
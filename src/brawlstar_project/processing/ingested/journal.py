@@ -0,0 +1,62 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointJournal:
+    """
+    Append-only journal of the ingestion tasks completed on one date.
+
+    Each completed task is appended to ``<journal_dir>/<date>.jsonl`` as one
+    JSON line ``{"endpoint", "tag", "date"}`` and flushed to disk right away,
+    so a run that dies midway leaves an exact record of what it already saved.
+    """
+
+    def __init__(self, journal_dir: Path, date: Optional[str] = None):
+        self.journal_dir = Path(journal_dir)
+        self.date = date or datetime.today().strftime("%Y-%m-%d")
+        self.path = self.journal_dir / f"{self.date}.jsonl"
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, tag: str) -> None:
+        """
+        Append one completed task to the journal.
+
+        Args:
+            endpoint: Endpoint name (e.g. "player", "club_members")
+            tag: Normalized entity tag
+        """
+        line = json.dumps({"endpoint": endpoint, "tag": tag, "date": self.date})
+        with self._lock:
+            self.journal_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def completed(self) -> set[tuple[str, str]]:
+        """
+        Read the (endpoint, tag) pairs recorded for this date.
+
+        A truncated last line (process killed mid-write) is ignored.
+
+        Returns:
+            Set of (endpoint, tag) pairs
+        """
+        if not self.path.exists():
+            return set()
+        done = set()
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    done.add((entry["endpoint"], entry["tag"]))
+                except (ValueError, KeyError):
+                    logger.warning(f"Ignoring malformed journal line in {self.path}")
+        return done
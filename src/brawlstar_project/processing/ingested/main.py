@@ -4,11 +4,19 @@ For batch ingestion, use this script. For full pipeline, use unified_main.py.
 """
 
 import argparse
+import asyncio
 import logging
 
+from brawlstar_project.constants.paths import DATA_CACHE_DIR, DATA_JOURNAL_DIR
 from brawlstar_project.processing.factory.runner_factory import RunnerFactory
 from brawlstar_project.processing.ingested.api_client import BrawlStarsClient
+from brawlstar_project.processing.ingested.async_client import AsyncBrawlStarsClient
+from brawlstar_project.processing.ingested.cache import ResponseCache
 from brawlstar_project.processing.ingested.config import ConfigLoader
+from brawlstar_project.processing.ingested.journal import CheckpointJournal
+from brawlstar_project.processing.ingested.planner import IngestionPlanner
+from brawlstar_project.processing.ingested.rate_limiter import TokenBucketRateLimiter
+from brawlstar_project.processing.ingested.retry import RetryBudget, RetryPolicy
 from brawlstar_project.processing.utils.config_utils import (
     load_pipeline_config,
 )
@@ -27,15 +35,28 @@ def main():
     )
     parser.add_argument(
         "--mode",
-        choices=["player", "club", "club-players"],
+        choices=["player", "club", "club-players", "club-players-async"],
         required=True,
-        help="Ingestion mode: player (all players), club (all clubs), club-players (all clubs + all members)",
+        help="Ingestion mode: player (all players), club (all clubs), club-players (all clubs + all members), "
+        "club-players-async (same as club-players, fetched concurrently)",
     )
     parser.add_argument(
         "--delay",
         type=float,
         default=1.0,
-        help="Delay (in seconds) between API calls for club-players mode",
+        help="Delay (in seconds) between API calls in the sequential modes. "
+        "Ignored when the client is paced by the shared rate limiter.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Maximum number of in-flight API calls for club-players-async mode",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip tasks already completed today (checkpoint journal or saved files)",
     )
 
     args = parser.parse_args()
@@ -49,30 +70,73 @@ def main():
     club_tags = config.get("default_club_tags", [])
 
     config_env = ConfigLoader.from_env()
-    client = BrawlStarsClient(api_key=config_env.api_key, base_url=config_env.base_url)
-
-    factory: RunnerFactory = RunnerFactory()  # type: ignore
-    runner = factory.get_runner(args.mode)
+    rate_limiter = TokenBucketRateLimiter(
+        rate=config_env.rate_limit, burst=config_env.rate_burst
+    )
+    retry_policy = RetryPolicy(max_attempts=config_env.max_attempts)
+    retry_budget = RetryBudget(config_env.retry_budget)
+    cache = ResponseCache(DATA_CACHE_DIR) if config_env.response_cache else None
 
-    if args.mode == "player":
-        for tag in player_tags:
-            logger.info(f"\n🚀 Starting player ingestion for {tag}")
-            result = runner.run(client, tag, args.delay)
-            logger.info("\n📊 Result:")
+    if args.mode == "club-players-async":
+        factory: RunnerFactory = RunnerFactory()  # type: ignore
+        runner = factory.get_runner(args.mode)
+        runner.concurrency = args.concurrency  # type: ignore[attr-defined]
+        # Every completed task is journaled so a crashed run can --resume
+        runner.journal = CheckpointJournal(DATA_JOURNAL_DIR)  # type: ignore[attr-defined]
+        runner.resume = args.resume  # type: ignore[attr-defined]
+        async_client = AsyncBrawlStarsClient(
+            api_key=config_env.api_key,
+            base_url=config_env.base_url,
+            pool_size=max(config_env.pool_size, args.concurrency),
+            rate_limiter=rate_limiter,
+            timeout=config_env.request_timeout,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            cache=cache,
+        )
+        logger.info(
+            f"\n🚀 Starting async club+members ingestion for {len(club_tags)} clubs"
+        )
+        results = asyncio.run(runner.run_many(async_client, club_tags))  # type: ignore[attr-defined]
+        for tag, result in zip(club_tags, results):
+            logger.info(f"\n📊 Result for {tag}:")
             logger.info(result)
-    elif args.mode == "club":
-        for tag in club_tags:
-            logger.info(f"\n🚀 Starting club ingestion for {tag}")
-            result = runner.run(client, tag, args.delay)
-            logger.info("\n📊 Result:")
-            logger.info(result)
-    elif args.mode == "club-players":
-        for tag in club_tags:
-            logger.info(f"\n🚀 Starting club+members ingestion for {tag}")
-            result = runner.run(client, tag, args.delay)
+    else:
+        with BrawlStarsClient(
+            api_key=config_env.api_key,
+            base_url=config_env.base_url,
+            pool_size=config_env.pool_size,
+            rate_limiter=rate_limiter,
+            timeout=config_env.request_timeout,
+            retry_policy=retry_policy,
+            retry_budget=retry_budget,
+            cache=cache,
+        ) as client:
+            # Every completed task is journaled so a crashed run can --resume
+            planner = IngestionPlanner(
+                client, journal=CheckpointJournal(DATA_JOURNAL_DIR), resume=args.resume
+            )
+            if args.mode == "player":
+                logger.info(
+                    f"\n🚀 Starting player ingestion for {len(player_tags)} players"
+                )
+                plan = planner.plan(player_tags=player_tags)
+            elif args.mode == "club":
+                logger.info(f"\n🚀 Starting club ingestion for {len(club_tags)} clubs")
+                plan = planner.plan(club_tags=club_tags, include_members=False)
+            else:
+                # Plan across all clubs so shared members are fetched once
+                logger.info(
+                    f"\n🚀 Starting club+members ingestion for {len(club_tags)} clubs"
+                )
+                plan = planner.plan(club_tags=club_tags)
+            result = planner.execute(plan, delay=args.delay)
             logger.info("\n📊 Result:")
             logger.info(result)
 
+    if cache is not None:
+        cache.log_stats()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,43 @@
+"""
+This script re-encodes the existing ingested JSON tree in another serializer format.
+- Use it after changing BRAWLSTARS_JSON_FORMAT so older files shrink too.
+- Safe to interrupt and rerun: files already in the target format are skipped.
+- The raw stage reads every format, so migrating is optional.
+"""
+
+import argparse
+import logging
+
+from brawlstar_project.constants.paths import DATA_INGESTED_DIR
+from brawlstar_project.processing.utils.json_codec import (
+    JSON_FORMAT_SUFFIXES,
+    get_json_format,
+    migrate_json_tree,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Re-encode ingested JSON files in another serializer format."
+    )
+    parser.add_argument(
+        "--format",
+        choices=list(JSON_FORMAT_SUFFIXES),
+        default=None,
+        help="Target format (defaults to BRAWLSTARS_JSON_FORMAT or compact)",
+    )
+    args = parser.parse_args()
+
+    json_format = args.format or get_json_format()
+    logger.info(f"🚀 Migrating {DATA_INGESTED_DIR} to {json_format} JSON")
+    migrate_json_tree(DATA_INGESTED_DIR, json_format)
+
+
+if __name__ == "__main__":
+    main()
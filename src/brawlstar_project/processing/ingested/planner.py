@@ -0,0 +1,402 @@
+"""
+Ingestion planner building a single de-duplicated task set for a run.
+
+Clubs, their members and the configured players often overlap: a player can be
+in several configured clubs, or be both configured and a club member. The
+planner resolves club members once, then schedules every (endpoint, tag) pair
+exactly once, so no API call is made twice in the same run. The same plan
+can be built and executed with an async client (``plan_async`` and
+``execute_async``), requests then running concurrently.
+
+With a checkpoint journal, every completed task is recorded as it finishes;
+a resumed run skips the tasks already journaled or saved today.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from brawlstar_project.entities.club import Club
+from brawlstar_project.entities.player import Player
+from brawlstar_project.processing.ingested.journal import CheckpointJournal
+from brawlstar_project.processing.ingested.retry import counts_retries
+from brawlstar_project.processing.utils import (
+    ingested_exists,
+    load_ingested_json,
+    save_battlelog_data_partitioned,
+    save_club_data_partitioned,
+    save_club_members_data_partitioned,
+    save_player_data_partitioned,
+)
+
+logger = logging.getLogger(__name__)
+
+# endpoint -> (client method, save function)
+ENDPOINT_HANDLERS = {
+    "club": ("get_club", save_club_data_partitioned),
+    "club_members": ("get_club_members", save_club_members_data_partitioned),
+    "player": ("get_player", save_player_data_partitioned),
+    "battlelog": ("get_battlelog", save_battlelog_data_partitioned),
+}
+
+# endpoint -> (data type, filename) of the saved JSON
+ENDPOINT_FILES = {
+    "club": ("club", "club.json"),
+    "club_members": ("club", "club_members.json"),
+    "player": ("player", "player.json"),
+    "battlelog": ("player", "battlelog.json"),
+}
+
+
+@dataclass(frozen=True)
+class IngestionTask:
+    """One API call to make: an endpoint and the normalized tag it targets."""
+
+    endpoint: str
+    tag: str
+
+    @property
+    def entity(self) -> Club | Player:
+        if self.endpoint in ("club", "club_members"):
+            return Club(self.tag)
+        return Player(self.tag)
+
+
+@dataclass
+class IngestionPlan:
+    """
+    Ordered, de-duplicated set of ingestion tasks.
+
+    ``completed`` holds tasks already executed while planning (club member
+    discovery); ``failed`` holds those that errored; ``skipped`` holds tasks
+    a resumed run found already done today.
+    """
+
+    tasks: list[IngestionTask] = field(default_factory=list)
+    completed: list[IngestionTask] = field(default_factory=list)
+    failed: list[IngestionTask] = field(default_factory=list)
+    skipped: list[IngestionTask] = field(default_factory=list)
+    members_by_club: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def request_count(self) -> int:
+        """Number of API requests still to be made."""
+        return len(self.tasks)
+
+    def count_by_endpoint(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for task in self.tasks:
+            counts[task.endpoint] = counts.get(task.endpoint, 0) + 1
+        return counts
+
+    def summary(self) -> str:
+        by_endpoint = ", ".join(
+            f"{endpoint}={count}"
+            for endpoint, count in self.count_by_endpoint().items()
+        )
+        discovery = len(self.completed) + len(self.failed)
+        summary = (
+            f"🗺️ Ingestion plan: {self.request_count} requests to make "
+            f"({by_endpoint}), {discovery} already made for member discovery"
+        )
+        if self.skipped:
+            summary += f", {len(self.skipped)} skipped (already done today)"
+        return summary
+
+
+class IngestionPlanner:
+    """
+    Plan and execute a de-duplicated ingestion run with one API client.
+
+    Args:
+        client: BrawlStarsClient used for every request
+        journal: Checkpoint journal recording each completed task
+        resume: Skip tasks already in the journal or saved today
+    """
+
+    def __init__(
+        self,
+        client,
+        journal: Optional[CheckpointJournal] = None,
+        resume: bool = False,
+    ):
+        self.client = client
+        self.journal = journal
+        self.resume = resume
+
+    def _run_task(self, task: IngestionTask) -> dict:
+        method_name, _ = ENDPOINT_HANDLERS[task.endpoint]
+        data = getattr(self.client, method_name)(task.entity.formatted_tag)
+        self._save(task, data)
+        return data
+
+    async def _run_task_async(
+        self, task: IngestionTask, semaphore: Optional[asyncio.Semaphore]
+    ) -> dict:
+        method_name, _ = ENDPOINT_HANDLERS[task.endpoint]
+        request = getattr(self.client, method_name)(task.entity.formatted_tag)
+        if semaphore is None:
+            data = await request
+        else:
+            async with semaphore:
+                data = await request
+        self._save(task, data)
+        return data
+
+    def _save(self, task: IngestionTask, data: dict) -> None:
+        _, save_func = ENDPOINT_HANDLERS[task.endpoint]
+        save_func(data, task.entity.tag)
+        if self.journal is not None:
+            self.journal.record(task.endpoint, task.tag)
+
+    def _already_done(self) -> set[tuple[str, str]]:
+        if not self.resume or self.journal is None:
+            return set()
+        return self.journal.completed()
+
+    def _is_done(self, task: IngestionTask, journaled: set[tuple[str, str]]) -> bool:
+        """Check whether a resumed run can skip a task."""
+        if not self.resume:
+            return False
+        if (task.endpoint, task.tag) in journaled:
+            return True
+        # Files saved by a run made without a journal count as done too
+        data_type, filename = ENDPOINT_FILES[task.endpoint]
+        date = self.journal.date if self.journal is not None else None
+        return ingested_exists(task.tag, data_type, filename, date)
+
+    def _load_saved_members(self, club_tag: str) -> Optional[dict]:
+        date = self.journal.date if self.journal is not None else None
+        return load_ingested_json(club_tag, "club", "club_members.json", date)
+
+    @staticmethod
+    def _normalize(tags: Iterable[str], entity_cls) -> list[str]:
+        normalized = []
+        for tag in tags:
+            try:
+                normalized.append(entity_cls(tag).tag)
+            except ValueError as e:
+                logger.warning(f"  ⚠️ Skipping invalid tag {tag}: {e}")
+        return list(dict.fromkeys(normalized))
+
+    def plan(
+        self,
+        club_tags: Iterable[str] = (),
+        player_tags: Iterable[str] = (),
+        include_members: bool = True,
+    ) -> IngestionPlan:
+        """
+        Build the task set for a run.
+
+        Club member lists are fetched (and saved) here, once per club, to
+        discover member tags; they are recorded as completed, not re-planned.
+        When resuming, member lists saved earlier today are read from disk
+        and already done tasks are left out of the plan.
+
+        Args:
+            club_tags: Clubs to ingest (info + members)
+            player_tags: Players to ingest (player + battlelog)
+            include_members: Also ingest every member of the clubs
+
+        Returns:
+            IngestionPlan with the remaining tasks
+        """
+        plan, clubs, players, journaled = self._start_plan(club_tags, player_tags)
+        for task in self._member_tasks(plan, clubs, journaled):
+            try:
+                result: dict | Exception = self._run_task(task)
+            except Exception as e:
+                result = e
+            self._record_members_task(plan, task, result)
+        return self._schedule(plan, clubs, players, include_members, journaled)
+
+    async def plan_async(
+        self,
+        club_tags: Iterable[str] = (),
+        player_tags: Iterable[str] = (),
+        include_members: bool = True,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> IngestionPlan:
+        """
+        Build the task set for a run with an async client.
+
+        Same as ``plan``, the member lists of every club being fetched
+        concurrently.
+
+        Args:
+            club_tags: Clubs to ingest (info + members)
+            player_tags: Players to ingest (player + battlelog)
+            include_members: Also ingest every member of the clubs
+            semaphore: Limit on in-flight requests, shared with other calls
+
+        Returns:
+            IngestionPlan with the remaining tasks
+        """
+        plan, clubs, players, journaled = self._start_plan(club_tags, player_tags)
+        tasks = self._member_tasks(plan, clubs, journaled)
+        results = await asyncio.gather(
+            *(self._run_task_async(task, semaphore) for task in tasks),
+            return_exceptions=True,
+        )
+        for task, result in zip(tasks, results):
+            self._record_members_task(plan, task, result)
+        return self._schedule(plan, clubs, players, include_members, journaled)
+
+    def _start_plan(
+        self, club_tags: Iterable[str], player_tags: Iterable[str]
+    ) -> tuple[IngestionPlan, list[str], list[str], set[tuple[str, str]]]:
+        """Empty plan, normalized club and player tags and journaled tasks."""
+        clubs = self._normalize(club_tags, Club)
+        players = self._normalize(player_tags, Player)
+        return IngestionPlan(), clubs, players, self._already_done()
+
+    def _member_tasks(
+        self, plan: IngestionPlan, clubs: list[str], journaled: set[tuple[str, str]]
+    ) -> list[IngestionTask]:
+        """
+        Member list tasks to run while planning.
+
+        When resuming, member lists saved earlier today are read from disk
+        instead and added to the plan right away.
+        """
+        tasks = []
+        for club_tag in clubs:
+            members_task = IngestionTask("club_members", club_tag)
+            if self._is_done(members_task, journaled):
+                members_data = self._load_saved_members(club_tag)
+                if members_data is not None:
+                    plan.skipped.append(members_task)
+                    self._add_members(plan, club_tag, members_data)
+                    continue
+            tasks.append(members_task)
+        return tasks
+
+    def _record_members_task(
+        self, plan: IngestionPlan, task: IngestionTask, result: dict | BaseException
+    ) -> None:
+        """Record the outcome of a member list task and the members it found."""
+        if isinstance(result, BaseException):
+            logger.error(f"  ❌ Error fetching members of {task.tag}: {result}")
+            plan.failed.append(task)
+            result = {}
+        else:
+            plan.completed.append(task)
+        self._add_members(plan, task.tag, result)
+
+    def _add_members(
+        self, plan: IngestionPlan, club_tag: str, members_data: dict
+    ) -> None:
+        member_tags = [
+            member["tag"] for member in members_data.get("items", []) if "tag" in member
+        ]
+        plan.members_by_club[club_tag] = self._normalize(member_tags, Player)
+        logger.info(f"  🎯 Found {len(member_tags)} members in club {club_tag}")
+
+    def _schedule(
+        self,
+        plan: IngestionPlan,
+        clubs: list[str],
+        players: list[str],
+        include_members: bool,
+        journaled: set[tuple[str, str]],
+    ) -> IngestionPlan:
+        """Add every club, player and battlelog task not done yet, once each."""
+        if include_members:
+            for club_tag in clubs:
+                players.extend(plan.members_by_club.get(club_tag, []))
+
+        tasks = [IngestionTask("club", club_tag) for club_tag in clubs]
+        for player_tag in dict.fromkeys(players):
+            tasks.append(IngestionTask("player", player_tag))
+            tasks.append(IngestionTask("battlelog", player_tag))
+        for task in tasks:
+            if self._is_done(task, journaled):
+                plan.skipped.append(task)
+            else:
+                plan.tasks.append(task)
+
+        logger.info(plan.summary())
+        return plan
+
+    @counts_retries
+    def execute(self, plan: IngestionPlan, delay: float = 0.0) -> dict:
+        """
+        Execute every task of a plan, isolating failures per task.
+
+        Args:
+            plan: Plan returned by ``plan``
+            delay: Seconds to sleep between tasks when the client has no
+                rate limiter
+
+        Returns:
+            dict: statistics (successful/failed task counts per run)
+        """
+        sleep_between = (
+            delay if getattr(self.client, "rate_limiter", None) is None else 0
+        )
+        for i, task in enumerate(plan.tasks, 1):
+            logger.info(f"  📥 [{i}/{len(plan.tasks)}] {task.endpoint} {task.tag}")
+            try:
+                self._run_task(task)
+                plan.completed.append(task)
+            except Exception as e:
+                logger.error(
+                    f"    ❌ Error fetching {task.endpoint} for {task.tag}: {e}"
+                )
+                plan.failed.append(task)
+            if sleep_between and i < len(plan.tasks):
+                time.sleep(sleep_between)
+
+        return {
+            "status": "success",
+            "requests": len(plan.completed) + len(plan.failed),
+            "successful": len(plan.completed),
+            "failed": len(plan.failed),
+            "skipped": len(plan.skipped),
+        }
+
+    async def execute_async(
+        self, plan: IngestionPlan, semaphore: Optional[asyncio.Semaphore] = None
+    ) -> dict:
+        """
+        Execute every task of a plan concurrently with an async client.
+
+        Args:
+            plan: Plan returned by ``plan_async``
+            semaphore: Limit on in-flight requests, shared with other calls
+
+        Returns:
+            dict: statistics, as returned by ``execute``
+        """
+        results = await asyncio.gather(
+            *(self._run_task_async(task, semaphore) for task in plan.tasks),
+            return_exceptions=True,
+        )
+        for task, result in zip(plan.tasks, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    f"    ❌ Error fetching {task.endpoint} for {task.tag}: {result}"
+                )
+                plan.failed.append(task)
+            else:
+                plan.completed.append(task)
+
+        return {
+            "status": "success",
+            "requests": len(plan.completed) + len(plan.failed),
+            "successful": len(plan.completed),
+            "failed": len(plan.failed),
+            "skipped": len(plan.skipped),
+        }
+
+    def failed_tags(
+        self, plan: IngestionPlan, endpoints: Optional[set[str]] = None
+    ) -> set[str]:
+        """Tags with at least one failed task, optionally limited to some endpoints."""
+        return {
+            task.tag
+            for task in plan.failed
+            if endpoints is None or task.endpoint in endpoints
+        }
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or unparsable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucketRateLimiter:
+    """
+    Token-bucket rate limiter shared by every API call of a run.
+
+    Callers reserve a token under a lock and then wait outside of it, so the
+    same instance can be used from threads (``acquire``) and asyncio tasks
+    (``acquire_async``). On HTTP 429 the limiter pauses until ``Retry-After``
+    and halves its rate; successful calls then recover the rate additively
+    up to the configured maximum.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 10,
+        min_rate: float = 0.5,
+        recovery_step: float = 0.1,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.recovery_step = recovery_step
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """
+        Reserve one token.
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                # Nothing accrues while paused; the bucket restarts afterwards
+                self._updated_at = self._paused_until
+                wait = self._paused_until - now
+            else:
+                self._refill(now)
+                wait = 0.0
+            self._tokens -= 1.0
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait
+
+    def acquire(self) -> None:
+        """Block the current thread until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Suspend the current task until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> float:
+        """
+        Slow down after an HTTP 429 response.
+
+        Args:
+            retry_after: Seconds requested by the server, if any
+
+        Returns:
+            Pause applied, in seconds
+        """
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            self._tokens = min(self._tokens, 1.0)
+        logger.warning(
+            f"⏳ Rate limited by API, pausing {pause:.2f}s "
+            f"(rate now {self.rate:.2f} req/s)"
+        )
+        return pause
+
+    def on_success(self) -> None:
+        """Recover the rate additively after a successful call."""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.recovery_step)
@@ -0,0 +1,167 @@
+import functools
+import inspect
+import random
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry policy for idempotent GET requests.
+
+    Delays follow exponential backoff with full jitter: attempt ``n`` waits a
+    random time in ``[0, min(max_delay, base_delay * 2**n)]``.
+    """
+
+    max_attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def should_retry_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute the jittered delay before the next attempt.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+
+        Returns:
+            Delay in seconds
+        """
+        cap = min(self.max_delay, self.base_delay * (2**attempt))
+        return random.uniform(0, cap)
+
+
+class RetryBudget:
+    """
+    Thread-safe number of retries allowed for a whole ingestion run.
+
+    Once exhausted, failures are surfaced immediately instead of retried, so a
+    degraded API cannot stretch a run indefinitely.
+    """
+
+    def __init__(self, max_retries: int = 200):
+        self.max_retries = max_retries
+        self.used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.max_retries - self.used)
+
+    def try_consume(self) -> bool:
+        """
+        Take one retry from the budget.
+
+        Returns:
+            True if a retry is allowed, False if the budget is exhausted
+        """
+        with self._lock:
+            if self.used >= self.max_retries:
+                return False
+            self.used += 1
+            return True
+
+
+@dataclass
+class RetryStats:
+    """Retries observed inside a ``track_retries`` scope (nested scopes included)."""
+
+    retries: int = 0
+    parent: Optional["RetryStats"] = None
+
+
+_current_retry_stats: ContextVar[Optional[RetryStats]] = ContextVar(
+    "current_retry_stats", default=None
+)
+
+
+@contextmanager
+def track_retries() -> Iterator[RetryStats]:
+    """
+    Count retries made by API clients within this scope.
+
+    The scope follows the current thread or asyncio task (and tasks it
+    spawns), so concurrent runners each see only their own retries.
+    """
+    stats = RetryStats(parent=_current_retry_stats.get())
+    token = _current_retry_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_retry_stats.reset(token)
+
+
+def record_retry() -> None:
+    """Record one retry in the active ``track_retries`` scope and its parents."""
+    stats = _current_retry_stats.get()
+    while stats is not None:
+        stats.retries += 1
+        stats = stats.parent
+
+
+def counts_retries(func: Callable) -> Callable:
+    """
+    Decorator adding a ``retries`` entry to the dict returned by a runner.
+
+    Works on both plain and ``async`` run methods.
+    """
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            with track_retries() as stats:
+                result = await func(*args, **kwargs)
+            result["retries"] = stats.retries
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with track_retries() as stats:
+            result = func(*args, **kwargs)
+        result["retries"] = stats.retries
+        return result
+
+    return wrapper
+
+
+def retry_delay(
+    policy: RetryPolicy,
+    attempt: int,
+    status_code: Optional[int] = None,
+    retry_after: Optional[float] = None,
+    rate_limiter=None,
+) -> float:
+    """
+    Compute how long a client should sleep before retrying.
+
+    A 429 with a shared rate limiter pauses the limiter instead, so the wait
+    happens in the next ``acquire`` and applies to every concurrent caller.
+
+    Args:
+        policy: Retry policy of the client
+        attempt: Zero-based index of the attempt that just failed
+        status_code: HTTP status of the failed attempt, None for transport errors
+        retry_after: Parsed Retry-After header, if any
+        rate_limiter: Shared TokenBucketRateLimiter, if any
+
+    Returns:
+        Seconds to sleep before the next attempt
+    """
+    if status_code == 429 and rate_limiter is not None:
+        rate_limiter.on_rate_limited(retry_after)
+        return 0.0
+    delay = policy.backoff(attempt)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
@@ -0,0 +1,123 @@
+"""
+In-process execution of the batch pipeline stages.
+
+``run_pipeline`` runs the raw, processed and cleaned stages in the calling
+process, paying the interpreter start-up and the Polars, Pydantic and DuckDB
+imports once. Each stage still writes the same files as its stage-specific
+main.py; with ``in_memory=True`` the DataFrames of the processed stage are
+also handed to the gold build, which then does not read them back from disk.
+
+The raw stage converts every ingested date incrementally, so the processed
+stage always reads it from disk. ``unified_main.py --subprocess`` keeps
+running each stage's main.py as a separate process (e.g. for Airflow).
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+import polars as pl
+
+from brawlstar_project.processing.cleaned import process_gold_layer, raise_on_failure
+from brawlstar_project.processing.factory.processing_factory import ProcessingFactory
+from brawlstar_project.processing.utils import convert_all_json_to_parquet_partitioned
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("raw", "processed", "cleaned")
+
+
+@dataclass
+class StageResult:
+    """Outcome of one stage: its wall time and what it returned."""
+
+    stage: str
+    seconds: float
+    output: Any = None
+
+
+def run_raw_stage() -> None:
+    """Convert ingested JSON to Parquet (raw layer)."""
+    convert_all_json_to_parquet_partitioned()
+
+
+def run_processed_stage(date: str) -> dict[str, pl.DataFrame]:
+    """
+    Clean every entity of a date (processed layer).
+
+    Args:
+        date: Date partition to process (YYYY-MM-DD)
+
+    Returns:
+        Daily file name -> cleaned DataFrame, as written to disk
+    """
+    return ProcessingFactory().get_runner("all").run(date=date)
+
+
+def run_cleaned_stage(
+    date: str, frames: Optional[dict[str, pl.DataFrame]] = None
+) -> dict:
+    """
+    Build the gold layer of a date (cleaned stage).
+
+    Args:
+        date: Date partition to process (YYYY-MM-DD)
+        frames: Processed DataFrames already in memory, used instead of
+            reading those files
+
+    Returns:
+        Task name -> result of the gold build
+
+    Raises:
+        RuntimeError: If a gold task failed or was skipped
+    """
+    results = process_gold_layer(date, frames=frames)
+    raise_on_failure(results)
+    return results
+
+
+def run_pipeline(
+    date: Optional[str] = None,
+    stages: Iterable[str] = STAGES,
+    in_memory: bool = True,
+) -> dict[str, StageResult]:
+    """
+    Run pipeline stages in order, in the current process.
+
+    A failing stage raises, so later stages never run on stale inputs.
+
+    Args:
+        date: Date partition to process (YYYY-MM-DD). Defaults to today.
+        stages: Stages to run, among "raw", "processed" and "cleaned"
+        in_memory: Pass the processed DataFrames to the cleaned stage instead
+            of having it read them back from disk
+
+    Returns:
+        Stage name -> result, in execution order
+
+    Raises:
+        ValueError: If a stage is unknown
+    """
+    date = date or datetime.today().strftime("%Y-%m-%d")
+    stages = list(stages)
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        raise ValueError(f"Unknown stages {unknown}, expected some of {STAGES}")
+
+    results: dict[str, StageResult] = {}
+    frames: Optional[dict[str, pl.DataFrame]] = None
+    for stage in sorted(stages, key=STAGES.index):
+        logger.info(f"🚀 Running {stage} stage in-process for date: {date}")
+        start = time.perf_counter()
+        if stage == "raw":
+            output = run_raw_stage()
+        elif stage == "processed":
+            output = run_processed_stage(date)
+            frames = output if in_memory else None
+        else:
+            output = run_cleaned_stage(date, frames=frames)
+        results[stage] = StageResult(stage, time.perf_counter() - start, output)
+        logger.info(f"✅ {stage} stage done in {results[stage].seconds:.2f}s")
+    return results
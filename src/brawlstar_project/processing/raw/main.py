@@ -1,17 +1,39 @@
 """
 This script converts all ingested JSON data to Parquet files (raw layer).
 - Processes all available data in data/ingested/.
+- Only dates whose ingested inputs changed since the last run are reconverted;
+  use --full-refresh to reconvert everything.
+- --workers N converts (data_type, date) partitions in N processes
+  (0 = all CPU cores); a failed partition does not stop the others.
 - Intended for batch or Airflow orchestration.
 - For full pipeline, use unified_main.py.
 """
 
+import argparse
+
 from brawlstar_project.processing.utils import (
     convert_all_json_to_parquet_partitioned,
 )
 
 
 def main():
-    convert_all_json_to_parquet_partitioned()
+    parser = argparse.ArgumentParser(description="Convert ingested JSON to Parquet")
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Reconvert every date, ignoring the raw manifest",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for parallel conversion (0 = all CPU cores)",
+    )
+    args = parser.parse_args()
+
+    convert_all_json_to_parquet_partitioned(
+        incremental=not args.full_refresh, workers=args.workers
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,27 @@
+"""
+This script moves existing raw and processed data to the hive partition layout.
+- <data_type>/<YYYY-MM-DD>/x.parquet becomes <data_type>/date=<YYYY-MM-DD>/x.parquet.
+- Run it once after upgrading; rerunning it is a no-op.
+- The raw manifest is updated, so migrated dates are not reconverted.
+"""
+
+import logging
+
+from brawlstar_project.constants.paths import DATA_PROCESSED_DIR, DATA_RAW_DIR
+from brawlstar_project.processing.utils.dataset import migrate_to_hive_layout
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    for base_dir in (DATA_RAW_DIR, DATA_PROCESSED_DIR):
+        logger.info(f"🚀 Migrating {base_dir} to date= partitions")
+        migrate_to_hive_layout(base_dir)
+
+
+if __name__ == "__main__":
+    main()
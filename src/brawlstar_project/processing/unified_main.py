@@ -2,20 +2,28 @@
 Unified main entry point for all pipeline stages (batch mode only).
 
 This script reads config.yaml and runs the full pipeline for all player and club tags listed, including all club members.
-- Deduplicates player tags so each player is only processed once.
+- Plans a de-duplicated task set so each (endpoint, tag) pair is fetched once per run.
+- Journals completed ingestion tasks; rerun with --resume to continue a crashed run.
+- Runs the raw, processed and cleaned stages in this process (see pipeline.py);
+  --subprocess runs each stage's main.py in its own process instead.
 - Intended for batch or Airflow orchestration.
 - For ad-hoc or partial runs, use the stage-specific main.py scripts.
 """
 
+import argparse
 import logging
 import subprocess
 from datetime import datetime
 
-from brawlstar_project.entities.club import Club
-from brawlstar_project.processing.factory.runner_factory import RunnerFactory
+from brawlstar_project.constants.paths import DATA_CACHE_DIR, DATA_JOURNAL_DIR
 from brawlstar_project.processing.ingested.api_client import BrawlStarsClient
+from brawlstar_project.processing.ingested.cache import ResponseCache
 from brawlstar_project.processing.ingested.config import ConfigLoader
-from brawlstar_project.processing.utils import fetch_club_members_data
+from brawlstar_project.processing.ingested.journal import CheckpointJournal
+from brawlstar_project.processing.ingested.planner import IngestionPlanner
+from brawlstar_project.processing.ingested.rate_limiter import TokenBucketRateLimiter
+from brawlstar_project.processing.ingested.retry import RetryBudget, RetryPolicy
+from brawlstar_project.processing.pipeline import STAGES, run_pipeline
 from brawlstar_project.processing.utils.config_utils import load_pipeline_config
 
 logging.basicConfig(
@@ -25,16 +33,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def run_pipeline_for_tag(
-    tag: str, mode: str, client, delay: float = 1.0, date: str = None
-):
-    factory = RunnerFactory()
-    runner = factory.get_runner(mode)
-    logger.info(f"\n🚀 Running {mode} pipeline for tag: {tag}")
-    result = runner.run(client=client, tag=tag, delay=delay)
-    logger.info(f"📊 Result: {result}")
-
-
 def run_stage(stage: str, date: str):
     """Run a pipeline stage by calling its main.py via subprocess."""
     logger.info(f"\n🚀 Running {stage} stage for date: {date}")
@@ -65,50 +63,71 @@ def run_stage(stage: str, date: str):
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Run the full Brawl Stars pipeline for all tags in config."
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip ingestion tasks already completed today",
+    )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run each stage's main.py in a subprocess instead of in-process",
+    )
+    args = parser.parse_args()
+
     try:
         config = load_pipeline_config()
     except FileNotFoundError as e:
         logger.error(str(e))
         return
-    player_tags = set(config.get("default_player_tags", []))
+    player_tags = config.get("default_player_tags", [])
     club_tags = config.get("default_club_tags", [])
 
-    # Load config and create client
+    # Load config and create a pooled client shared by the whole ingestion run
     config_env = ConfigLoader.from_env()
-    client = BrawlStarsClient(api_key=config_env.api_key, base_url=config_env.base_url)
+    rate_limiter = TokenBucketRateLimiter(
+        rate=config_env.rate_limit, burst=config_env.rate_burst
+    )
+    retry_policy = RetryPolicy(max_attempts=config_env.max_attempts)
+    retry_budget = RetryBudget(config_env.retry_budget)
+    cache = ResponseCache(DATA_CACHE_DIR) if config_env.response_cache else None
 
     # Use today's date for partitioning
     today = datetime.today().strftime("%Y-%m-%d")
 
-    # Collect all member tags from all clubs
-    all_member_tags = set()
-    for club_tag in club_tags:
-        club_entity = Club(club_tag)
-        club_members_data = fetch_club_members_data(client, club_entity)
-        member_tags = [
-            member["tag"]
-            for member in club_members_data.get("items", [])
-            if "tag" in member
-        ]
-        all_member_tags.update(member_tags)
-        logger.info(
-            f"\n🎯 Found {len(member_tags)} members in club {club_tag} to process."
+    with BrawlStarsClient(
+        api_key=config_env.api_key,
+        base_url=config_env.base_url,
+        pool_size=config_env.pool_size,
+        rate_limiter=rate_limiter,
+        timeout=config_env.request_timeout,
+        retry_policy=retry_policy,
+        retry_budget=retry_budget,
+        cache=cache,
+    ) as client:
+        # Plan once: club info, club members and every unique player, each
+        # endpoint/tag pair fetched exactly once
+        planner = IngestionPlanner(
+            client,
+            journal=CheckpointJournal(DATA_JOURNAL_DIR, date=today),
+            resume=args.resume,
         )
+        plan = planner.plan(club_tags=club_tags, player_tags=player_tags)
+        result = planner.execute(plan)
+        logger.info(f"📊 Ingestion result: {result}")
 
-    # Deduplicate: union of player_tags and all_member_tags
-    all_player_tags = player_tags.union(all_member_tags)
-
-    # Run full pipeline for each unique player
-    for tag in all_player_tags:
-        run_pipeline_for_tag(tag, mode="player", client=client, date=today)
-    # Run full pipeline for each club
-    for club_tag in club_tags:
-        run_pipeline_for_tag(club_tag, mode="club", client=client, date=today)
+    if cache is not None:
+        cache.log_stats()
 
     # Run raw, processed, and cleaned stages
-    run_stage("raw", today)
-    run_stage("processed", today)
-    run_stage("cleaned", today)
+    if args.subprocess:
+        for stage in STAGES:
+            run_stage(stage, today)
+    else:
+        run_pipeline(today)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,7 @@
+from .battlelog_flattener import flatten_battlelogs
 from .config_utils import load_pipeline_config
+from .dataset import dataset_path, read_dataset_duckdb, scan_dataset
+from .json_codec import find_json, migrate_json_tree, read_json, write_json
 from .json_utils import (
     convert_all_json_to_parquet_partitioned,
     fetch_club_data,
@@ -7,19 +10,39 @@ from .json_utils import (
     flatten_club_data,
     flatten_club_members_data,
     flatten_player_data,
+    ingested_exists,
+    ingested_file_path,
+    load_ingested_json,
     save_battlelog_data_partitioned,
+    save_club_data_partitioned,
+    save_club_members_data_partitioned,
     save_player_data_partitioned,
 )
+from .segment_store import SegmentStore
 
 __all__ = [
     "save_player_data_partitioned",
     "save_battlelog_data_partitioned",
+    "save_club_data_partitioned",
+    "save_club_members_data_partitioned",
     "fetch_club_data",
     "fetch_club_members_data",
     "convert_all_json_to_parquet_partitioned",
     "flatten_player_data",
     "flatten_battlelog_data",
+    "flatten_battlelogs",
     "flatten_club_data",
     "flatten_club_members_data",
+    "ingested_exists",
+    "ingested_file_path",
+    "load_ingested_json",
     "load_pipeline_config",
+    "find_json",
+    "read_json",
+    "write_json",
+    "migrate_json_tree",
+    "SegmentStore",
+    "dataset_path",
+    "scan_dataset",
+    "read_dataset_duckdb",
 ]
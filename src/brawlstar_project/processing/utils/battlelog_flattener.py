@@ -0,0 +1,234 @@
+"""
+Columnar battlelog flattener.
+
+Flattens many validated battlelog payloads at once: one pass copies the
+fields into flat columns, then Polars joins and expressions locate the
+player, their team, the opponents and the star player, instead of building
+one Pydantic model per battle. The output has exactly the
+columns and dtypes of ``FlattenedBattleData.model_dump()`` rows, as produced by
+``flatten_battlelog_data``.
+"""
+
+import logging
+from datetime import datetime
+from typing import Iterable
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+FLATTENED_BATTLE_SCHEMA = pl.Schema(
+    {
+        "battle_time": pl.String,
+        "event_mode": pl.String,
+        "event_map": pl.String,
+        "battle_mode": pl.String,
+        "battle_type": pl.String,
+        "battle_result": pl.String,
+        "battle_duration": pl.Int64,
+        "player_tag": pl.String,
+        "player_name": pl.String,
+        "brawler_name": pl.String,
+        "brawler_power": pl.Int64,
+        "brawler_trophies": pl.Int64,
+        "team_size": pl.Int64,
+        "opponent_count": pl.Int64,
+        "is_star_player": pl.Boolean,
+        "participant_tags": pl.String,
+        "extracted_at": pl.Datetime("us"),
+    }
+)
+
+_BATTLE_COLUMNS = {
+    "player_tag": pl.String,
+    "battle_time": pl.String,
+    "event_mode": pl.String,
+    "event_map": pl.String,
+    "battle_mode": pl.String,
+    "battle_type": pl.String,
+    "battle_result": pl.String,
+    "battle_duration": pl.Int64,
+    "star_tag": pl.String,
+    "participant_tags": pl.String,
+}
+_TEAM_COLUMNS = {"battle_idx": pl.UInt32, "team_idx": pl.Int64, "size": pl.Int64}
+_MEMBER_COLUMNS = {
+    "battle_idx": pl.UInt32,
+    "team_idx": pl.Int64,
+    "tag": pl.String,
+    "player_name": pl.String,
+    "brawler_name": pl.String,
+    "brawler_power": pl.Int64,
+    "brawler_trophies": pl.Int64,
+}
+
+
+def load_battles(
+    payloads: Iterable[tuple[str, dict]],
+) -> tuple[pl.DataFrame, pl.DataFrame, pl.DataFrame]:
+    """
+    Load battlelog payloads into flat columnar tables.
+
+    Nested team lists are not loaded as Polars structs: building list-of-struct
+    columns from Python dicts costs more than the whole flattening. Instead,
+    one pass copies scalars into plain columns, keyed by ``battle_idx``.
+
+    A payload that cannot be flattened is logged and skipped, like
+    ``flatten_battlelog_data`` does, so the other battlelogs of the batch are
+    still loaded.
+
+    Args:
+        payloads: (player tag, validated battlelog dict) pairs
+
+    Returns:
+        (battles, teams, members) frames: one row per battle, per team and
+        per team member
+    """
+    battles: dict[str, list] = {name: [] for name in _BATTLE_COLUMNS}
+    teams: dict[str, list] = {name: [] for name in _TEAM_COLUMNS}
+    members: dict[str, list] = {name: [] for name in _MEMBER_COLUMNS}
+
+    for player_tag, data in payloads:
+        first_idx = len(battles["player_tag"])
+        try:
+            loaded = _load_payload(player_tag, data, first_idx)
+        except Exception as e:
+            # Same isolation as the per-payload flattener: skip this battlelog
+            logger.error(f"Error flattening battlelog data of {player_tag}: {e}")
+            continue
+        for columns, payload_columns in zip((battles, teams, members), loaded):
+            for name, values in payload_columns.items():
+                columns[name].extend(values)
+
+    return (
+        pl.DataFrame(battles, schema=_BATTLE_COLUMNS).with_row_index("battle_idx"),
+        pl.DataFrame(teams, schema=_TEAM_COLUMNS),
+        pl.DataFrame(members, schema=_MEMBER_COLUMNS),
+    )
+
+
+def _load_payload(
+    player_tag: str, data: dict, first_idx: int
+) -> tuple[dict[str, list], dict[str, list], dict[str, list]]:
+    """Columns of one payload, numbering its battles from ``first_idx``."""
+    from brawlstar_project.entities.player.models.battlelog import participant_tags
+
+    battles: dict[str, list] = {name: [] for name in _BATTLE_COLUMNS}
+    teams: dict[str, list] = {name: [] for name in _TEAM_COLUMNS}
+    members: dict[str, list] = {name: [] for name in _MEMBER_COLUMNS}
+
+    for battle_idx, item in enumerate(data.get("items") or [], start=first_idx):
+        event = item["event"]
+        details = item["battle"]
+        star_player = details.get("starPlayer")
+        battles["player_tag"].append(player_tag)
+        battles["battle_time"].append(item["battleTime"])
+        battles["event_mode"].append(event.get("mode"))
+        battles["event_map"].append(event.get("map"))
+        battles["battle_mode"].append(details["mode"])
+        battles["battle_type"].append(details["type"])
+        battles["battle_result"].append(details.get("result"))
+        battles["battle_duration"].append(details.get("duration"))
+        battles["star_tag"].append(star_player["tag"] if star_player else None)
+        battles["participant_tags"].append(participant_tags(details, player_tag))
+        for team_idx, team in enumerate(details.get("teams") or []):
+            teams["battle_idx"].append(battle_idx)
+            teams["team_idx"].append(team_idx)
+            teams["size"].append(len(team))
+            for member in team:
+                brawler = member["brawler"]
+                members["battle_idx"].append(battle_idx)
+                members["team_idx"].append(team_idx)
+                members["tag"].append(member["tag"])
+                members["player_name"].append(member["name"])
+                members["brawler_name"].append(brawler["name"])
+                members["brawler_power"].append(brawler["power"])
+                members["brawler_trophies"].append(brawler["trophies"])
+    return battles, teams, members
+
+
+def _or_unknown(column: str) -> pl.Expr:
+    """Vectorized ``value or "unknown"`` for a string column."""
+    value = pl.col(column)
+    return (
+        pl.when(value.is_null() | (value == ""))
+        .then(pl.lit("unknown"))
+        .otherwise(value)
+        .alias(column)
+    )
+
+
+def flatten_battlelogs(payloads: Iterable[tuple[str, dict]]) -> pl.DataFrame:
+    """
+    Flatten many battlelog payloads in one vectorized pass.
+
+    Matches ``create_flattened_battle_data`` battle for battle: the player's
+    team is the first team containing the player's tag; when the player is not
+    found, ``team_size`` is the size of the last team, as in the loop version.
+
+    Args:
+        payloads: (player tag, validated battlelog dict) pairs
+
+    Returns:
+        DataFrame with FLATTENED_BATTLE_SCHEMA, empty if there are no battles
+    """
+    battles, teams, members = load_battles(payloads)
+    if battles.is_empty():
+        return pl.DataFrame(schema=FLATTENED_BATTLE_SCHEMA)
+
+    # First team member carrying the battle owner's tag
+    owner = (
+        members.with_row_index("member_idx")
+        .join(battles.select("battle_idx", "player_tag"), on="battle_idx")
+        .filter(pl.col("tag") == pl.col("player_tag"))
+        .sort("member_idx")
+        .unique("battle_idx", keep="first", maintain_order=True)
+        .join(teams, on=["battle_idx", "team_idx"])
+        .select(
+            "battle_idx",
+            pl.col("size").alias("owner_team_size"),
+            "player_name",
+            "brawler_name",
+            "brawler_power",
+            "brawler_trophies",
+        )
+    )
+    team_totals = (
+        teams.sort("battle_idx", "team_idx")
+        .group_by("battle_idx")
+        .agg(
+            pl.col("size").last().alias("last_team_size"),
+            pl.col("size").sum().alias("total_players"),
+        )
+    )
+
+    team_size = pl.coalesce("owner_team_size", "last_team_size", pl.lit(0))
+    return (
+        battles.join(owner, on="battle_idx", how="left")
+        .join(team_totals, on="battle_idx", how="left")
+        .sort("battle_idx")
+        .with_columns(team_size.cast(pl.Int64).alias("team_size"))
+        .select(
+            "battle_time",
+            _or_unknown("event_mode"),
+            _or_unknown("event_map"),
+            "battle_mode",
+            "battle_type",
+            _or_unknown("battle_result"),
+            pl.col("battle_duration").fill_null(0),
+            "player_tag",
+            pl.col("player_name").fill_null(""),
+            pl.col("brawler_name").fill_null(""),
+            pl.col("brawler_power").fill_null(0),
+            pl.col("brawler_trophies").fill_null(0),
+            "team_size",
+            (pl.col("total_players").fill_null(0) - pl.col("team_size"))
+            .cast(pl.Int64)
+            .alias("opponent_count"),
+            (pl.col("star_tag") == pl.col("player_tag"))
+            .fill_null(False)
+            .alias("is_star_player"),
+            "participant_tags",
+            pl.lit(datetime.now(), dtype=pl.Datetime("us")).alias("extracted_at"),
+        )
+    )
@@ -0,0 +1,245 @@
+"""
+Hive-partitioned datasets of the raw and processed layers.
+
+Every daily file lives in a ``date=YYYY-MM-DD`` partition directory:
+
+    <layer>/<data_type>/date=2025-07-11/battlelog.parquet
+
+Writers get their paths from ``dataset_path``. Readers scan a date range of one
+file with ``scan_dataset`` (Polars) or ``read_dataset_duckdb`` (DuckDB):
+partitions outside the range are pruned from their directory names without
+opening their files.
+"""
+
+import logging
+import os
+import re
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import duckdb
+import polars as pl
+
+from brawlstar_project.processing.utils.raw_manifest import (
+    MANIFEST_FILENAME,
+    RawManifest,
+)
+
+logger = logging.getLogger(__name__)
+
+PARTITION_KEY = "date"
+
+# Daily file name -> data type directory
+DATASET_DATA_TYPES = {
+    "player.parquet": "player",
+    "battlelog.parquet": "player",
+    "club.parquet": "club",
+    "club_members.parquet": "club",
+}
+
+_LEGACY_DATE_DIR = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def data_type_of(filename: str) -> str:
+    """Data type directory of a daily file, e.g. "battlelog.parquet" -> "player"."""
+    try:
+        return DATASET_DATA_TYPES[filename]
+    except KeyError:
+        raise ValueError(f"Unknown filename: {filename}") from None
+
+
+def _check_date(date: str) -> str:
+    """Validate a YYYY-MM-DD partition value."""
+    datetime.strptime(date, "%Y-%m-%d")
+    return date
+
+
+def partition_dir(base_dir: Path, data_type: str, date: str) -> Path:
+    """
+    Partition directory of one data type and date.
+
+    Args:
+        base_dir: Layer directory (e.g. DATA_RAW_DIR)
+        data_type: Data type ("player" or "club")
+        date: Partition date (YYYY-MM-DD)
+
+    Returns:
+        ``<base_dir>/<data_type>/date=<date>``
+    """
+    return Path(base_dir) / data_type / f"{PARTITION_KEY}={_check_date(date)}"
+
+
+def dataset_path(base_dir: Path, filename: str, date: str) -> Path:
+    """
+    Path of a daily file in its partition.
+
+    Args:
+        base_dir: Layer directory (e.g. DATA_PROCESSED_DIR)
+        filename: Daily file name (e.g. "club.parquet")
+        date: Partition date (YYYY-MM-DD)
+
+    Returns:
+        ``<base_dir>/<data_type>/date=<date>/<filename>``
+    """
+    return partition_dir(base_dir, data_type_of(filename), date) / filename
+
+
+def dataset_glob(base_dir: Path, filename: str) -> str:
+    """Glob matching a daily file in every partition."""
+    return str(
+        Path(base_dir) / data_type_of(filename) / f"{PARTITION_KEY}=*" / filename
+    )
+
+
+def partition_dates(base_dir: Path, filename: str) -> list[str]:
+    """
+    Dates having a partition of a daily file, oldest first.
+
+    Only directory names are listed; no file is opened.
+    """
+    data_type_dir = Path(base_dir) / data_type_of(filename)
+    if not data_type_dir.is_dir():
+        return []
+    prefix = f"{PARTITION_KEY}="
+    with os.scandir(data_type_dir) as entries:
+        return sorted(
+            entry.name[len(prefix) :]
+            for entry in entries
+            if entry.name.startswith(prefix)
+            and os.path.exists(os.path.join(entry.path, filename))
+        )
+
+
+def _dates_in_range(
+    base_dir: Path, filename: str, start: Optional[str], end: Optional[str]
+) -> list[str]:
+    """Partition dates of a daily file within [start, end], oldest first."""
+    if start is not None:
+        _check_date(start)
+    if end is not None:
+        _check_date(end)
+    return [
+        date
+        for date in partition_dates(base_dir, filename)
+        if (start is None or date >= start) and (end is None or date <= end)
+    ]
+
+
+def scan_dataset(
+    base_dir: Path,
+    filename: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> Optional[pl.LazyFrame]:
+    """
+    Lazily scan a daily file over a date range with Polars.
+
+    Partitions outside the range are pruned from the directory names, without
+    opening their files. The partitions in the range are scanned separately
+    and concatenated on the union of their columns, so a column added by a
+    later partition is kept (null in the older ones). A ``date`` column (a
+    YYYY-MM-DD string) holds each row's partition.
+
+    Args:
+        base_dir: Layer directory
+        filename: Daily file name
+        start: First date included (YYYY-MM-DD), unbounded when None
+        end: Last date included (YYYY-MM-DD), unbounded when None
+
+    Returns:
+        LazyFrame over the range, or None if no partition falls in it
+    """
+    dates = _dates_in_range(base_dir, filename, start, end)
+    if not dates:
+        return None
+    return pl.concat(
+        [
+            pl.scan_parquet(dataset_path(base_dir, filename, date)).with_columns(
+                pl.lit(date).alias(PARTITION_KEY)
+            )
+            for date in dates
+        ],
+        how="diagonal_relaxed",
+    ).select(pl.exclude(PARTITION_KEY), PARTITION_KEY)
+
+
+def read_dataset_duckdb(
+    base_dir: Path,
+    filename: str,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    connection: Optional[duckdb.DuckDBPyConnection] = None,
+) -> Optional[duckdb.DuckDBPyRelation]:
+    """
+    Query a daily file over a date range with DuckDB.
+
+    Only the files of the partitions in the range are passed to DuckDB, read
+    with ``union_by_name`` so that columns added by later partitions are kept.
+
+    Args:
+        base_dir: Layer directory
+        filename: Daily file name
+        start: First date included (YYYY-MM-DD), unbounded when None
+        end: Last date included (YYYY-MM-DD), unbounded when None
+        connection: DuckDB connection, defaults to DuckDB's module-level
+            connection (a relation cannot outlive its connection)
+
+    Returns:
+        Relation with a ``date`` VARCHAR partition column, or None if no
+        partition falls in the range
+    """
+    dates = _dates_in_range(base_dir, filename, start, end)
+    if not dates:
+        return None
+    connection = connection or duckdb.default_connection()
+    files = ", ".join(f"'{dataset_path(base_dir, filename, date)}'" for date in dates)
+    return connection.sql(
+        f"SELECT * FROM read_parquet([{files}], hive_partitioning = true, "
+        f"hive_types = {{'{PARTITION_KEY}': VARCHAR}}, union_by_name = true)"
+    )
+
+
+def migrate_to_hive_layout(base_dir: Path) -> int:
+    """
+    Move ``<data_type>/<YYYY-MM-DD>/`` directories to ``date=`` partitions.
+
+    Idempotent; the raw-stage manifest, if any, is updated to the new paths
+    so that migrated dates are not reconverted.
+
+    Args:
+        base_dir: Layer directory to migrate
+
+    Returns:
+        Number of date directories moved
+    """
+    base_dir = Path(base_dir)
+    moved = 0
+    renamed: dict[str, str] = {}
+    for data_type in sorted(set(DATASET_DATA_TYPES.values())):
+        data_type_dir = base_dir / data_type
+        if not data_type_dir.is_dir():
+            continue
+        for date_dir in sorted(data_type_dir.iterdir()):
+            if not date_dir.is_dir() or not _LEGACY_DATE_DIR.fullmatch(date_dir.name):
+                continue
+            target = partition_dir(base_dir, data_type, date_dir.name)
+            target.mkdir(parents=True, exist_ok=True)
+            for path in date_dir.iterdir():
+                os.replace(path, target / path.name)
+                renamed[f"{data_type}/{date_dir.name}/{path.name}"] = (
+                    f"{data_type}/{target.name}/{path.name}"
+                )
+            shutil.rmtree(date_dir)
+            moved += 1
+
+    manifest_path = base_dir / MANIFEST_FILENAME
+    if renamed and manifest_path.exists():
+        manifest = RawManifest(base_dir)
+        manifest.rename(renamed)
+        manifest.save()
+
+    if moved:
+        logger.info(f"📦 Moved {moved} date directories to date= partitions")
+    return moved
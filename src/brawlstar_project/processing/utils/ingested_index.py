@@ -0,0 +1,113 @@
+"""
+Single-pass index of the ingested tree.
+
+The raw stage converts four kinds of files (player, battlelog, club and club
+members) that live side by side in ``<data_type>/<tag>/<date>/``. Walking the
+tree once with ``os.scandir`` (whose entries carry their type, so no extra
+``stat`` per path) and grouping every file by kind and date replaces one glob of
+every tag and date directory per kind, which matters on network filesystems.
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+from brawlstar_project.processing.utils.json_codec import JSON_FORMAT_SUFFIXES
+from brawlstar_project.processing.utils.segment_store import SEGMENTS_DIRNAME
+
+# Storage suffixes in find_json() preference order: plain first
+_SUFFIXES = list(dict.fromkeys(JSON_FORMAT_SUFFIXES.values()))
+
+
+@dataclass
+class DateInputs:
+    """
+    Ingested inputs of one kind of file on one date.
+
+    A tag can appear both in ``files`` and in a segment (e.g. while migrating
+    to segments); readers then keep the segment record.
+    """
+
+    files: list[tuple[str, Path]] = field(default_factory=list)
+    segments: list[Path] = field(default_factory=list)
+
+    @property
+    def paths(self) -> list[Path]:
+        """Every input path, files first then segments."""
+        return [path for _, path in self.files] + self.segments
+
+
+# (data_type, json filename) -> date -> inputs
+IngestedIndex = dict[tuple[str, str], dict[str, DateInputs]]
+
+
+def _logical_name(name: str) -> Optional[tuple[str, int]]:
+    """Logical JSON name of a stored file and its preference rank, or None."""
+    for rank, suffix in enumerate(_SUFFIXES):
+        stored = ".json" + suffix
+        if name.endswith(stored):
+            return name[: len(name) - len(suffix)], rank
+    return None
+
+
+def _subdirs(path: Path) -> list[os.DirEntry]:
+    if not path.is_dir():
+        return []
+    with os.scandir(path) as entries:
+        return [entry for entry in entries if entry.is_dir()]
+
+
+def index_ingested_tree(
+    ingested_base_dir: Path, data_types: Iterable[str] = ("player", "club")
+) -> IngestedIndex:
+    """
+    Walk the ingested tree once and group every input by kind and date.
+
+    When a file is stored in several encodings, the one ``find_json`` would
+    pick is kept. Segments are listed oldest first.
+
+    Args:
+        ingested_base_dir: Ingested data directory
+        data_types: Data type directories to index
+
+    Returns:
+        IngestedIndex of per-tag JSON files and NDJSON segments
+    """
+    base = Path(ingested_base_dir)
+    index: IngestedIndex = {}
+
+    for data_type in data_types:
+        for tag_entry in _subdirs(base / data_type):
+            for date_entry in _subdirs(Path(tag_entry.path)):
+                best: dict[str, tuple[int, Path]] = {}
+                with os.scandir(date_entry.path) as entries:
+                    for entry in entries:
+                        logical = _logical_name(entry.name)
+                        if logical is None or not entry.is_file():
+                            continue
+                        name, rank = logical
+                        if name not in best or rank < best[name][0]:
+                            best[name] = (rank, Path(entry.path))
+                for name, (_, path) in best.items():
+                    inputs = index.setdefault((data_type, name), {}).setdefault(
+                        date_entry.name, DateInputs()
+                    )
+                    inputs.files.append((tag_entry.name, path))
+
+        for date_entry in _subdirs(base / SEGMENTS_DIRNAME / data_type):
+            with os.scandir(date_entry.path) as entries:
+                segments = sorted(
+                    entry.name for entry in entries if entry.name.endswith(".ndjson")
+                )
+            for segment in segments:
+                name = segment.rsplit("-", 1)[0] + ".json"
+                inputs = index.setdefault((data_type, name), {}).setdefault(
+                    date_entry.name, DateInputs()
+                )
+                inputs.segments.append(Path(date_entry.path) / segment)
+
+    for dates in index.values():
+        for inputs in dates.values():
+            inputs.files.sort()
+    return index
@@ -0,0 +1,195 @@
+"""
+Serializer backends for ingested JSON payloads.
+
+Formats:
+- "pretty": indented JSON (``.json``), the historical layout
+- "compact": JSON without whitespace (``.json``), the default
+- "gzip": compact JSON compressed with gzip (``.json.gz``)
+- "zstd": compact JSON compressed with Zstandard (``.json.zst``), requires
+  the optional ``zstandard`` package
+
+Readers detect the encoding from the file content, so trees mixing formats
+(e.g. after changing ``BRAWLSTARS_JSON_FORMAT``) are read transparently.
+"""
+
+import gzip
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+JSON_FORMAT_SUFFIXES = {
+    "pretty": "",
+    "compact": "",
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+DEFAULT_JSON_FORMAT = "compact"
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def get_json_format() -> str:
+    """
+    Serializer format for new files, from ``BRAWLSTARS_JSON_FORMAT``.
+
+    Returns:
+        One of the JSON_FORMAT_SUFFIXES keys
+    """
+    json_format = os.getenv("BRAWLSTARS_JSON_FORMAT", DEFAULT_JSON_FORMAT)
+    return validate_json_format(json_format)
+
+
+def validate_json_format(json_format: str) -> str:
+    if json_format not in JSON_FORMAT_SUFFIXES:
+        raise ValueError(
+            f"Unknown JSON format {json_format!r}, "
+            f"expected one of {', '.join(JSON_FORMAT_SUFFIXES)}"
+        )
+    if json_format == "zstd" and zstandard is None:
+        raise ImportError("The zstd JSON format requires: pip install zstandard")
+    return json_format
+
+
+def encode_json(data: dict, json_format: str) -> bytes:
+    """Serialize a payload to bytes in the given format."""
+    if json_format == "pretty":
+        return json.dumps(data, indent=2).encode()
+    payload = json.dumps(data, separators=(",", ":")).encode()
+    if json_format == "gzip":
+        return gzip.compress(payload, compresslevel=6, mtime=0)
+    if json_format == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(payload)  # type: ignore[union-attr]
+    return payload
+
+
+def decompress_json(raw: bytes) -> bytes:
+    """Plain JSON bytes of bytes written by ``encode_json``, whatever their format."""
+    if raw.startswith(_GZIP_MAGIC):
+        return gzip.decompress(raw)
+    if raw.startswith(_ZSTD_MAGIC):
+        if zstandard is None:
+            raise ImportError("Reading .json.zst files requires: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+    return raw
+
+
+def decode_json(raw: bytes) -> dict:
+    """Deserialize bytes written by ``encode_json``, whatever their format."""
+    return json.loads(decompress_json(raw))
+
+
+def encoded_path(file_path: Path, json_format: str) -> Path:
+    """Path of ``file_path`` (e.g. ``player.json``) once encoded in a format."""
+    suffix = JSON_FORMAT_SUFFIXES[json_format]
+    return file_path.with_name(file_path.name + suffix) if suffix else file_path
+
+
+def candidate_paths(file_path: Path) -> list[Path]:
+    """Every path a logical JSON file can be stored at, plain first."""
+    suffixes = dict.fromkeys(JSON_FORMAT_SUFFIXES.values())
+    return [file_path.with_name(file_path.name + suffix) for suffix in suffixes]
+
+
+def find_json(file_path: Path) -> Optional[Path]:
+    """
+    Locate a logical JSON file in any encoding.
+
+    Args:
+        file_path: Plain path, e.g. ``.../player.json``
+
+    Returns:
+        Existing path (plain or compressed), or None
+    """
+    for path in candidate_paths(file_path):
+        if path.exists():
+            return path
+    return None
+
+
+def write_json(data: dict, file_path: Path, json_format: str) -> Path:
+    """
+    Write a payload in a format, replacing copies stored in other encodings.
+
+    The payload is written to a temporary file in the same directory, which
+    then replaces the target: an interrupted write never truncates it.
+
+    Args:
+        data: Payload to write
+        file_path: Plain path, e.g. ``.../player.json``
+        json_format: One of the JSON_FORMAT_SUFFIXES keys
+
+    Returns:
+        Path actually written
+    """
+    target = encoded_path(file_path, json_format)
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(encode_json(data, json_format))
+        os.replace(tmp_path, target)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    for path in candidate_paths(file_path):
+        if path != target and path.exists():
+            path.unlink()
+    return target
+
+
+def read_json(file_path: Path) -> dict:
+    """Read a JSON file written in any supported format."""
+    with open(file_path, "rb") as f:
+        return decode_json(f.read())
+
+
+def migrate_json_tree(base_dir: Path, json_format: str) -> dict:
+    """
+    Re-encode every ingested JSON file under a directory in one format.
+
+    Files already in the target format are left untouched, so the migration
+    can be interrupted and rerun.
+
+    Args:
+        base_dir: Root of the tree (e.g. DATA_INGESTED_DIR)
+        json_format: Target format
+
+    Returns:
+        dict: statistics (files converted, bytes before and after)
+    """
+    validate_json_format(json_format)
+    stats = {"converted": 0, "unchanged": 0, "bytes_before": 0, "bytes_after": 0}
+    files = [
+        path
+        for pattern in ("*.json", "*.json.gz", "*.json.zst")
+        for path in Path(base_dir).rglob(pattern)
+    ]
+    for path in sorted(files):
+        if not path.exists():  # copy already replaced in this migration
+            continue
+        plain = path.with_name(path.name.removesuffix(".gz").removesuffix(".zst"))
+        raw = path.read_bytes()
+        data = decode_json(raw)
+        encoded = encode_json(data, json_format)
+        if encoded_path(plain, json_format) == path and encoded == raw:
+            stats["unchanged"] += 1
+            continue
+        write_json(data, plain, json_format)
+        stats["converted"] += 1
+        stats["bytes_before"] += len(raw)
+        stats["bytes_after"] += len(encoded)
+    logger.info(
+        f"📦 Migrated {stats['converted']} JSON files to {json_format} "
+        f"({stats['bytes_before'] / 1024:.1f} KiB -> "
+        f"{stats['bytes_after'] / 1024:.1f} KiB), "
+        f"{stats['unchanged']} already up to date"
+    )
+    return stats
@@ -1,9 +1,12 @@
 import json
 import logging
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 import polars as pl
 
@@ -11,6 +14,32 @@ from brawlstar_project.constants.paths import (
     DATA_INGESTED_DIR,
     DATA_RAW_DIR,
 )
+from brawlstar_project.processing.utils.battlelog_flattener import flatten_battlelogs
+from brawlstar_project.processing.utils.dataset import partition_dir
+from brawlstar_project.processing.utils.ingested_index import (
+    DateInputs,
+    IngestedIndex,
+    index_ingested_tree,
+)
+from brawlstar_project.processing.utils.json_codec import (
+    decompress_json,
+    find_json,
+    get_json_format,
+    read_json,
+    validate_json_format,
+    write_json,
+)
+from brawlstar_project.processing.utils.parquet_stream import (
+    StreamingParquetWriter,
+    get_raw_batch_limits,
+)
+from brawlstar_project.processing.utils.raw_manifest import RawManifest, fingerprint
+from brawlstar_project.processing.utils.segment_store import (
+    DEFAULT_MAX_SEGMENT_BYTES,
+    SegmentStore,
+    get_ingested_storage,
+    segment_kind,
+)
 
 # Set up logging
 logging.basicConfig(
@@ -19,6 +48,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_segment_stores: dict[Path, SegmentStore] = {}
+
+
+def get_segment_store() -> SegmentStore:
+    """
+    Segment store of the ingested directory, shared by the whole process.
+
+    The segment size limit comes from ``BRAWLSTARS_SEGMENT_MAX_MB`` (default 64).
+    """
+    if DATA_INGESTED_DIR not in _segment_stores:
+        max_mb = os.getenv("BRAWLSTARS_SEGMENT_MAX_MB")
+        max_bytes = (
+            int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_SEGMENT_BYTES
+        )
+        _segment_stores[DATA_INGESTED_DIR] = SegmentStore(DATA_INGESTED_DIR, max_bytes)
+    return _segment_stores[DATA_INGESTED_DIR]
+
 
 def save_json_data_partitioned(
     data: dict,
@@ -26,6 +72,7 @@ def save_json_data_partitioned(
     data_type: str,  # "player" or "club"
     filename: str = "data.json",
     validate_func: Optional[Callable[[dict], dict]] = None,
+    json_format: Optional[str] = None,
 ) -> str:
     """
     Save any data dict to JSON file under partitioned structure: data_type/tag/today/filename.
@@ -36,26 +83,116 @@ def save_json_data_partitioned(
         data_type: Data type ("player" or "club")
         filename: JSON filename (default: "data.json")
         validate_func: Optional callable to validate/transform data before saving
+        json_format: Serializer format ("pretty", "compact", "gzip", "zstd"),
+            defaults to BRAWLSTARS_JSON_FORMAT or "compact"
 
     Returns:
-        Path to saved JSON file
+        Path to saved JSON file (with ".gz"/".zst" appended when compressed),
+        or to the NDJSON segment when BRAWLSTARS_INGESTED_STORAGE=segments
     """
     if validate_func:
         data = validate_func(data)
 
-    today = datetime.today().strftime("%Y-%m-%d")
-    dir_path = DATA_INGESTED_DIR / data_type / tag / today
-    os.makedirs(dir_path, exist_ok=True)
+    if get_ingested_storage() == "segments":
+        segment = get_segment_store().append(
+            data, tag, data_type, segment_kind(filename)
+        )
+        logger.info(f"Data for {tag} appended to: {segment}")
+        return str(segment)
 
-    file_path = dir_path / filename
+    # Reject an unknown format before creating the partition directory
+    json_format = validate_json_format(json_format or get_json_format())
+    file_path = ingested_file_path(tag, data_type, filename)
+    os.makedirs(file_path.parent, exist_ok=True)
 
-    with open(file_path, "w") as f:
-        json.dump(data, f, indent=2)
+    file_path = write_json(data, file_path, json_format)
 
     logger.info(f"Data saved in: {file_path}")
     return str(file_path)
 
 
+def ingested_file_path(
+    tag: str, data_type: str, filename: str, date: Optional[str] = None
+) -> Path:
+    """
+    Path of an ingested JSON file: data_type/tag/date/filename.
+
+    Args:
+        tag: Tag identifier (player or club)
+        data_type: Data type ("player" or "club")
+        filename: JSON filename
+        date: Partition date (YYYY-MM-DD), defaults to today
+
+    Returns:
+        Path under DATA_INGESTED_DIR
+    """
+    date = date or datetime.today().strftime("%Y-%m-%d")
+    return DATA_INGESTED_DIR / data_type / tag / date / filename
+
+
+def load_ingested_json(
+    tag: str, data_type: str, filename: str, date: Optional[str] = None
+) -> Optional[dict]:
+    """
+    Load an ingested JSON file written by ``save_json_data_partitioned``.
+
+    Returns:
+        The saved data dict, or None if the file is missing or unreadable
+    """
+    file_path = find_json(ingested_file_path(tag, data_type, filename, date))
+    if file_path is None:
+        store = get_segment_store()
+        if not store.root.exists():
+            return None
+        return store.load(tag, data_type, segment_kind(filename), date)
+    try:
+        return read_json(file_path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read {file_path}: {e}")
+        return None
+
+
+def ingested_exists(
+    tag: str, data_type: str, filename: str, date: Optional[str] = None
+) -> bool:
+    """
+    Check whether a payload was saved for a tag and date, as a file or segment record.
+    """
+    if find_json(ingested_file_path(tag, data_type, filename, date)) is not None:
+        return True
+    store = get_segment_store()
+    return store.root.exists() and store.contains(
+        tag, data_type, segment_kind(filename), date
+    )
+
+
+def _already_saved_from_cache(
+    data: dict, tag: str, data_type: str, filename: str
+) -> bool:
+    """
+    Check whether a payload can skip validation and saving.
+
+    True for response-cache hits whose partition for today is already written.
+
+    Args:
+        data: Payload returned by the API client
+        tag: Tag identifier (player or club)
+        data_type: Data type ("player" or "club")
+        filename: JSON filename
+
+    Returns:
+        True if nothing needs to be written
+    """
+    from brawlstar_project.processing.ingested.cache import is_cache_hit
+
+    if not is_cache_hit(data):
+        return False
+    if not ingested_exists(tag, data_type, filename):
+        return False
+    logger.info(f"    🗄️ Unchanged {filename} for {tag} (cache hit), skipping save")
+    return True
+
+
 # Partitioned save functions
 def save_player_data_partitioned(data: dict, player_tag: str) -> dict:
     """
@@ -68,6 +205,9 @@ def save_player_data_partitioned(data: dict, player_tag: str) -> dict:
     Returns:
         Validated player data dict
     """
+    if _already_saved_from_cache(data, player_tag, "player", "player.json"):
+        return data
+
     from brawlstar_project.entities.player.models import PlayerData
 
     # Validate data with Pydantic model
@@ -90,6 +230,9 @@ def save_battlelog_data_partitioned(data: dict, player_tag: str) -> dict:
     Returns:
         Validated battlelog data dict
     """
+    if _already_saved_from_cache(data, player_tag, "player", "battlelog.json"):
+        return data
+
     from brawlstar_project.entities.player.models import BattlelogData
 
     # Check if data is empty or has no items
@@ -124,6 +267,9 @@ def save_club_data_partitioned(data: dict, club_tag: str) -> dict:
     Returns:
         Validated club data dict
     """
+    if _already_saved_from_cache(data, club_tag, "club", "club.json"):
+        return data
+
     from brawlstar_project.entities.club.models import ClubData
 
     # Validate data with Pydantic model
@@ -146,6 +292,9 @@ def save_club_members_data_partitioned(data: dict, club_tag: str) -> dict:
     Returns:
         Validated club members data dict
     """
+    if _already_saved_from_cache(data, club_tag, "club", "club_members.json"):
+        return data
+
     from brawlstar_project.entities.club.models import ClubMembersData
 
     # Validate data with Pydantic model
@@ -157,6 +306,182 @@ def save_club_members_data_partitioned(data: dict, club_tag: str) -> dict:
     return validated_data
 
 
+def _iter_ingested_records(
+    files: list[tuple[str, Path]], segments: list[Path]
+) -> Iterator[tuple[str, dict, str, int]]:
+    """
+    Yield every ingested payload from segments and per-tag files, once per tag.
+
+    A tag stored both ways (e.g. while migrating to segments) is read from
+    its segment record only.
+
+    Yields:
+        (tag, data, source path, size of the payload's JSON in bytes) tuples
+    """
+    segment_tags = set()
+    # One bulk read per segment instead of one open per tag
+    for tag, data, size in SegmentStore.read_sized_segments(segments):
+        segment_tags.add(tag)
+        yield tag, data, f"{tag} in {len(segments)} segment(s)", size
+    for tag, json_file in files:
+        if tag in segment_tags:
+            logger.info(f"Skipping {json_file}: {tag} has a segment record")
+            continue
+        raw = decompress_json(json_file.read_bytes())
+        yield tag, json.loads(raw), str(json_file), len(raw)
+
+
+# (data_type, JSON filename, Parquet filename) of every raw-stage conversion
+RAW_CONVERSIONS = [
+    ("player", "player.json", "player.parquet"),
+    ("player", "battlelog.json", "battlelog.parquet"),
+    ("club", "club.json", "club.parquet"),
+    ("club", "club_members.json", "club_members.parquet"),
+]
+
+
+def _flatteners(
+    json_filename: str, validate: bool
+) -> tuple[Callable[..., pl.DataFrame], Optional[Callable]]:
+    """
+    Flatten functions of one kind of ingested file.
+
+    Module-level partials rather than lambdas, so that worker processes can
+    rebuild them from the file name alone.
+
+    Returns:
+        (flatten_func, batch_flatten_func) as taken by
+        ``convert_jsons_to_parquet_per_date_partitioned``
+    """
+    if json_filename == "player.json":
+        return partial(flatten_player_data, validate=validate), None
+    if json_filename == "battlelog.json":
+        # Trusted battlelogs of a date are flattened together, column-wise
+        return (
+            partial(flatten_battlelog_data, validate=validate),
+            None if validate else flatten_battlelogs,
+        )
+    if json_filename == "club.json":
+        return partial(flatten_club_data, validate=validate), None
+    if json_filename == "club_members.json":
+        return partial(flatten_club_members_data, validate=validate), None
+    raise ValueError(f"No flattener for {json_filename}")
+
+
+def _convert_date(
+    date_inputs: DateInputs,
+    parquet_file: Path,
+    json_filename: str,
+    flatten_func: Callable[..., pl.DataFrame],
+    batch_flatten_func: Optional[Callable[[list[tuple[str, dict]]], pl.DataFrame]],
+) -> int:
+    """
+    Convert the ingested inputs of one kind and date to a Parquet file.
+
+    Payloads are flattened and written in batches (see
+    ``get_raw_batch_limits``), so memory is bounded by the batch rather than
+    by the number of tags ingested that day.
+
+    Returns:
+        Number of rows written (0 if there was nothing to write)
+    """
+    batch_size, memory_limit = get_raw_batch_limits()
+    dfs: list[pl.DataFrame] = []
+    buffered_bytes = 0
+    batch: list[tuple[str, dict]] = []
+    payloads = 0
+
+    with StreamingParquetWriter(parquet_file) as writer:
+
+        def flush() -> None:
+            nonlocal buffered_bytes
+            if batch:
+                dfs.append(batch_flatten_func(batch))  # type: ignore[misc]
+                batch.clear()
+            if dfs:
+                # Union all player/battlelog data of this batch
+                writer.write(pl.concat(dfs))
+                dfs.clear()
+            buffered_bytes = 0
+
+        for tag, data, source, size in _iter_ingested_records(
+            date_inputs.files, date_inputs.segments
+        ):
+            # Skip empty battlelog data (no items or empty items)
+            if json_filename == "battlelog.json" and (
+                not data.get("items") or len(data.get("items", [])) == 0
+            ):
+                logger.info(f"Skipping empty battlelog: {source}")
+                continue
+            payloads += 1
+            # Flatten data to DataFrame
+            if batch_flatten_func is not None:
+                # Raw payloads are buffered: count their JSON size
+                batch.append((tag, data))
+                buffered_bytes += size
+            else:
+                if json_filename == "battlelog.json":
+                    df = flatten_func(data, tag)
+                else:
+                    df = flatten_func(data)
+                if not df.is_empty():
+                    dfs.append(df)
+                    buffered_bytes += df.estimated_size()
+            if len(batch) + len(dfs) >= batch_size or buffered_bytes >= memory_limit:
+                flush()
+        flush()
+
+    if writer.rows:
+        logger.info(f"Converted: {payloads} files -> {parquet_file}")
+    return writer.rows
+
+
+def _convert_partition(
+    date_inputs: DateInputs, parquet_file: Path, json_filename: str, validate: bool
+) -> int:
+    """Convert one (data_type, date) partition; the process-pool entry point."""
+    flatten_func, batch_flatten_func = _flatteners(json_filename, validate)
+    return _convert_date(
+        date_inputs, parquet_file, json_filename, flatten_func, batch_flatten_func
+    )
+
+
+def _pending_partitions(
+    index: IngestedIndex,
+    ingested_path: Path,
+    raw_path: Path,
+    data_type: str,
+    json_filename: str,
+    parquet_filename: str,
+    manifest: Optional[RawManifest],
+) -> list[tuple[Path, DateInputs, dict[str, list[int]]]]:
+    """
+    Dates of one kind that need converting.
+
+    Returns:
+        (parquet file, inputs, input fingerprint) per date, oldest first; dates
+        the manifest reports as current are left out
+    """
+    pending = []
+    skipped = 0
+    for date_str, date_inputs in sorted(
+        index.get((data_type, json_filename), {}).items()
+    ):
+        parquet_file = partition_dir(raw_path, data_type, date_str) / parquet_filename
+        inputs = {}
+        if manifest is not None:
+            inputs = fingerprint(date_inputs.paths, ingested_path)
+            if manifest.is_current(parquet_file, inputs):
+                skipped += 1
+                continue
+        pending.append((parquet_file, date_inputs, inputs))
+    if skipped:
+        logger.info(
+            f"⏭️ Skipped {skipped} unchanged date(s) for {data_type}/{parquet_filename}"
+        )
+    return pending
+
+
 def convert_jsons_to_parquet_per_date_partitioned(
     ingested_base_dir: str,
     raw_base_dir: str,
@@ -164,10 +489,19 @@ def convert_jsons_to_parquet_per_date_partitioned(
     json_filename: str,
     parquet_filename: str,
     flatten_func: Callable[..., pl.DataFrame],
+    batch_flatten_func: Optional[
+        Callable[[list[tuple[str, dict]]], pl.DataFrame]
+    ] = None,
+    manifest: Optional[RawManifest] = None,
+    index: Optional[IngestedIndex] = None,
 ):
     """
     Convert JSON files to Parquet files for partitioned structure.
 
+    Payloads stored in NDJSON segments (``_segments/``) are converted along
+    with the per-tag JSON files. With a manifest, dates whose inputs are
+    unchanged since their last conversion are skipped.
+
     Args:
         ingested_base_dir: Base directory where JSON data is stored
         raw_base_dir: Base directory to write Parquet files
@@ -175,107 +509,139 @@ def convert_jsons_to_parquet_per_date_partitioned(
         json_filename: JSON filename to convert
         parquet_filename: Parquet filename to create
         flatten_func: Function to flatten JSON data to DataFrame
+        batch_flatten_func: Optional function flattening all (tag, data) pairs
+            of a date at once; used instead of ``flatten_func`` when given
+        manifest: Optional manifest for incremental conversion; updated with
+            the inputs of every converted date (the caller saves it)
+        index: Index of the ingested tree shared by several conversions,
+            built for ``data_type`` when not given
     """
     ingested_path = Path(ingested_base_dir)
-    raw_path = Path(raw_base_dir)
+    if index is None:
+        index = index_ingested_tree(ingested_path, data_types=[data_type])
+
+    for parquet_file, date_inputs, inputs in _pending_partitions(
+        index,
+        ingested_path,
+        Path(raw_base_dir),
+        data_type,
+        json_filename,
+        parquet_filename,
+        manifest,
+    ):
+        rows = _convert_date(
+            date_inputs, parquet_file, json_filename, flatten_func, batch_flatten_func
+        )
+        if manifest is not None:
+            manifest.record(parquet_file, inputs, rows=rows)
 
-    # Find all data_type directories (e.g., player/#TAG)
-    data_type_dirs = list(ingested_path.glob(f"{data_type}/*"))
-
-    # Collect all dates across all players
-    all_dates = set()
-    for data_type_dir in data_type_dirs:
-        date_dirs = list(data_type_dir.glob("*"))
-        for date_dir in date_dirs:
-            all_dates.add(date_dir.name)
-
-    for date_str in sorted(all_dates):
-        dfs = []
-        for data_type_dir in data_type_dirs:
-            date_dir = data_type_dir / date_str
-            json_file = date_dir / json_filename
-            if not json_file.exists():
-                continue
-            # Read JSON data
-            with open(json_file, "r") as f:
-                data = json.load(f)
-            # Skip empty battlelog data (no items or empty items)
-            if json_filename == "battlelog.json" and (
-                not data.get("items") or len(data.get("items", [])) == 0
-            ):
-                logger.info(f"Skipping empty battlelog: {json_file}")
-                continue
-            # Flatten data to DataFrame
-            if json_filename == "battlelog.json":
-                player_tag = data_type_dir.name
-                df = flatten_func(data, player_tag)
-            else:
-                df = flatten_func(data)
-            if not df.is_empty():
-                dfs.append(df)
-        if not dfs:
-            continue
-        # Union all player/battlelog data for this date
-        full_df = pl.concat(dfs)
-        # Create output directory structure (without tag level)
-        output_dir = raw_path / data_type / date_str
-        output_dir.mkdir(parents=True, exist_ok=True)
-        # Save as Parquet
-        parquet_file = output_dir / parquet_filename
-        full_df.write_parquet(str(parquet_file))
-        logger.info(f"Converted: {len(dfs)} files -> {parquet_file}")
+
+def trust_ingested() -> bool:
+    """
+    Whether the raw stage trusts ingested payloads, from ``BRAWLSTARS_TRUST_INGESTED``.
+
+    Every payload is validated with Pydantic before being saved, so by default
+    the raw stage flattens saved data without validating it a second time.
+    Set BRAWLSTARS_TRUST_INGESTED=0 to re-validate (e.g. for hand-edited files).
+    """
+    return os.getenv("BRAWLSTARS_TRUST_INGESTED", "1") != "0"
 
 
 def convert_all_json_to_parquet_partitioned(
     ingested_base_dir: str = str(DATA_INGESTED_DIR),
     raw_base_dir: str = str(DATA_RAW_DIR),
+    trusted: Optional[bool] = None,
+    incremental: bool = True,
+    workers: int = 1,
 ):
     """
     Convert JSON files to Parquet files for partitioned structure.
 
+    Every (data_type, date) partition of every kind of file is converted
+    independently: a partition that fails is logged and left out of the
+    manifest (so the next run retries it) while the others are still written.
+
     Args:
         ingested_base_dir: Base directory where JSON data is stored
         raw_base_dir: Base directory to write Parquet files
+        trusted: Skip re-validating payloads validated at ingest,
+            defaults to ``trust_ingested()``
+        incremental: Only reconvert dates whose inputs changed since the last
+            run, according to ``<raw_base_dir>/_manifest.json``; False
+            reconverts everything and rebuilds the manifest
+        workers: Number of worker processes converting partitions in
+            parallel; 1 converts in-process, 0 uses every CPU core
+
+    Raises:
+        RuntimeError: If any partition failed to convert
     """
-    # Convert player data
-    convert_jsons_to_parquet_per_date_partitioned(
-        ingested_base_dir=ingested_base_dir,
-        raw_base_dir=raw_base_dir,
-        data_type="player",
-        json_filename="player.json",
-        parquet_filename="player.parquet",
-        flatten_func=flatten_player_data,
-    )
-
-    # Convert battlelog data
-    convert_jsons_to_parquet_per_date_partitioned(
-        ingested_base_dir=ingested_base_dir,
-        raw_base_dir=raw_base_dir,
-        data_type="player",
-        json_filename="battlelog.json",
-        parquet_filename="battlelog.parquet",
-        flatten_func=lambda data, tag: flatten_battlelog_data(data, tag or ""),
-    )
-
-    # Convert club data
-    convert_jsons_to_parquet_per_date_partitioned(
-        ingested_base_dir=ingested_base_dir,
-        raw_base_dir=raw_base_dir,
-        data_type="club",
-        json_filename="club.json",
-        parquet_filename="club.parquet",
-        flatten_func=flatten_club_data,
-    )
+    validate = not (trust_ingested() if trusted is None else trusted)
+    ingested_path = Path(ingested_base_dir)
+    raw_path = Path(raw_base_dir)
+    manifest = RawManifest(raw_path)
+    if not incremental:
+        manifest.clear()
+    # One walk of the ingested tree serves all four conversions
+    index = index_ingested_tree(ingested_path)
+
+    partitions = []
+    for data_type, json_filename, parquet_filename in RAW_CONVERSIONS:
+        for parquet_file, date_inputs, inputs in _pending_partitions(
+            index,
+            ingested_path,
+            raw_path,
+            data_type,
+            json_filename,
+            parquet_filename,
+            manifest,
+        ):
+            partitions.append((parquet_file, date_inputs, json_filename, inputs))
+
+    failures = []
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(partitions) > 1:
+        logger.info(f"⚙️ Converting {len(partitions)} partitions with {workers} workers")
+        # spawn: forking a process whose Polars thread pool is running can deadlock
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _convert_partition,
+                    date_inputs,
+                    parquet_file,
+                    json_filename,
+                    validate,
+                ): (parquet_file, inputs)
+                for parquet_file, date_inputs, json_filename, inputs in partitions
+            }
+            for future in as_completed(futures):
+                parquet_file, inputs = futures[future]
+                try:
+                    rows = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Failed to convert {parquet_file}: {e}")
+                    failures.append(parquet_file)
+                    continue
+                manifest.record(parquet_file, inputs, rows=rows)
+    else:
+        for parquet_file, date_inputs, json_filename, inputs in partitions:
+            try:
+                rows = _convert_partition(
+                    date_inputs, parquet_file, json_filename, validate
+                )
+            except Exception as e:
+                logger.error(f"❌ Failed to convert {parquet_file}: {e}")
+                failures.append(parquet_file)
+                continue
+            manifest.record(parquet_file, inputs, rows=rows)
+    manifest.save()
 
-    # Convert club members data
-    convert_jsons_to_parquet_per_date_partitioned(
-        ingested_base_dir=ingested_base_dir,
-        raw_base_dir=raw_base_dir,
-        data_type="club",
-        json_filename="club_members.json",
-        parquet_filename="club_members.parquet",
-        flatten_func=flatten_club_members_data,
-    )
+    if failures:
+        raise RuntimeError(
+            f"{len(failures)} raw partition(s) failed: "
+            + ", ".join(str(path) for path in sorted(failures))
+        )
 
 
 def fetch_club_data(client, club) -> dict:
@@ -313,12 +679,13 @@ def fetch_club_members_data(client, club) -> dict:
 
 
 # Flatten functions that convert JSON data to DataFrames
-def flatten_player_data(data: dict) -> pl.DataFrame:
+def flatten_player_data(data: dict, validate: bool = True) -> pl.DataFrame:
     """
     Flatten player data to DataFrame.
 
     Args:
         data: Raw player data from JSON
+        validate: Re-validate the data with Pydantic (see ``trust_ingested``)
 
     Returns:
         DataFrame with flattened player data
@@ -328,7 +695,7 @@ def flatten_player_data(data: dict) -> pl.DataFrame:
     )
 
     try:
-        flattened = create_flattened_player_data(data)
+        flattened = create_flattened_player_data(data, validate=validate)
         tag = getattr(flattened, "tag", None)
         if not tag or tag == "#UNKNOWN" or tag == "UNKNOWN":
             logger.warning(f"Player data missing or unknown tag: {tag}")
@@ -338,19 +705,23 @@ def flatten_player_data(data: dict) -> pl.DataFrame:
         return pl.DataFrame()
 
 
-def flatten_battlelog_data(data: dict, player_tag: str = "") -> pl.DataFrame:
+def flatten_battlelog_data(
+    data: dict, player_tag: str = "", validate: bool = True
+) -> pl.DataFrame:
     """
     Flatten battlelog data to DataFrame.
 
     Args:
         data: Raw battlelog data from JSON
         player_tag: The tag of the player whose battlelog this is
+        validate: Re-validate the data with Pydantic (see ``trust_ingested``)
 
     Returns:
         DataFrame with flattened battlelog data
     """
     from brawlstar_project.entities.player.models import (
         create_flattened_battle_data,
+        create_flattened_battle_rows,
     )
 
     try:
@@ -358,6 +729,10 @@ def flatten_battlelog_data(data: dict, player_tag: str = "") -> pl.DataFrame:
             logger.warning(
                 f"Battlelog data missing or unknown player tag: {player_tag}"
             )
+        if not validate:
+            # Trusted data: build rows directly, no model per battle
+            rows = create_flattened_battle_rows(data, player_tag)
+            return pl.DataFrame(rows) if rows else pl.DataFrame()
         flattened_battles = create_flattened_battle_data(data, player_tag)
         if flattened_battles:
             return pl.DataFrame([battle.model_dump() for battle in flattened_battles])
@@ -368,12 +743,13 @@ def flatten_battlelog_data(data: dict, player_tag: str = "") -> pl.DataFrame:
         return pl.DataFrame()
 
 
-def flatten_club_data(data: dict) -> pl.DataFrame:
+def flatten_club_data(data: dict, validate: bool = True) -> pl.DataFrame:
     """
     Flatten club data to DataFrame.
 
     Args:
         data: Raw club data from JSON
+        validate: Re-validate the data with Pydantic (see ``trust_ingested``)
 
     Returns:
         DataFrame with flattened club data
@@ -381,19 +757,20 @@ def flatten_club_data(data: dict) -> pl.DataFrame:
     from brawlstar_project.entities.club.models import create_flattened_club_data
 
     try:
-        flattened = create_flattened_club_data(data)
+        flattened = create_flattened_club_data(data, validate=validate)
         return pl.DataFrame([flattened.model_dump()])
     except Exception as e:
         logger.error(f"Error flattening club data: {e}")
         return pl.DataFrame()
 
 
-def flatten_club_members_data(data: dict) -> pl.DataFrame:
+def flatten_club_members_data(data: dict, validate: bool = True) -> pl.DataFrame:
     """
     Flatten club members data to DataFrame.
 
     Args:
         data: Raw club members data from JSON
+        validate: Re-validate the data with Pydantic (see ``trust_ingested``)
 
     Returns:
         DataFrame with flattened club members data
@@ -403,7 +780,7 @@ def flatten_club_members_data(data: dict) -> pl.DataFrame:
     )
 
     try:
-        flattened = create_flattened_club_members_data(data)
+        flattened = create_flattened_club_members_data(data, validate=validate)
         if flattened.items:
             return pl.DataFrame([member for member in flattened.items])
         else:
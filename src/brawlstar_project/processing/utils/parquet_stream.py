@@ -0,0 +1,106 @@
+"""
+Streaming Parquet writer with bounded memory.
+
+Batches written to a ``StreamingParquetWriter`` are spilled as part files next
+to the target. On close, a single part is renamed into place; several parts
+are merged with a streaming ``sink_parquet``, which copies them row group by
+row group without loading the whole day in memory. Either way the target only
+appears once complete.
+"""
+
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RAW_BATCH_SIZE = 1000
+DEFAULT_RAW_MEMORY_MB = 256
+
+
+def get_raw_batch_limits() -> tuple[int, int]:
+    """
+    Raw-stage buffering limits, from the environment.
+
+    ``BRAWLSTARS_RAW_BATCH_SIZE`` is the number of payloads flattened before a
+    batch is written, ``BRAWLSTARS_RAW_MEMORY_MB`` the size of buffered
+    flattened rows, or of buffered payloads' JSON for payloads flattened
+    together, at which a batch is written early.
+
+    Returns:
+        (batch size in payloads, memory ceiling in bytes)
+    """
+    batch_size = int(os.getenv("BRAWLSTARS_RAW_BATCH_SIZE", DEFAULT_RAW_BATCH_SIZE))
+    memory_mb = float(os.getenv("BRAWLSTARS_RAW_MEMORY_MB", DEFAULT_RAW_MEMORY_MB))
+    if batch_size < 1 or memory_mb <= 0:
+        raise ValueError(
+            "BRAWLSTARS_RAW_BATCH_SIZE and BRAWLSTARS_RAW_MEMORY_MB must be positive"
+        )
+    return batch_size, int(memory_mb * 1024 * 1024)
+
+
+class StreamingParquetWriter:
+    """
+    Write a Parquet file batch by batch.
+
+    Use as a context manager: parts are merged into ``path`` on a clean exit
+    and discarded if an exception escapes.
+
+    Args:
+        path: Target Parquet file
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.parts_dir = self.path.with_name(f".{self.path.name}.parts")
+        self.parts: list[Path] = []
+        self.rows = 0
+
+    def write(self, df: pl.DataFrame) -> None:
+        """Spill one batch of rows to a new part file."""
+        if df.is_empty():
+            return
+        self.parts_dir.mkdir(parents=True, exist_ok=True)
+        part = self.parts_dir / f"part-{len(self.parts):05d}.parquet"
+        df.write_parquet(part)
+        self.parts.append(part)
+        self.rows += df.height
+
+    def close(self) -> int:
+        """
+        Publish the written batches as the target file.
+
+        Returns:
+            Number of rows written; 0 leaves the target untouched
+        """
+        if len(self.parts) == 1:
+            os.replace(self.parts[0], self.path)
+        elif self.parts:
+            tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+            # Batches may differ in inferred dtypes (e.g. an all-null column)
+            pl.concat(
+                [pl.scan_parquet(part) for part in self.parts], how="vertical_relaxed"
+            ).sink_parquet(tmp_path)
+            os.replace(tmp_path, self.path)
+            logger.info(f"Merged {len(self.parts)} batches -> {self.path}")
+        self.abort()
+        return self.rows
+
+    def abort(self) -> None:
+        """Discard every part written so far."""
+        shutil.rmtree(self.parts_dir, ignore_errors=True)
+        self.parts = []
+
+    def __enter__(self) -> "StreamingParquetWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> Optional[bool]:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return None
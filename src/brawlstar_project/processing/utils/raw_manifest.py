@@ -0,0 +1,112 @@
+"""
+Manifest of the ingested inputs each raw-stage parquet file was built from.
+
+Each output (e.g. ``player/date=2025-07-11/battlelog.parquet``) maps to the
+``[mtime_ns, size]`` of every JSON file or NDJSON segment it was converted
+from. A date is only reconverted when that fingerprint changes, so a daily run
+parses new data only instead of the whole history.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "_manifest.json"
+
+
+def fingerprint(paths: Iterable[Path], base_dir: Path) -> dict[str, list[int]]:
+    """
+    Fingerprint input files by modification time and size.
+
+    Args:
+        paths: Input files
+        base_dir: Directory the recorded paths are made relative to
+
+    Returns:
+        dict: relative path -> [mtime_ns, size]
+    """
+    inputs = {}
+    for path in paths:
+        stat = path.stat()
+        inputs[Path(path).relative_to(base_dir).as_posix()] = [
+            stat.st_mtime_ns,
+            stat.st_size,
+        ]
+    return inputs
+
+
+class RawManifest:
+    """
+    Persistent ``<raw_base_dir>/_manifest.json`` of converted outputs.
+
+    Args:
+        raw_base_dir: Raw-stage output directory
+    """
+
+    def __init__(self, raw_base_dir: Path):
+        self.raw_base_dir = Path(raw_base_dir)
+        self.path = self.raw_base_dir / MANIFEST_FILENAME
+        self.entries: dict[str, dict] = self._load()
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable raw manifest {self.path}: {e}")
+            return {}
+
+    def _key(self, output: Path) -> str:
+        return Path(output).relative_to(self.raw_base_dir).as_posix()
+
+    def is_current(self, output: Path, inputs: dict[str, list[int]]) -> bool:
+        """
+        Check whether an output is up to date with its inputs.
+
+        Args:
+            output: Parquet file the inputs convert to
+            inputs: Current fingerprint of the inputs
+
+        Returns:
+            True if the recorded inputs are unchanged and the output (if any
+            rows were written) still exists
+        """
+        entry = self.entries.get(self._key(output))
+        if entry is None or entry["inputs"] != inputs:
+            return False
+        return entry["rows"] == 0 or Path(output).exists()
+
+    def record(self, output: Path, inputs: dict[str, list[int]], rows: int) -> None:
+        """Record the inputs an output was just built from."""
+        self.entries[self._key(output)] = {"inputs": inputs, "rows": rows}
+        self._dirty = True
+
+    def rename(self, renamed: dict[str, str]) -> None:
+        """Move entries to new output paths (relative to the raw directory)."""
+        for old, new in renamed.items():
+            if old in self.entries:
+                self.entries[new] = self.entries.pop(old)
+                self._dirty = True
+
+    def clear(self) -> None:
+        """Forget every recorded output, forcing a full reconversion."""
+        self.entries.clear()
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest atomically (temp file + rename) if it changed."""
+        if not self._dirty:
+            return
+        self.raw_base_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.entries, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
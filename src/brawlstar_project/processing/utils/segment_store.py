@@ -0,0 +1,190 @@
+"""
+Append-only NDJSON segment store for ingested payloads.
+
+Instead of one file per tag per day (``data_type/tag/date/filename.json``),
+records are appended to a few rolling segments per date:
+
+    _segments/<data_type>/<date>/<kind>-<00001>.ndjson
+
+where ``kind`` is the logical file name without ``.json`` (e.g. "battlelog").
+Each line is ``{"tag": ..., "data": {...}}``. A record is written with a single
+``O_APPEND`` write, so concurrent writers never interleave lines, and a crash
+can only leave a truncated last line, which readers skip. Segments roll over
+once they reach ``max_segment_bytes``.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+SEGMENTS_DIRNAME = "_segments"
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+
+
+def get_ingested_storage() -> str:
+    """
+    Ingested storage mode, from ``BRAWLSTARS_INGESTED_STORAGE``.
+
+    Returns:
+        "files" (one JSON file per tag per day, the default) or "segments"
+    """
+    storage = os.getenv("BRAWLSTARS_INGESTED_STORAGE", "files")
+    if storage not in ("files", "segments"):
+        raise ValueError(
+            f"Unknown ingested storage {storage!r}, expected 'files' or 'segments'"
+        )
+    return storage
+
+
+def segment_kind(filename: str) -> str:
+    """Segment kind of a logical file name, e.g. "battlelog.json" -> "battlelog"."""
+    return filename.removesuffix(".json")
+
+
+class SegmentStore:
+    """
+    Rolling per-date NDJSON segments under ``<base_dir>/_segments``.
+
+    Args:
+        base_dir: Ingested data directory (e.g. DATA_INGESTED_DIR)
+        max_segment_bytes: Size after which a new segment is started
+    """
+
+    def __init__(
+        self, base_dir: Path, max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES
+    ):
+        self.root = Path(base_dir) / SEGMENTS_DIRNAME
+        self.max_segment_bytes = max_segment_bytes
+        self._lock = threading.Lock()
+        self._tags: dict[tuple[str, str, str], set[str]] = {}
+
+    def _date_dir(self, data_type: str, date: str) -> Path:
+        return self.root / data_type / date
+
+    def segments(self, data_type: str, kind: str, date: str) -> list[Path]:
+        """Segments of one kind and date, oldest first."""
+        return sorted(self._date_dir(data_type, date).glob(f"{kind}-*.ndjson"))
+
+    def dates(self, data_type: str) -> set[str]:
+        """Dates having at least one segment for a data type."""
+        data_type_dir = self.root / data_type
+        if not data_type_dir.exists():
+            return set()
+        return {path.name for path in data_type_dir.iterdir() if path.is_dir()}
+
+    def _current_segment(self, data_type: str, kind: str, date: str, size: int) -> Path:
+        segments = self.segments(data_type, kind, date)
+        if segments:
+            last = segments[-1]
+            if last.stat().st_size + size <= self.max_segment_bytes:
+                return last
+            index = int(last.stem.rsplit("-", 1)[1]) + 1
+        else:
+            index = 1
+        return self._date_dir(data_type, date) / f"{kind}-{index:05d}.ndjson"
+
+    def append(
+        self,
+        data: dict,
+        tag: str,
+        data_type: str,
+        kind: str,
+        date: Optional[str] = None,
+    ) -> Path:
+        """
+        Append one record to the current segment of its kind and date.
+
+        Args:
+            data: Payload to store
+            tag: Tag identifier (player or club)
+            data_type: Data type ("player" or "club")
+            kind: Segment kind (e.g. "player", "battlelog")
+            date: Partition date (YYYY-MM-DD), defaults to today
+
+        Returns:
+            Path of the segment written to
+        """
+        date = date or datetime.today().strftime("%Y-%m-%d")
+        line = (
+            json.dumps({"tag": tag, "data": data}, separators=(",", ":")) + "\n"
+        ).encode()
+        with self._lock:
+            self._date_dir(data_type, date).mkdir(parents=True, exist_ok=True)
+            path = self._current_segment(data_type, kind, date, len(line))
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+            tags = self._tags.get((data_type, kind, date))
+            if tags is not None:
+                tags.add(tag)
+        return path
+
+    def scan(self, data_type: str, kind: str, date: str) -> Iterator[tuple[str, dict]]:
+        """
+        Read every record of a kind and date, one bulk read per segment.
+
+        When a tag was written several times that day, only its last record is
+        returned, like a file overwritten by a later run.
+
+        Yields:
+            (tag, data) pairs
+        """
+        yield from self.read_segments(self.segments(data_type, kind, date))
+
+    @staticmethod
+    def read_segments(paths: Iterable[Path]) -> Iterator[tuple[str, dict]]:
+        """Read records from segments in order, the last record of a tag winning."""
+        for tag, data, _ in SegmentStore.read_sized_segments(paths):
+            yield tag, data
+
+    @staticmethod
+    def read_sized_segments(paths: Iterable[Path]) -> Iterator[tuple[str, dict, int]]:
+        """
+        Like ``read_segments``, with the size of each record.
+
+        Yields:
+            (tag, data, size of the record's JSON line in bytes) tuples
+        """
+        latest: dict[str, tuple[dict, int]] = {}
+        for path in paths:
+            with open(path, "rb") as f:
+                lines = f.read().splitlines()
+            for line in lines:
+                try:
+                    record = json.loads(line)
+                    latest[record["tag"]] = (record["data"], len(line))
+                except (ValueError, KeyError):
+                    logger.warning(f"Skipping malformed record in {path}")
+        for tag, (data, size) in latest.items():
+            yield tag, data, size
+
+    def load(
+        self, tag: str, data_type: str, kind: str, date: Optional[str] = None
+    ) -> Optional[dict]:
+        """Last record stored for a tag on a date, or None."""
+        date = date or datetime.today().strftime("%Y-%m-%d")
+        for record_tag, data in self.scan(data_type, kind, date):
+            if record_tag == tag:
+                return data
+        return None
+
+    def contains(
+        self, tag: str, data_type: str, kind: str, date: Optional[str] = None
+    ) -> bool:
+        """Check whether a tag has a record on a date (index built once per date)."""
+        date = date or datetime.today().strftime("%Y-%m-%d")
+        key = (data_type, kind, date)
+        with self._lock:
+            if key not in self._tags:
+                self._tags[key] = {
+                    record_tag for record_tag, _ in self.scan(data_type, kind, date)
+                }
+            return tag in self._tags[key]
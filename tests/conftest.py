@@ -0,0 +1,201 @@
+"""
+Shared pytest fixtures.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StubApiServer:
+    """
+    Local HTTP server standing in for the Brawl Stars API.
+
+    Routes map a request path to a list of responses ``(status, body, headers)``.
+    Responses are served in order and the last one is repeated.
+    """
+
+    def __init__(self):
+        self.routes: dict[str, list[tuple[int, dict, dict]]] = {}
+        self.requests: list[dict] = []
+        self.connections: set[int] = set()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1/"
+
+    def add_route(
+        self, path: str, body: dict, status: int = 200, headers: dict | None = None
+    ) -> None:
+        self.routes.setdefault(path, []).append((status, body, headers or {}))
+
+    def add_club(self, club_tag: str, member_tags: list[str]) -> None:
+        """Register a club, its member list and every member's endpoints."""
+        encoded_club = club_tag.replace("#", "%23")
+        self.add_route(f"/v1/clubs/{encoded_club}", club_payload(club_tag, member_tags))
+        self.add_route(
+            f"/v1/clubs/{encoded_club}/members", club_members_payload(member_tags)
+        )
+        for tag in member_tags:
+            encoded = tag.replace("#", "%23")
+            if f"/v1/players/{encoded}" not in self.routes:
+                self.add_route(f"/v1/players/{encoded}", player_payload(tag))
+                self.add_route(
+                    f"/v1/players/{encoded}/battlelog", battlelog_payload(tag)
+                )
+
+    def requests_for(self, path: str) -> list[dict]:
+        return [r for r in self.requests if r["path"] == path]
+
+    def _next_response(self, path: str) -> tuple[int, dict, dict]:
+        with self._lock:
+            responses = self.routes.get(path)
+            if not responses:
+                return 404, {"reason": "notFound"}, {}
+            if len(responses) > 1:
+                return responses.pop(0)
+            return responses[0]
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.requests.append(
+                        {"path": self.path, "headers": dict(self.headers)}
+                    )
+                    stub.connections.add(self.client_address[1])
+                status, body, headers = stub._next_response(self.path)
+                payload = json.dumps(body).encode() if body is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def stub_api():
+    """Start a local stub API server for the duration of a test."""
+    server = StubApiServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def player_payload(tag: str) -> dict:
+    return {
+        "tag": tag,
+        "name": f"Player{tag[1:4]}",
+        "trophies": 1000,
+        "highestTrophies": 1200,
+        "expLevel": 50,
+        "expPoints": 50000,
+        "brawlers": [],
+    }
+
+
+def battlelog_payload(tag: str) -> dict:
+    return {
+        "items": [
+            {
+                "battleTime": "20250711T162154.000Z",
+                "event": {"id": 15000132, "mode": "brawlBall", "map": "Center Stage"},
+                "battle": {
+                    "mode": "brawlBall",
+                    "type": "soloRanked",
+                    "result": "victory",
+                    "duration": 115,
+                    "teams": [
+                        [
+                            {
+                                "tag": tag,
+                                "name": "Player",
+                                "brawler": {
+                                    "id": 16000000,
+                                    "name": "SHELLY",
+                                    "power": 11,
+                                    "trophies": 500,
+                                },
+                            }
+                        ]
+                    ],
+                },
+            }
+        ]
+    }
+
+
+def club_members_payload(member_tags: list[str]) -> dict:
+    return {
+        "items": [
+            {
+                "tag": tag,
+                "name": f"Member{i}",
+                "role": "member",
+                "trophies": 1000,
+                "icon": {"id": 28000000},
+            }
+            for i, tag in enumerate(member_tags)
+        ]
+    }
+
+
+def club_payload(club_tag: str, member_tags: list[str]) -> dict:
+    return {
+        "tag": club_tag,
+        "name": "Test Club",
+        "description": "A club",
+        "type": "open",
+        "badgeId": 8000000,
+        "requiredTrophies": 0,
+        "trophies": 30000,
+        "members": club_members_payload(member_tags)["items"],
+    }
+
+
+@pytest.fixture
+def ingested_dir(tmp_path, monkeypatch):
+    """Redirect ingested JSON writes to a temporary directory."""
+    from brawlstar_project.processing.utils import json_utils
+
+    path = tmp_path / "ingested"
+    monkeypatch.setattr(json_utils, "DATA_INGESTED_DIR", path)
+    return path
+
+
+@pytest.fixture
+def stub_club_api(stub_api):
+    """Stub API serving one club (#2L00GJU9Y) with three members."""
+    club_tag = "#2L00GJU9Y"
+    member_tags = ["#PC0PPLRU", "#G02QL2U2", "#ABCDEFGH"]
+    stub_api.add_club(club_tag, member_tags)
+    stub_api.club_tag = club_tag
+    stub_api.member_tags = member_tags
+    return stub_api
@@ -0,0 +1,50 @@
+"""
+Tests for the synchronous Brawl Stars API client.
+"""
+
+import pytest
+import requests
+
+from brawlstar_project.processing.ingested import BrawlStarsClient
+
+
+class TestBrawlStarsClient:
+    """Test BrawlStarsClient session handling."""
+
+    def test_requests_reuse_pooled_connection(self, stub_api):
+        """Test that consecutive calls share one keep-alive connection."""
+        stub_api.add_route("/v1/players/%23PC0PPLRU", {"tag": "#PC0PPLRU"})
+        stub_api.add_route("/v1/players/%23PC0PPLRU/battlelog", {"items": []})
+
+        with BrawlStarsClient(api_key="key", base_url=stub_api.base_url) as client:
+            assert client.get_player("%23PC0PPLRU") == {"tag": "#PC0PPLRU"}
+            assert client.get_battlelog("%23PC0PPLRU") == {"items": []}
+            assert client.get_player("%23PC0PPLRU") == {"tag": "#PC0PPLRU"}
+
+        assert len(stub_api.requests) == 3
+        assert len(stub_api.connections) == 1
+
+    def test_authorization_header(self, stub_api):
+        """Test that the bearer token is sent on every request."""
+        stub_api.add_route("/v1/clubs/%232L00GJU9Y", {"tag": "#2L00GJU9Y"})
+
+        with BrawlStarsClient(api_key="secret", base_url=stub_api.base_url) as client:
+            client.get_club("%232L00GJU9Y")
+
+        assert stub_api.requests[0]["headers"]["Authorization"] == "Bearer secret"
+
+    def test_pool_size_is_applied(self):
+        """Test that the adapter pool is sized from the client config."""
+        client = BrawlStarsClient(
+            api_key="key", base_url="https://example.com/v1/", pool_size=4
+        )
+        adapter = client.session.get_adapter("https://example.com")
+        assert adapter._pool_maxsize == 4
+        assert adapter.max_retries.total == 0
+        client.close()
+
+    def test_http_error_is_raised(self, stub_api):
+        """Test that HTTP errors are surfaced to the caller."""
+        with BrawlStarsClient(api_key="key", base_url=stub_api.base_url) as client:
+            with pytest.raises(requests.HTTPError):
+                client.get_club_members("%23UNKNOWN")
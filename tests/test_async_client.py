@@ -0,0 +1,125 @@
+"""
+Tests for the async Brawl Stars API client and async ingestion runner.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from brawlstar_project.processing.factory import RunnerFactory
+from brawlstar_project.processing.ingested import AsyncBrawlStarsClient
+
+
+class TestAsyncBrawlStarsClient:
+    """Test AsyncBrawlStarsClient against a local stub server."""
+
+    def test_get_player(self, stub_club_api):
+        """Test that the async client returns parsed JSON."""
+
+        async def fetch():
+            async with AsyncBrawlStarsClient(
+                api_key="key", base_url=stub_club_api.base_url
+            ) as client:
+                return await client.get_player("%23PC0PPLRU")
+
+        data = asyncio.run(fetch())
+        assert data["tag"] == "#PC0PPLRU"
+        request = stub_club_api.requests[0]
+        assert request["path"] == "/v1/players/%23PC0PPLRU"
+        assert request["headers"]["Authorization"] == "Bearer key"
+
+    def test_http_error_is_raised(self, stub_api):
+        """Test that HTTP errors are surfaced to the caller."""
+
+        async def fetch():
+            async with AsyncBrawlStarsClient(
+                api_key="key", base_url=stub_api.base_url
+            ) as client:
+                return await client.get_club("%23UNKNOWN")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(fetch())
+
+    def test_client_is_reusable_across_event_loops(self, stub_club_api):
+        """Test that the client reopens its pool after being closed."""
+        client = AsyncBrawlStarsClient(api_key="key", base_url=stub_club_api.base_url)
+
+        async def fetch():
+            async with client:
+                return await client.get_club_members("%232L00GJU9Y")
+
+        assert len(asyncio.run(fetch())["items"]) == 3
+        assert len(asyncio.run(fetch())["items"]) == 3
+
+
+class TestAsyncClubWithMembersRunner:
+    """Test the async club+members runner."""
+
+    def test_run_ingests_club_and_members(self, stub_club_api, ingested_dir):
+        """Test that every member is fetched and saved."""
+        runner = RunnerFactory().get_runner("club-players-async")
+        client = AsyncBrawlStarsClient(api_key="key", base_url=stub_club_api.base_url)
+
+        result = runner.run(client, stub_club_api.club_tag)
+
+        assert result == {
+            "status": "success",
+            "total": 3,
+            "successful": 3,
+            "failed": 0,
+            "retries": 0,
+        }
+        assert len(list(ingested_dir.glob("player/*/*/player.json"))) == 3
+        assert len(list(ingested_dir.glob("player/*/*/battlelog.json"))) == 3
+        assert len(list(ingested_dir.glob("club/*/*/club.json"))) == 1
+
+    def test_member_failures_are_counted(self, stub_club_api, ingested_dir):
+        """Test that a failing member does not abort the club."""
+        stub_club_api.routes.pop("/v1/players/%23ABCDEFGH")
+        runner = RunnerFactory().get_runner("club-players-async")
+        client = AsyncBrawlStarsClient(api_key="key", base_url=stub_club_api.base_url)
+
+        result = runner.run(client, stub_club_api.club_tag)
+
+        assert result["successful"] == 2
+        assert result["failed"] == 1
+
+    def test_shared_members_are_fetched_once(self, stub_club_api, ingested_dir):
+        """Test that a member of two clubs is fetched once per endpoint."""
+        stub_club_api.add_club("#80Y22P29J", ["#PC0PPLRU", "#G02QL2U2"])
+        runner = RunnerFactory().get_runner("club-players-async")
+        client = AsyncBrawlStarsClient(api_key="key", base_url=stub_club_api.base_url)
+
+        results = asyncio.run(
+            runner.run_many(client, [stub_club_api.club_tag, "#80Y22P29J"])
+        )
+
+        paths = [request["path"] for request in stub_club_api.requests]
+        assert len(paths) == len(set(paths)) == 10
+        assert [result["successful"] for result in results] == [3, 2]
+
+    def test_concurrency_limit_is_respected(self, stub_club_api, ingested_dir):
+        """Test that in-flight requests never exceed the configured limit."""
+        runner = RunnerFactory().get_runner("club-players-async")
+        runner.concurrency = 2
+        client = AsyncBrawlStarsClient(api_key="key", base_url=stub_club_api.base_url)
+
+        in_flight, peak = 0, 0
+        original_get = client._get
+
+        async def tracking_get(*args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                return await original_get(*args)
+            finally:
+                in_flight -= 1
+
+        client._get = tracking_get
+        result = runner.run(client, stub_club_api.club_tag)
+
+        assert result["successful"] == 3
+        assert peak == 2
@@ -0,0 +1,203 @@
+"""
+Tests for the canonical battle key, dim_battles and club aggregates.
+"""
+
+from datetime import datetime
+
+import polars as pl
+import pytest
+
+from brawlstar_project.analytics import club_queries
+from brawlstar_project.entities.player.models import BattlelogData
+from brawlstar_project.processing.cleaned import (
+    DimBattlesProcessor,
+    battle_id_expr,
+    dim_battles,
+    match_id_expr,
+)
+from brawlstar_project.processing.utils import flatten_battlelogs
+
+
+def _player(tag: str) -> dict:
+    brawler = {"id": 1, "name": "SHELLY", "power": 11, "trophies": 500}
+    return {"tag": tag, "name": f"name-{tag}", "brawler": brawler}
+
+
+def _battle(time: str, teams=None, players=None) -> dict:
+    details = {"mode": "brawlBall", "type": "ranked", "result": "victory"}
+    if teams is not None:
+        details["teams"] = teams
+    if players is not None:
+        details["players"] = players
+    return {
+        "battleTime": time,
+        "event": {"id": 1, "mode": "brawlBall", "map": "Center Stage"},
+        "battle": details,
+    }
+
+
+SHARED = _battle(
+    "20250711T162154.000Z",
+    teams=[[_player("#B"), _player("#A")], [_player("#Z"), _player("#Y")]],
+)
+
+
+def _battles(rows: list[tuple]) -> pl.DataFrame:
+    """Processed battlelog rows from (player_tag, battle_time, participants)."""
+    return pl.DataFrame(
+        {
+            "player_tag": [row[0] for row in rows],
+            "battle_time": [row[1] for row in rows],
+            "participant_tags": [row[2] for row in rows],
+            "battle_mode": "brawlBall",
+            "event_mode": "brawlBall",
+            "map_name": "Center Stage",
+            "battle_type": "ranked",
+            "battle_duration": 120,
+        }
+    )
+
+
+MORNING = datetime(2025, 7, 11, 9, 0)
+EVENING = datetime(2025, 7, 11, 21, 0)
+ROWS = [
+    # #A and #B played the same battle, #A also played the same map later
+    ("#A", MORNING, "#A,#B,#Y,#Z"),
+    ("#B", MORNING, "#A,#B,#Y,#Z"),
+    ("#A", EVENING, "#A,#C,#X,#Y"),
+]
+
+
+class TestParticipantTags:
+    """Test the participant list recorded by the raw stage."""
+
+    def test_same_for_every_participant(self):
+        payloads = [
+            (tag, BattlelogData.model_validate({"items": [SHARED]}).model_dump())
+            for tag in ("#A", "#Y")
+        ]
+
+        result = flatten_battlelogs(payloads)
+
+        assert result["participant_tags"].to_list() == ["#A,#B,#Y,#Z"] * 2
+
+    def test_solo_players_and_owner(self):
+        solo = _battle("20250711T162154.000Z", players=[_player("#S"), _player("#R")])
+        data = BattlelogData.model_validate({"items": [solo, _battle("x")]})
+
+        result = flatten_battlelogs([("#R", data.model_dump())])
+
+        assert result["participant_tags"].to_list() == ["#R,#S", "#R"]
+
+
+class TestBattleId:
+    """Test battle_id against the per-player match_id."""
+
+    def test_identifies_battles(self):
+        df = _battles(ROWS)
+
+        result = df.select(
+            battle_id_expr(df.schema).alias("battle_id"),
+            match_id_expr(df.schema["battle_time"]).alias("match_id"),
+        )
+
+        battle_ids = result["battle_id"].to_list()
+        assert battle_ids[0] == battle_ids[1] != battle_ids[2]
+        assert battle_ids[0] == "20250711T090000|brawlBall|Center Stage|#A,#B,#Y,#Z"
+        # match_id merges #A's two battles and splits the shared one
+        assert result["match_id"].n_unique() == 2
+        assert result["match_id"][0] == result["match_id"][2]
+
+    def test_without_participant_tags(self):
+        df = _battles(ROWS).drop("participant_tags")
+
+        battle_ids = df.select(battle_id_expr(df.schema))["battle_time"]
+
+        assert battle_ids.n_unique() == 3
+        assert battle_ids[1].endswith("|#B")
+
+
+class TestDimBattles:
+    """Test that dim_battles holds each battle once."""
+
+    @pytest.fixture
+    def cleaned_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(dim_battles, "DATA_CLEANED_DIR", tmp_path)
+        return tmp_path
+
+    def test_build_and_merge(self, cleaned_dir):
+        day1 = DimBattlesProcessor("2025-07-11")
+        day1.save_dimension(day1.build_dimension(_battles(ROWS[:2]).lazy()).collect())
+        day2 = DimBattlesProcessor("2025-07-12")
+        built = day2.build_dimension(_battles(ROWS).lazy()).collect()
+        day2.save_dimension(built)
+
+        assert built.height == 2
+        assert built["tracked_players"].to_list() == [2, 1]
+        assert built["participant_count"].to_list() == [4, 4]
+        stored = day2.get_store().scan().collect()
+        assert stored.height == 2
+        assert stored["_process_date"].cast(pl.String).sort().to_list() == [
+            "2025-07-11",
+            "2025-07-12",
+        ]
+
+
+class TestClubQueries:
+    """Test that club aggregates count a battle once."""
+
+    def test_shared_battle_counted_once(self, tmp_path):
+        pytest.importorskip("pandas")
+        facts = _battles(ROWS).with_columns(
+            pl.lit("#CLUB").alias("club_tag"),
+            pl.Series("battle_result", ["victory", "victory", "defeat"]),
+        )
+        table = tmp_path / "fact_matches.parquet"
+        table.mkdir()
+        facts.with_columns(battle_id_expr(facts.schema).alias("battle_id")).drop(
+            "participant_tags"
+        ).write_parquet(table / "part-new.parquet")
+        # A part written before battle_id existed
+        legacy = facts.head(1).with_columns(battle_time=datetime(2025, 7, 10))
+        legacy.drop("participant_tags").write_parquet(table / "part-legacy.parquet")
+
+        result = club_queries.get_club_winrate(table, "#CLUB")
+        members = club_queries.get_club_member_participation(table, "#CLUB")
+
+        assert result["total_games"].tolist() == [3]
+        assert result["wins"].tolist() == [2]
+        assert members["games_played"].sum() == 4
+
+    def test_file_without_battle_id(self, tmp_path):
+        pytest.importorskip("pandas")
+        facts = _battles(ROWS).with_columns(
+            pl.lit("#CLUB").alias("club_tag"),
+            pl.Series("battle_result", ["victory", "victory", "defeat"]),
+        )
+        table = tmp_path / "fact_matches.parquet"
+        facts.drop("participant_tags").write_parquet(table)
+
+        result = club_queries.get_club_winrate(table, "#CLUB")
+        by_day = club_queries.get_club_winloss_by_day(table, "#CLUB")
+
+        # Without battle_id every member's row is its own battle
+        assert result["total_games"].tolist() == [3]
+        assert by_day["wins"].tolist() == [2]
+
+    def test_opposing_members_use_smallest_tag(self, tmp_path):
+        pytest.importorskip("pandas")
+        facts = _battles(ROWS[:2]).with_columns(
+            pl.lit("#CLUB").alias("club_tag"),
+            pl.Series("battle_result", ["defeat", "victory"]),
+        )
+        table = tmp_path / "fact_matches.parquet"
+        for order in (facts, facts.reverse()):
+            order.with_columns(battle_id_expr(facts.schema).alias("battle_id")).drop(
+                "participant_tags"
+            ).write_parquet(table)
+
+            result = club_queries.get_club_winrate(table, "#CLUB")
+
+            # #A (the smallest tag) lost, whatever the row order
+            assert result["total_games"].tolist() == [1]
+            assert result["wins"].tolist() == [0]
@@ -0,0 +1,111 @@
+"""
+Tests for the columnar battlelog flattener.
+"""
+
+import polars as pl
+
+from brawlstar_project.entities.player.models import BattlelogData
+from brawlstar_project.processing.utils import (
+    flatten_battlelog_data,
+    flatten_battlelogs,
+)
+from brawlstar_project.processing.utils.battlelog_flattener import (
+    FLATTENED_BATTLE_SCHEMA,
+)
+
+
+def _player(tag: str, brawler: str = "SHELLY", power: int = 11) -> dict:
+    return {
+        "tag": tag,
+        "name": f"name-{tag}",
+        "brawler": {"id": 1, "name": brawler, "power": power, "trophies": 500},
+    }
+
+
+def _battle(teams=None, star=None, mode="brawlBall", result="victory", **extra):
+    details = {"mode": mode, "type": "ranked", "result": result, "duration": 120}
+    if teams is not None:
+        details["teams"] = teams
+    if star is not None:
+        details["starPlayer"] = star
+    details.update(extra)
+    return {
+        "battleTime": "20250711T162154.000Z",
+        "event": {"id": 1, "mode": mode, "map": "Center Stage"},
+        "battle": details,
+    }
+
+
+BATTLELOGS = {
+    "#AAA": [
+        # Player in the second team and star player
+        _battle(
+            teams=[[_player("#X"), _player("#Y")], [_player("#AAA"), _player("#Z")]],
+            star=_player("#AAA"),
+        ),
+        # Player missing from the teams: last team size is kept
+        _battle(teams=[[_player("#X")], [_player("#Y"), _player("#Z")]]),
+        # Showdown: no teams at all, missing result and empty map
+        _battle(players=[_player("#AAA")], result=None, mode=""),
+    ],
+    "#BBB": [
+        # Duplicate player tag in two teams: first team wins
+        _battle(
+            teams=[[_player("#BBB", "COLT", 9)], [_player("#BBB"), _player("#Q")]],
+            star=_player("#Q"),
+        ),
+        _battle(teams=[]),
+    ],
+}
+
+
+def _validated_payloads() -> list[tuple[str, dict]]:
+    return [
+        (tag, BattlelogData.model_validate({"items": items}).model_dump())
+        for tag, items in BATTLELOGS.items()
+    ]
+
+
+class TestFlattenBattlelogs:
+    """Test flatten_battlelogs against the per-battle Pydantic flattener."""
+
+    def test_matches_pydantic_flattener(self):
+        """Test that both flatteners produce the same rows and schema."""
+        payloads = _validated_payloads()
+        expected = pl.concat(
+            [flatten_battlelog_data(data, tag) for tag, data in payloads]
+        )
+
+        result = flatten_battlelogs(payloads)
+
+        assert result.schema == expected.schema == FLATTENED_BATTLE_SCHEMA
+        assert result.drop("extracted_at").equals(expected.drop("extracted_at"))
+
+    def test_team_lookup(self):
+        """Test player, team size, opponents and star player resolution."""
+        result = flatten_battlelogs(_validated_payloads())
+
+        assert result["team_size"].to_list() == [2, 2, 0, 1, 0]
+        assert result["opponent_count"].to_list() == [2, 1, 0, 2, 0]
+        assert result["is_star_player"].to_list() == [True, False, False, False, False]
+        assert result["brawler_name"].to_list() == ["SHELLY", "", "", "COLT", ""]
+        assert result["event_mode"][2] == "unknown"
+        assert result["battle_result"][2] == "unknown"
+
+    def test_no_battles(self):
+        """Test that empty input gives an empty frame with the output schema."""
+        result = flatten_battlelogs([("#AAA", {"items": []})])
+
+        assert result.is_empty()
+        assert result.schema == FLATTENED_BATTLE_SCHEMA
+
+    def test_malformed_payload_is_skipped(self):
+        """Test that one bad battlelog does not drop the others."""
+        payloads = _validated_payloads()
+        broken = {"items": [{"battleTime": "x", "event": {}, "battle": {}}]}
+
+        result = flatten_battlelogs([payloads[0], ("#BAD", broken), payloads[1]])
+
+        assert result.drop("extracted_at").equals(
+            flatten_battlelogs(payloads).drop("extracted_at")
+        )
@@ -0,0 +1,85 @@
+"""
+Tests for the cleaned-stage DAG executor.
+"""
+
+import threading
+
+import pytest
+
+from brawlstar_project.processing.cleaned import DagTask, raise_on_failure, run_dag
+from brawlstar_project.processing.cleaned.dag import task_dependencies
+
+
+def _recorder(order: list[str], name: str):
+    return lambda: order.append(name)
+
+
+def test_dependency_order():
+    order = []
+    tasks = [
+        DagTask("save", _recorder(order, "save"), inputs=("rows",), outputs=("t",)),
+        DagTask("compact", _recorder(order, "compact"), inputs=("t",)),
+        DagTask("build", _recorder(order, "build"), inputs=("src",), outputs=("rows",)),
+    ]
+
+    results = run_dag(tasks)
+
+    assert order == ["build", "save", "compact"]
+    assert {result.status for result in results.values()} == {"ok"}
+    assert all(result.seconds >= 0 for result in results.values())
+
+
+def test_independent_tasks_run_concurrently():
+    # Both tasks wait for each other: this only completes if they overlap
+    barrier = threading.Barrier(2, timeout=5)
+    tasks = [DagTask(name, barrier.wait) for name in ("a", "b")]
+
+    results = run_dag(tasks, max_workers=2)
+
+    assert [results[name].status for name in ("a", "b")] == ["ok", "ok"]
+
+
+def test_failure_skips_dependents_only():
+    def broken():
+        raise RuntimeError("boom")
+
+    order = []
+    tasks = [
+        DagTask("build", broken, outputs=("rows",)),
+        DagTask("save", _recorder(order, "save"), inputs=("rows",), outputs=("t",)),
+        DagTask("compact", _recorder(order, "compact"), inputs=("t",)),
+        DagTask("other", _recorder(order, "other")),
+    ]
+
+    results = run_dag(tasks)
+
+    assert order == ["other"]
+    assert results["build"].status == "failed"
+    assert results["build"].error == "boom"
+    assert results["save"].status == "skipped"
+    assert results["compact"].status == "skipped"
+    with pytest.raises(RuntimeError, match=r"3 task\(s\) did not succeed"):
+        raise_on_failure(results)
+    raise_on_failure({"other": results["other"]})
+
+
+@pytest.mark.parametrize(
+    "tasks, message",
+    [
+        (
+            [
+                DagTask("a", print, inputs=("y",), outputs=("x",)),
+                DagTask("b", print, inputs=("x",), outputs=("y",)),
+            ],
+            "cycle",
+        ),
+        ([DagTask("a", print), DagTask("a", print)], "Duplicate task"),
+        (
+            [DagTask("a", print, outputs=("x",)), DagTask("b", print, outputs=("x",))],
+            "written by both",
+        ),
+    ],
+)
+def test_invalid_graph(tasks, message):
+    with pytest.raises(ValueError, match=message):
+        task_dependencies(tasks)
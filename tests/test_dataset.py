@@ -0,0 +1,116 @@
+"""
+Tests for the hive-partitioned dataset layout and readers.
+"""
+
+import polars as pl
+import pytest
+
+from brawlstar_project.processing.utils.dataset import (
+    dataset_path,
+    migrate_to_hive_layout,
+    partition_dates,
+    read_dataset_duckdb,
+    scan_dataset,
+)
+from brawlstar_project.processing.utils.raw_manifest import RawManifest
+
+DATES = ["2025-07-09", "2025-07-10", "2025-07-11"]
+
+
+@pytest.fixture
+def raw_dir(tmp_path):
+    """Three daily battlelog partitions; the last one is not valid Parquet."""
+    for i, date in enumerate(DATES):
+        path = dataset_path(tmp_path, "battlelog.parquet", date)
+        path.parent.mkdir(parents=True)
+        if i == 2:
+            path.write_bytes(b"not parquet")
+        else:
+            pl.DataFrame({"player_tag": ["#A", "#B"], "n": [i, i]}).write_parquet(path)
+    return tmp_path
+
+
+class TestDatasetPaths:
+    """Test the partition path helpers."""
+
+    def test_dataset_path(self, tmp_path):
+        """Test the date= partition path of each daily file."""
+        assert dataset_path(tmp_path, "club.parquet", "2025-07-11") == (
+            tmp_path / "club" / "date=2025-07-11" / "club.parquet"
+        )
+        with pytest.raises(ValueError):
+            dataset_path(tmp_path, "unknown.parquet", "2025-07-11")
+        with pytest.raises(ValueError):
+            dataset_path(tmp_path, "club.parquet", "../../etc")
+
+    def test_partition_dates(self, raw_dir):
+        """Test that partitions are listed by date."""
+        assert partition_dates(raw_dir, "battlelog.parquet") == DATES
+        assert partition_dates(raw_dir, "player.parquet") == []
+
+
+class TestScanDataset:
+    """Test range scans with Polars and DuckDB."""
+
+    def test_polars_prunes_partitions(self, raw_dir):
+        """Test that partitions outside the range are never opened."""
+        df = scan_dataset(raw_dir, "battlelog.parquet", end="2025-07-10").collect()
+
+        assert df.columns == ["player_tag", "n", "date"]
+        assert sorted(df["date"].unique()) == DATES[:2]
+        assert df.filter(pl.col("date") == "2025-07-10")["n"].to_list() == [1, 1]
+
+    def test_polars_empty_range(self, raw_dir):
+        """Test that a range without partitions gives None."""
+        assert scan_dataset(raw_dir, "battlelog.parquet", start="2025-08-01") is None
+        assert scan_dataset(raw_dir, "club.parquet") is None
+
+    def test_polars_keeps_new_columns(self, tmp_path):
+        """Test that a column added by a later partition is not dropped."""
+        for date, df in [
+            ("2025-07-10", pl.DataFrame({"player_tag": ["#A"]})),
+            ("2025-07-11", pl.DataFrame({"player_tag": ["#B"], "new": ["x"]})),
+        ]:
+            path = dataset_path(tmp_path, "battlelog.parquet", date)
+            path.parent.mkdir(parents=True)
+            df.write_parquet(path)
+
+        polars_df = scan_dataset(tmp_path, "battlelog.parquet").collect()
+        relation = read_dataset_duckdb(tmp_path, "battlelog.parquet")
+
+        expected = [("#A", None, "2025-07-10"), ("#B", "x", "2025-07-11")]
+        assert polars_df.sort("date").rows() == expected
+        assert relation.order("date").fetchall() == expected
+
+    def test_duckdb_prunes_partitions(self, raw_dir):
+        """Test the DuckDB reader on the same range."""
+        relation = read_dataset_duckdb(
+            raw_dir, "battlelog.parquet", start="2025-07-10", end="2025-07-10"
+        )
+
+        assert relation.columns == ["player_tag", "n", "date"]
+        assert relation.fetchall() == [
+            ("#A", 1, "2025-07-10"),
+            ("#B", 1, "2025-07-10"),
+        ]
+
+
+class TestMigrateToHiveLayout:
+    """Test moving legacy <date>/ directories to date= partitions."""
+
+    def test_migration_moves_files_and_manifest(self, tmp_path):
+        """Test files, manifest keys and idempotence."""
+        legacy = tmp_path / "player" / "2025-07-11" / "player.parquet"
+        legacy.parent.mkdir(parents=True)
+        pl.DataFrame({"tag": ["#A"]}).write_parquet(legacy)
+        manifest = RawManifest(tmp_path)
+        manifest.record(legacy, {"in": [1, 2]}, rows=1)
+        manifest.save()
+
+        assert migrate_to_hive_layout(tmp_path) == 1
+        assert migrate_to_hive_layout(tmp_path) == 0
+
+        migrated = dataset_path(tmp_path, "player.parquet", "2025-07-11")
+        assert pl.read_parquet(migrated)["tag"].to_list() == ["#A"]
+        assert not legacy.parent.exists()
+        assert RawManifest(tmp_path).is_current(migrated, {"in": [1, 2]})
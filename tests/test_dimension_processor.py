@@ -0,0 +1,112 @@
+"""
+Tests for the lazy dimension processor contract and its eager adapter.
+"""
+
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from brawlstar_project.processing.cleaned import (
+    DimMapsProcessor,
+    EagerDimensionProcessor,
+    dim_maps,
+)
+from brawlstar_project.processing.utils import dataset_path
+
+DATE = "2025-07-11"
+
+
+@pytest.fixture
+def maps_dirs(tmp_path, monkeypatch):
+    """Processed battlelog of DATE with many columns, and a cleaned directory."""
+    processed, cleaned = tmp_path / "processed", tmp_path / "cleaned"
+    monkeypatch.setattr(dim_maps, "DATA_PROCESSED_DIR", processed)
+    monkeypatch.setattr(dim_maps, "DATA_CLEANED_DIR", cleaned)
+    battlelog = pl.DataFrame(
+        {
+            "map_name": ["Center Stage", "Hard Rock Mine", "Center Stage"],
+            **{f"unused_{i}": ["x", "y", "z"] for i in range(10)},
+        }
+    )
+    path = dataset_path(processed, "battlelog.parquet", DATE)
+    path.parent.mkdir(parents=True)
+    battlelog.write_parquet(path)
+    return processed, cleaned
+
+
+class EagerMapsProcessor(EagerDimensionProcessor):
+    """Dimension written against the DataFrame API only."""
+
+    def get_source_path(self) -> Path:
+        return dataset_path(dim_maps.DATA_PROCESSED_DIR, "battlelog.parquet", self.date)
+
+    def get_output_path(self) -> Path:
+        return dim_maps.DATA_CLEANED_DIR / "eager_maps.parquet"
+
+    def build_dimension(self, source_df: pl.DataFrame) -> pl.DataFrame:
+        names = sorted({row["map_name"] for row in source_df.iter_rows(named=True)})
+        return pl.DataFrame({"map_name": names, "rows": source_df.height})
+
+    def get_dimension_name(self) -> str:
+        return "eager_maps"
+
+
+def test_plan_reads_only_used_columns(maps_dirs):
+    plan = DimMapsProcessor(DATE).build_plan()
+
+    assert "PROJECT 1/11 COLUMNS" in plan.explain()
+
+
+def test_process_streams_output(maps_dirs):
+    _, cleaned = maps_dirs
+    processor = DimMapsProcessor(DATE)
+
+    processor.process()
+
+    assert processor.streams_output()
+    result = pl.read_parquet(cleaned / "dim_maps.parquet")
+    assert sorted(result["map_name"]) == ["Center Stage", "Hard Rock Mine"]
+
+
+def test_empty_table_keeps_previous_output(maps_dirs):
+    processed, cleaned = maps_dirs
+    DimMapsProcessor(DATE).process()
+    empty_day = "2025-07-12"
+    path = dataset_path(processed, "battlelog.parquet", empty_day)
+    path.parent.mkdir(parents=True)
+    pl.DataFrame(schema={"map_name": pl.String}).write_parquet(path)
+
+    DimMapsProcessor(empty_day).process()
+
+    assert pl.read_parquet(cleaned / "dim_maps.parquet").height == 2
+    assert [p.name for p in cleaned.iterdir()] == ["dim_maps.parquet"]
+
+
+def test_history_dimensions_are_collected(maps_dirs):
+    with_history = DimMapsProcessor(DATE)
+    with_history.history_key = ["map_name"]
+    history_disabled = DimMapsProcessor(DATE, history=False)
+    history_disabled.history_key = ["map_name"]
+
+    assert not with_history.streams_output()
+    assert history_disabled.streams_output()
+
+
+def test_missing_source(tmp_path, monkeypatch):
+    monkeypatch.setattr(dim_maps, "DATA_PROCESSED_DIR", tmp_path)
+    processor = DimMapsProcessor(DATE)
+
+    assert processor.build_plan() is None
+    assert processor.load_source_data().is_empty()
+
+
+def test_eager_adapter(maps_dirs):
+    _, cleaned = maps_dirs
+    processor = EagerMapsProcessor(DATE)
+
+    processor.process()
+
+    result = pl.read_parquet(cleaned / "eager_maps.parquet")
+    assert result.rows() == [("Center Stage", 3), ("Hard Rock Mine", 3)]
+    assert processor.load_source_data().width == 11
@@ -0,0 +1,80 @@
+"""
+Tests for lazy raw-data loading in TagEntity.
+"""
+
+from datetime import datetime, timedelta
+
+import polars as pl
+import pytest
+
+from brawlstar_project.entities import Club, Player
+
+TODAY = datetime.today().strftime("%Y-%m-%d")
+YESTERDAY = (datetime.today() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def raw_dir(tmp_path):
+    """Raw files for today and yesterday with two players and two clubs."""
+    for day, trophies in ((TODAY, 2), (YESTERDAY, 1)):
+        player_dir = tmp_path / "player" / f"date={day}"
+        club_dir = tmp_path / "club" / f"date={day}"
+        player_dir.mkdir(parents=True)
+        club_dir.mkdir(parents=True)
+        pl.DataFrame(
+            {"tag": ["#AAAAAAA", "#BBBBBBB"], "trophies": [trophies, 100]}
+        ).write_parquet(player_dir / "player.parquet")
+        pl.DataFrame(
+            {
+                "player_tag": ["#AAAAAAA", "#BBBBBBB", "#AAAAAAA"],
+                "mode": ["a", "b", "c"],
+            }
+        ).write_parquet(player_dir / "battlelog.parquet")
+        pl.DataFrame({"tag": ["#CLUB", "#OTHER"], "name": ["c", "o"]}).write_parquet(
+            club_dir / "club.parquet"
+        )
+        pl.DataFrame({"tag": ["#AAAAAAA"], "role": ["member"]}).write_parquet(
+            club_dir / "club_members.parquet"
+        )
+    return tmp_path
+
+
+def test_player_data_is_filtered_and_dated(raw_dir):
+    df = Player("AAAAAAA").load_player_data(raw_dir, days=3)
+
+    assert df["tag"].to_list() == ["#AAAAAAA", "#AAAAAAA"]
+    assert df["trophies"].to_list() == [2, 1]
+    assert df["date"].to_list() == [TODAY, YESTERDAY]
+
+
+def test_battlelog_is_filtered_by_player_tag(raw_dir):
+    df = Player("AAAAAAA").load_battlelog_data(raw_dir, days=1)
+
+    assert df["mode"].to_list() == ["a", "c"]
+    assert set(df["entity_tag"]) == {"#AAAAAAA"}
+
+
+def test_lazy_projection(raw_dir):
+    lf = Player("AAAAAAA").load_battlelog_data(
+        raw_dir, days=2, columns=["mode"], lazy=True
+    )
+
+    assert isinstance(lf, pl.LazyFrame)
+    df = lf.collect()
+    assert df.columns == ["mode", "date"]
+    assert df.height == 4
+
+
+def test_club_loaders(raw_dir):
+    club = Club("CLUB")
+
+    assert club.load_club_data(raw_dir, days=2)["name"].to_list() == ["c", "c"]
+    members = club.load_club_members_data(raw_dir, days=1)
+    assert members.columns == ["tag", "role", "date"]
+
+
+def test_no_files(tmp_path):
+    assert Player("AAAAAAA").load_player_data(tmp_path).is_empty()
+    assert isinstance(
+        Player("AAAAAAA").load_player_data(tmp_path, lazy=True), pl.LazyFrame
+    )
@@ -0,0 +1,182 @@
+"""
+Tests for the incremental fact table store.
+"""
+
+from datetime import date
+
+import duckdb
+import polars as pl
+import pytest
+
+from brawlstar_project.analytics.duckdb_utils import parquet_source
+from brawlstar_project.processing.cleaned import (
+    FactMatchesProcessor,
+    FactStore,
+    fact_matches,
+)
+
+KEY = ["player_tag", "battle_time"]
+
+
+def _facts(rows: list[tuple[str, str, str]]) -> pl.DataFrame:
+    """Fact rows from (player_tag, battle_time, result) triples."""
+    df = pl.DataFrame(
+        rows, schema=["player_tag", "battle_time", "result"], orient="row"
+    )
+    return df.with_columns(
+        pl.col("battle_time").str.slice(0, 10).str.to_date().alias("battle_time_date")
+    )
+
+
+def _store(tmp_path, **kwargs) -> FactStore:
+    return FactStore(
+        tmp_path / "fact.parquet", key=KEY, partition_by="battle_time_date", **kwargs
+    )
+
+
+def _read(store: FactStore) -> pl.DataFrame:
+    return (
+        store.scan().select("player_tag", "battle_time", "result").collect().sort(KEY)
+    )
+
+
+DAY1 = [
+    ("#A", "2025-07-10 10:00", "victory"),
+    ("#A", "2025-07-11 09:00", "defeat"),
+    ("#B", "2025-07-11 09:00", "victory"),
+]
+# Battlelogs overlap: day 2 sees two battles of day 1 again
+DAY2 = [
+    ("#A", "2025-07-11 09:00", "defeat"),
+    ("#B", "2025-07-11 09:00", "victory"),
+    ("#B", "2025-07-12 12:00", "draw"),
+]
+
+
+class TestFactStore:
+    """Test batch inserts, overlap handling and compaction."""
+
+    def test_overlapping_batches_are_stored_once(self, tmp_path):
+        store = _store(tmp_path)
+
+        first = store.upsert(_facts(DAY1), batch_id="2025-07-11")
+        second = store.upsert(_facts(DAY2), batch_id="2025-07-12")
+
+        assert first["inserted"] == 3
+        assert second == {"inserted": 1, "skipped": 2, "partitions": 2, "compacted": 0}
+        assert _read(store).height == 4
+        assert [path.name for path in store.partitions()] == [
+            "battle_time_date=2025-07-10",
+            "battle_time_date=2025-07-11",
+            "battle_time_date=2025-07-12",
+        ]
+        # Only the partition gaining rows got a part file for day 2
+        assert not (store.partitions()[1] / "part-2025-07-12.parquet").exists()
+
+    def test_rerun_is_idempotent(self, tmp_path):
+        store = _store(tmp_path)
+        store.upsert(_facts(DAY1), batch_id="2025-07-11")
+        store.upsert(_facts(DAY2), batch_id="2025-07-12")
+        expected = _read(store)
+
+        stats = store.upsert(_facts(DAY2), batch_id="2025-07-12")
+
+        assert stats["inserted"] == 1
+        assert _read(store).equals(expected)
+
+    def test_duplicate_keys_within_batch(self, tmp_path):
+        store = _store(tmp_path)
+        rows = DAY1 + [("#A", "2025-07-10 10:00", "victory")]
+
+        store.upsert(_facts(rows), batch_id="b1")
+
+        assert _read(store).height == 3
+
+    def test_null_partition(self, tmp_path):
+        store = _store(tmp_path)
+        df = pl.DataFrame(
+            {
+                "player_tag": ["#A", "#A"],
+                "battle_time": [None, None],
+                "result": ["victory", "victory"],
+                "battle_time_date": [None, None],
+            },
+            schema_overrides={"battle_time": pl.String, "battle_time_date": pl.Date},
+        )
+
+        store.upsert(df, batch_id="b1")
+        store.upsert(df, batch_id="b2")
+
+        assert [path.name for path in store.partitions()] == [
+            "battle_time_date=__HIVE_DEFAULT_PARTITION__"
+        ]
+        assert store.scan().collect().height == 1
+
+    def test_compaction_after_max_parts(self, tmp_path):
+        store = _store(tmp_path, max_parts=3)
+        for hour in range(4):
+            rows = [("#A", f"2025-07-11 0{hour}:00", "victory")]
+            stats = store.upsert(_facts(rows), batch_id=f"b{hour}")
+
+        (partition,) = store.partitions()
+        parts = sorted(partition.glob("part-*.parquet"))
+        assert stats["compacted"] == 1
+        assert len(parts) == 1 and parts[0].name.startswith("part-compacted-")
+        assert _read(store).height == 4
+        assert not list(store.staging_dir.iterdir())
+
+    def test_compact(self, tmp_path):
+        store = _store(tmp_path)
+        store.upsert(_facts(DAY1), batch_id="b1")
+        store.upsert(_facts(DAY2), batch_id="b2")
+        expected = _read(store)
+
+        assert store.compact() == 0
+        store.upsert(_facts([("#C", "2025-07-12 13:00", "draw")]), batch_id="b3")
+        assert store.compact() == 1
+        assert _read(store).height == expected.height + 1
+
+    def test_duckdb_reads_directory(self, tmp_path):
+        store = _store(tmp_path)
+        store.upsert(_facts(DAY1), batch_id="b1")
+        store.upsert(_facts(DAY2), batch_id="b2")
+
+        count, days = duckdb.sql(
+            f"SELECT COUNT(*), COUNT(DISTINCT battle_time_date) "
+            f"FROM {parquet_source(store.root)}"
+        ).fetchone()
+
+        assert (count, days) == (4, 3)
+
+
+class TestFactMatchesStore:
+    """Test how FactMatchesProcessor saves into the store."""
+
+    @pytest.fixture
+    def cleaned_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(fact_matches, "DATA_CLEANED_DIR", tmp_path)
+        return tmp_path
+
+    def test_legacy_file_is_imported(self, cleaned_dir):
+        legacy = cleaned_dir / "fact_matches.parquet"
+        _facts(DAY1).write_parquet(legacy)
+
+        processor = FactMatchesProcessor("2025-07-12")
+        processor.save_fact_matches(_facts(DAY2))
+
+        assert legacy.is_dir()
+        assert _read(processor.get_store()).height == 4
+
+    def test_overwrite_mode(self, cleaned_dir):
+        FactMatchesProcessor("2025-07-11").save_fact_matches(_facts(DAY1))
+
+        processor = FactMatchesProcessor("2025-07-12", incremental=False)
+        processor.save_fact_matches(_facts(DAY2))
+
+        output = processor.get_output_path()
+        assert output.is_file()
+        assert pl.read_parquet(output)["battle_time_date"].to_list() == [
+            date(2025, 7, 11),
+            date(2025, 7, 11),
+            date(2025, 7, 12),
+        ]
@@ -0,0 +1,186 @@
+"""
+Tests for the single-pass gold-layer build.
+"""
+
+from datetime import datetime
+
+import polars as pl
+import pytest
+
+from brawlstar_project.processing.cleaned import (
+    DimMapsProcessor,
+    FactMatchesProcessor,
+    GoldBuildContext,
+    build_context,
+    dim_battles,
+    dim_clubs,
+    dim_game_modes,
+    dim_maps,
+    dim_players,
+    fact_matches,
+    process_gold_layer,
+)
+from brawlstar_project.processing.utils import dataset_path
+
+DATE = "2025-07-11"
+TABLE_MODULES = (
+    fact_matches,
+    dim_players,
+    dim_clubs,
+    dim_game_modes,
+    dim_maps,
+    dim_battles,
+)
+
+
+@pytest.fixture
+def gold_dirs(tmp_path, monkeypatch):
+    """Processed partition of DATE and an empty cleaned directory."""
+    processed, cleaned = tmp_path / "processed", tmp_path / "cleaned"
+    monkeypatch.setattr(build_context, "DATA_PROCESSED_DIR", processed)
+    for module in TABLE_MODULES:
+        monkeypatch.setattr(module, "DATA_PROCESSED_DIR", processed)
+        monkeypatch.setattr(module, "DATA_CLEANED_DIR", cleaned)
+
+    sources = {
+        "battlelog.parquet": pl.DataFrame(
+            {
+                "battle_time": [datetime(2025, 7, 11, 9), datetime(2025, 7, 11, 10)],
+                "player_tag": ["#A", "#B"],
+                "participant_tags": ["#A,#B", "#A,#B"],
+                "map_name": ["Center Stage", "Center Stage"],
+                "event_mode": ["brawlBall", "brawlBall"],
+                "battle_mode": ["brawlBall", "brawlBall"],
+                "battle_type": ["ranked", "ranked"],
+                "battle_duration": [120, 120],
+                "battle_result": ["victory", "defeat"],
+                "brawler_name": ["SHELLY", "COLT"],
+            }
+        ),
+        "player.parquet": pl.DataFrame(
+            {
+                "tag": ["#A", "#B"],
+                "name": ["a", "b"],
+                "club_tag": ["#C", None],
+                "trophies": [100, 200],
+                "highest_trophies": [150, 250],
+                "exp_level": [10, 20],
+                "exp_points": [1000, 2000],
+            }
+        ),
+        "club.parquet": pl.DataFrame(
+            {
+                "tag": ["#C"],
+                "name": ["club"],
+                "description": ["desc"],
+                "trophies": [1000],
+                "required_trophies": [0],
+                "member_count": [1],
+            }
+        ),
+        "club_members.parquet": pl.DataFrame({"tag": ["#A"], "role": ["member"]}),
+    }
+    for filename, df in sources.items():
+        path = dataset_path(processed, filename, DATE)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.write_parquet(path)
+    return processed, cleaned
+
+
+def test_context_reads_each_source_once(gold_dirs, tmp_path):
+    processed, _ = gold_dirs
+    context = GoldBuildContext(DATE)
+
+    loaded = context.load("battlelog.parquet")
+    dataset_path(processed, "battlelog.parquet", DATE).unlink()
+    facts = FactMatchesProcessor(DATE, context=context).build_fact_matches()
+    maps = DimMapsProcessor(DATE, context=context).build_plan().collect()
+
+    assert context.source("player.parquet") is context.source("player.parquet")
+    assert context.scan(tmp_path / "missing.parquet") is None
+    # Both tables are built from the frame loaded before the file was removed
+    assert loaded.height == facts.height == 2
+    assert maps["map_name"].to_list() == ["Center Stage"]
+
+
+def test_process_gold_layer(gold_dirs):
+    _, cleaned = gold_dirs
+
+    process_gold_layer(DATE)
+
+    facts = pl.read_parquet(cleaned / "fact_matches.parquet")
+    players = pl.read_parquet(cleaned / "dim_players.parquet").sort("tag")
+    assert facts.sort("player_tag")["club_tag"].to_list() == ["#C", None]
+    assert players["club_role"].to_list() == ["member", None]
+    assert pl.read_parquet(cleaned / "dim_maps.parquet")["map_name"].to_list() == [
+        "Center Stage"
+    ]
+    assert pl.read_parquet(cleaned / "dim_battles.parquet").height == 2
+    assert (cleaned / "dim_clubs.parquet").exists()
+    assert (cleaned / "dim_players_history.parquet").is_dir()
+
+
+def test_failing_table_does_not_stop_others(gold_dirs, monkeypatch):
+    _, cleaned = gold_dirs
+
+    def broken(self, source):
+        return source.select(pl.col("no_such_column"))
+
+    monkeypatch.setattr(DimMapsProcessor, "build_dimension", broken)
+
+    results = process_gold_layer(DATE)
+
+    assert results["dim_maps"].status == "failed"
+    assert results["dim_game_modes"].status == "ok"
+    assert not (cleaned / "dim_maps.parquet").exists()
+    assert (cleaned / "dim_game_modes.parquet").exists()
+    assert (cleaned / "fact_matches.parquet").exists()
+
+
+def test_gold_build_reports_tasks(gold_dirs):
+    results = process_gold_layer(DATE, compact=True)
+
+    assert {name: result.status for name, result in results.items()} == {
+        "load battlelog.parquet": "ok",
+        "load club.parquet": "ok",
+        "load club_members.parquet": "ok",
+        "load player.parquet": "ok",
+        "fact_matches": "ok",
+        "dim_players": "ok",
+        "dim_clubs": "ok",
+        "dim_game_modes": "ok",
+        "dim_maps": "ok",
+        "dim_battles": "ok",
+        "compact fact_matches": "ok",
+        "compact dim_battles": "ok",
+    }
+
+
+def test_gold_build_tasks_wait_for_their_sources(gold_dirs, monkeypatch):
+    def missing(self, filename):
+        raise OSError(f"cannot read {filename}")
+
+    monkeypatch.setattr(GoldBuildContext, "load", missing)
+
+    results = process_gold_layer(DATE)
+
+    assert results["dim_clubs"].status == "skipped"
+    assert results["fact_matches"].error == "load battlelog.parquet did not run"
+
+
+def test_gold_build_loads_only_used_columns(gold_dirs, monkeypatch):
+    loaded = {}
+    load = GoldBuildContext.load
+
+    def recording_load(self, filename, columns=None):
+        loaded[filename] = load(self, filename, columns=columns)
+        return loaded[filename]
+
+    monkeypatch.setattr(GoldBuildContext, "load", recording_load)
+
+    process_gold_layer(DATE)
+
+    battlelog = set(loaded["battlelog.parquet"].columns)
+    assert "brawler_name" not in battlelog
+    assert {"map_name", "battle_mode", "battle_result"} <= battlelog
+    assert set(loaded["club_members.parquet"].columns) == {"tag", "role"}
@@ -0,0 +1,46 @@
+"""
+Tests for the single-pass ingested tree index.
+"""
+
+from brawlstar_project.processing.utils.ingested_index import index_ingested_tree
+from brawlstar_project.processing.utils.json_codec import write_json
+from brawlstar_project.processing.utils.segment_store import SegmentStore
+
+
+class TestIndexIngestedTree:
+    """Test index_ingested_tree grouping."""
+
+    def test_groups_files_and_segments_by_kind_and_date(self, tmp_path):
+        """Test that every file and segment lands under its kind and date."""
+        for tag in ("#B", "#A"):
+            date_dir = tmp_path / "player" / tag / "2025-01-01"
+            date_dir.mkdir(parents=True)
+            write_json({"tag": tag}, date_dir / "player.json", "compact")
+            write_json({"items": []}, date_dir / "battlelog.json", "gzip")
+        club_dir = tmp_path / "club" / "#C" / "d"
+        club_dir.mkdir(parents=True)
+        write_json({"tag": "#C"}, club_dir / "club.json", "pretty")
+        SegmentStore(tmp_path).append({"v": 1}, "#D", "player", "player", "2025-01-02")
+
+        index = index_ingested_tree(tmp_path)
+
+        players = index[("player", "player.json")]
+        assert [tag for tag, _ in players["2025-01-01"].files] == ["#A", "#B"]
+        assert len(players["2025-01-02"].segments) == 1
+        battlelogs = index[("player", "battlelog.json")]["2025-01-01"]
+        assert all(path.name == "battlelog.json.gz" for _, path in battlelogs.files)
+        assert list(index[("club", "club.json")]) == ["d"]
+
+    def test_plain_file_is_preferred(self, tmp_path):
+        """Test that a file stored twice resolves like find_json."""
+        date_dir = tmp_path / "club" / "#C" / "d"
+        date_dir.mkdir(parents=True)
+        (date_dir / "club.json.zst").write_bytes(b"")
+        (date_dir / "club.json").write_text("{}")
+
+        ((_, path),) = index_ingested_tree(tmp_path)[("club", "club.json")]["d"].files
+        assert path.name == "club.json"
+
+    def test_missing_directory(self, tmp_path):
+        """Test that an empty or missing tree gives an empty index."""
+        assert index_ingested_tree(tmp_path / "missing") == {}
@@ -0,0 +1,131 @@
+"""
+Tests for the checkpoint journal and resumable ingestion.
+"""
+
+from brawlstar_project.processing.factory import RunnerFactory
+from brawlstar_project.processing.ingested import (
+    AsyncBrawlStarsClient,
+    BrawlStarsClient,
+    CheckpointJournal,
+    IngestionPlanner,
+    IngestionTask,
+)
+
+
+class TestCheckpointJournal:
+    """Test CheckpointJournal persistence."""
+
+    def test_record_and_read_back(self, tmp_path):
+        """Test that recorded tasks are read back as (endpoint, tag) pairs."""
+        journal = CheckpointJournal(tmp_path, date="2025-01-01")
+        journal.record("player", "#PC0PPLRU")
+        journal.record("battlelog", "#PC0PPLRU")
+
+        reopened = CheckpointJournal(tmp_path, date="2025-01-01")
+        assert reopened.completed() == {
+            ("player", "#PC0PPLRU"),
+            ("battlelog", "#PC0PPLRU"),
+        }
+        assert CheckpointJournal(tmp_path, date="2025-01-02").completed() == set()
+
+    def test_truncated_line_is_ignored(self, tmp_path):
+        """Test that a line cut off by a crash does not break reading."""
+        journal = CheckpointJournal(tmp_path, date="2025-01-01")
+        journal.record("club", "#2L00GJU9Y")
+        with open(journal.path, "a") as f:
+            f.write('{"endpoint": "player", "ta')
+
+        assert journal.completed() == {("club", "#2L00GJU9Y")}
+
+
+class TestResumableIngestion:
+    """Test IngestionPlanner resume mode."""
+
+    def test_execute_journals_completed_tasks(
+        self, stub_club_api, ingested_dir, tmp_path
+    ):
+        """Test that every successful task is written to the journal."""
+        journal = CheckpointJournal(tmp_path / "journal")
+
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            planner = IngestionPlanner(client, journal=journal)
+            planner.execute(planner.plan(club_tags=[stub_club_api.club_tag]))
+
+        # club_members + club + 3 * (player + battlelog)
+        assert len(journal.completed()) == 8
+
+    def test_resume_skips_tasks_done_today(self, stub_club_api, ingested_dir, tmp_path):
+        """Test that a resumed run only fetches what the crashed run missed."""
+        # The first battlelog request fails, later ones succeed
+        stub_club_api.routes["/v1/players/%23ABCDEFGH/battlelog"].insert(
+            0, (404, {"reason": "notFound"}, {})
+        )
+        journal = CheckpointJournal(tmp_path / "journal")
+
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            planner = IngestionPlanner(client, journal=journal)
+            first = planner.execute(planner.plan(club_tags=[stub_club_api.club_tag]))
+        assert first["failed"] == 1
+
+        stub_club_api.requests.clear()
+
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            planner = IngestionPlanner(client, journal=journal, resume=True)
+            plan = planner.plan(club_tags=[stub_club_api.club_tag])
+            second = planner.execute(plan)
+
+        assert plan.tasks == [IngestionTask("battlelog", "#ABCDEFGH")]
+        assert plan.members_by_club[stub_club_api.club_tag] == (
+            stub_club_api.member_tags
+        )
+        assert [request["path"] for request in stub_club_api.requests] == [
+            "/v1/players/%23ABCDEFGH/battlelog"
+        ]
+        assert second["successful"] == 1
+        assert second["skipped"] == 7
+
+    def test_async_runner_journals_and_resumes(
+        self, stub_club_api, ingested_dir, tmp_path
+    ):
+        """Test that the async club runner journals tasks and can resume."""
+        stub_club_api.routes["/v1/players/%23ABCDEFGH/battlelog"].insert(
+            0, (404, {"reason": "notFound"}, {})
+        )
+        journal = CheckpointJournal(tmp_path / "journal")
+
+        def run(resume: bool) -> dict:
+            runner = RunnerFactory().get_runner("club-players-async")
+            runner.journal, runner.resume = journal, resume
+            client = AsyncBrawlStarsClient(
+                api_key="key", base_url=stub_club_api.base_url
+            )
+            return runner.run(client, stub_club_api.club_tag)
+
+        assert run(resume=False)["failed"] == 1
+        assert len(journal.completed()) == 7
+        stub_club_api.requests.clear()
+
+        result = run(resume=True)
+
+        assert [request["path"] for request in stub_club_api.requests] == [
+            "/v1/players/%23ABCDEFGH/battlelog"
+        ]
+        assert result["failed"] == 0
+        assert len(journal.completed()) == 8
+
+    def test_resume_without_journal_uses_saved_files(self, stub_club_api, ingested_dir):
+        """Test that files saved today count as done even without a journal."""
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            IngestionPlanner(client).execute(
+                IngestionPlanner(client).plan(player_tags=["#PC0PPLRU"])
+            )
+            stub_club_api.requests.clear()
+            plan = IngestionPlanner(client, resume=True).plan(
+                player_tags=["#PC0PPLRU", "#G02QL2U2"]
+            )
+
+        assert plan.tasks == [
+            IngestionTask("player", "#G02QL2U2"),
+            IngestionTask("battlelog", "#G02QL2U2"),
+        ]
+        assert stub_club_api.requests == []
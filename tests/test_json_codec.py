@@ -0,0 +1,136 @@
+"""
+Tests for ingested JSON serializer formats and the raw-stage reader.
+"""
+
+import polars as pl
+import pytest
+
+from brawlstar_project.processing.utils import json_utils
+from brawlstar_project.processing.utils.json_codec import (
+    find_json,
+    migrate_json_tree,
+    read_json,
+    write_json,
+)
+
+PAYLOAD = {"tag": "#PC0PPLRU", "name": "Player", "brawlers": [{"id": 1}] * 20}
+
+
+class TestJsonCodec:
+    """Test writing and reading each serializer format."""
+
+    @pytest.mark.parametrize(
+        "json_format,name",
+        [
+            ("pretty", "player.json"),
+            ("compact", "player.json"),
+            ("gzip", "player.json.gz"),
+        ],
+    )
+    def test_round_trip(self, tmp_path, json_format, name):
+        """Test that every format reads back to the same payload."""
+        written = write_json(PAYLOAD, tmp_path / "player.json", json_format)
+
+        assert written.name == name
+        assert find_json(tmp_path / "player.json") == written
+        assert read_json(written) == PAYLOAD
+
+    def test_compact_and_gzip_are_smaller(self, tmp_path):
+        """Test that compact and gzip output are smaller than pretty output."""
+        sizes = {}
+        for json_format in ("pretty", "compact", "gzip"):
+            (tmp_path / json_format).mkdir()
+            path = tmp_path / json_format / "player.json"
+            sizes[json_format] = write_json(PAYLOAD, path, json_format).stat().st_size
+
+        assert sizes["gzip"] < sizes["compact"] < sizes["pretty"]
+
+    def test_rewrite_replaces_other_encodings(self, tmp_path):
+        """Test that switching format leaves a single copy of the file."""
+        write_json(PAYLOAD, tmp_path / "player.json", "pretty")
+        write_json(PAYLOAD, tmp_path / "player.json", "gzip")
+
+        assert [p.name for p in tmp_path.iterdir()] == ["player.json.gz"]
+
+    def test_failed_write_keeps_previous_file(self, tmp_path, monkeypatch):
+        write_json(PAYLOAD, tmp_path / "player.json", "pretty")
+
+        def broken(data, json_format):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(
+            "brawlstar_project.processing.utils.json_codec.encode_json", broken
+        )
+        with pytest.raises(OSError, match="disk full"):
+            write_json(PAYLOAD, tmp_path / "player.json", "compact")
+
+        assert read_json(tmp_path / "player.json") == PAYLOAD
+        assert [path.name for path in tmp_path.iterdir()] == ["player.json"]
+
+    def test_unknown_format_is_rejected(self, ingested_dir, monkeypatch):
+        """Test that an invalid BRAWLSTARS_JSON_FORMAT raises a clear error."""
+        monkeypatch.setenv("BRAWLSTARS_JSON_FORMAT", "xml")
+
+        with pytest.raises(ValueError, match="Unknown JSON format"):
+            json_utils.save_json_data_partitioned(PAYLOAD, "#PC0PPLRU", "player")
+        assert not ingested_dir.exists()
+
+    def test_migrate_tree_is_idempotent(self, tmp_path):
+        """Test that a migrated tree is left untouched by a second migration."""
+        for tag in ("#A", "#B"):
+            (tmp_path / tag).mkdir()
+            write_json(PAYLOAD, tmp_path / tag / "player.json", "pretty")
+
+        first = migrate_json_tree(tmp_path, "gzip")
+        second = migrate_json_tree(tmp_path, "gzip")
+
+        assert first["converted"] == 2
+        assert first["bytes_after"] < first["bytes_before"]
+        assert second == {
+            "converted": 0,
+            "unchanged": 2,
+            "bytes_before": 0,
+            "bytes_after": 0,
+        }
+        assert sorted(p.name for p in tmp_path.rglob("player.json*")) == [
+            "player.json.gz",
+            "player.json.gz",
+        ]
+
+
+class TestRawStageReadsAnyFormat:
+    """Test that the raw-stage conversion reads mixed-format trees."""
+
+    def test_convert_mixed_formats(self, tmp_path, ingested_dir, monkeypatch):
+        """Test that plain and gzip club files of one date are both converted."""
+        club = {
+            "tag": "#2L00GJU9Y",
+            "name": "Club",
+            "description": None,
+            "type": "open",
+            "badgeId": 8000000,
+            "requiredTrophies": 0,
+            "trophies": 1000,
+            "members": [],
+        }
+        monkeypatch.setenv("BRAWLSTARS_JSON_FORMAT", "gzip")
+        json_utils.save_club_data_partitioned(club, "#2L00GJU9Y")
+        monkeypatch.setenv("BRAWLSTARS_JSON_FORMAT", "compact")
+        json_utils.save_club_data_partitioned(
+            {**club, "tag": "#80Y22P29J"}, "#80Y22P29J"
+        )
+
+        json_utils.convert_jsons_to_parquet_per_date_partitioned(
+            ingested_base_dir=str(ingested_dir),
+            raw_base_dir=str(tmp_path / "raw"),
+            data_type="club",
+            json_filename="club.json",
+            parquet_filename="club.parquet",
+            flatten_func=json_utils.flatten_club_data,
+        )
+
+        (parquet_file,) = (tmp_path / "raw" / "club").glob("*/club.parquet")
+        assert sorted(pl.read_parquet(parquet_file)["tag"]) == [
+            "#2L00GJU9Y",
+            "#80Y22P29J",
+        ]
@@ -0,0 +1,63 @@
+"""
+Tests for the vectorized match_id expression.
+"""
+
+from datetime import date, datetime
+
+import polars as pl
+import pytest
+
+from brawlstar_project.processing.cleaned import FactMatchesProcessor, match_id_expr
+
+MAPS = ["Center Stage", "Hard-Rock Mine", "Snake_Prairie", ""]
+TAGS = ["#GQJRYV0JQ", "#2PP", "NOHASH", "#A#B"]
+
+
+def _reference(df: pl.DataFrame) -> list[str]:
+    processor = FactMatchesProcessor("2025-07-11")
+    return [
+        processor.generate_match_id(
+            row["player_tag"], row["battle_time"], row["map_name"]
+        )
+        for row in df.iter_rows(named=True)
+    ]
+
+
+def _vectorized(df: pl.DataFrame) -> list[str]:
+    expr = match_id_expr(df.schema["battle_time"]).alias("match_id")
+    return df.select(expr)["match_id"].to_list()
+
+
+@pytest.mark.parametrize(
+    "battle_times",
+    [
+        [
+            datetime(2025, 7, 13, 6, 18, 19),
+            datetime(1999, 12, 31, 23, 59, 59),
+            None,
+            datetime(2025, 1, 2),
+        ],
+        [date(2025, 7, 13), date(2024, 2, 29), None, date(2025, 1, 2)],
+        # String fallback: ISO with and without dashes, no "T", short, empty
+        ["20250713T061819.000Z", "2025-07-13T06:18:19", "2025071399", "2025"],
+        ["", None, "T", "abc-defTx"],
+    ],
+)
+def test_matches_generate_match_id(battle_times):
+    df = pl.DataFrame(
+        {"player_tag": TAGS, "battle_time": battle_times, "map_name": MAPS}
+    )
+
+    assert _vectorized(df) == _reference(df)
+
+
+def test_timezone_aware_datetimes():
+    df = pl.DataFrame(
+        {
+            "player_tag": ["#A"],
+            "battle_time": [datetime(2025, 7, 13, 23, 30)],
+            "map_name": ["Center Stage"],
+        }
+    ).with_columns(pl.col("battle_time").dt.replace_time_zone("Europe/Paris"))
+
+    assert _vectorized(df) == _reference(df) == ["A-20250713-Center_Stage"]
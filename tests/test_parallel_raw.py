@@ -0,0 +1,68 @@
+"""
+Tests for parallel raw-stage conversion.
+"""
+
+import polars as pl
+import pytest
+
+from brawlstar_project.processing.ingested import BrawlStarsClient, IngestionPlanner
+from brawlstar_project.processing.utils import json_utils
+from brawlstar_project.processing.utils.raw_manifest import RawManifest
+
+
+@pytest.fixture
+def ingested_club(stub_club_api, ingested_dir):
+    """Ingest the stub club and its members."""
+    with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+        planner = IngestionPlanner(client)
+        planner.execute(planner.plan(club_tags=[stub_club_api.club_tag]))
+    return ingested_dir
+
+
+def _frames(raw_dir) -> dict:
+    return {
+        path.relative_to(raw_dir): pl.read_parquet(path).drop("extracted_at")
+        for path in raw_dir.rglob("*.parquet")
+    }
+
+
+class TestParallelConversion:
+    """Test convert_all_json_to_parquet_partitioned with worker processes."""
+
+    def test_workers_match_serial_output(self, ingested_club, tmp_path):
+        """Test that the process pool writes the same files as a serial run."""
+        for workers in (1, 2):
+            json_utils.convert_all_json_to_parquet_partitioned(
+                ingested_base_dir=str(ingested_club),
+                raw_base_dir=str(tmp_path / f"raw-{workers}"),
+                workers=workers,
+            )
+
+        serial = _frames(tmp_path / "raw-1")
+        parallel = _frames(tmp_path / "raw-2")
+        assert len(serial) == 4
+        assert serial.keys() == parallel.keys()
+        assert all(serial[path].equals(parallel[path]) for path in serial)
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_failed_partition_is_isolated(self, ingested_club, tmp_path, workers):
+        """Test that a corrupt input only fails its own partition."""
+        (club_file,) = (ingested_club / "club").rglob("club.json")
+        club_file.write_text("{not json")
+        raw_dir = tmp_path / "raw"
+
+        with pytest.raises(RuntimeError, match="1 raw partition"):
+            json_utils.convert_all_json_to_parquet_partitioned(
+                ingested_base_dir=str(ingested_club),
+                raw_base_dir=str(raw_dir),
+                workers=workers,
+            )
+
+        written = {path.name for path in raw_dir.rglob("*.parquet")}
+        assert written == {
+            "player.parquet",
+            "battlelog.parquet",
+            "club_members.parquet",
+        }
+        recorded = {key.rsplit("/", 1)[1] for key in RawManifest(raw_dir).entries}
+        assert "club.parquet" not in recorded
@@ -0,0 +1,122 @@
+"""
+Tests for the streaming Parquet writer and batched raw conversion.
+"""
+
+import polars as pl
+import pytest
+
+from brawlstar_project.processing.ingested import BrawlStarsClient, IngestionPlanner
+from brawlstar_project.processing.utils import json_utils
+from brawlstar_project.processing.utils.parquet_stream import (
+    StreamingParquetWriter,
+    get_raw_batch_limits,
+)
+
+
+class TestStreamingParquetWriter:
+    """Test StreamingParquetWriter parts, merge and cleanup."""
+
+    def test_batches_are_merged(self, tmp_path):
+        """Test that several batches end up in one file, in order."""
+        target = tmp_path / "out.parquet"
+        with StreamingParquetWriter(target) as writer:
+            writer.write(pl.DataFrame({"a": [1, 2], "b": [None, None]}))
+            writer.write(pl.DataFrame({"a": [3], "b": ["x"]}))
+            writer.write(pl.DataFrame({"a": []}, schema={"a": pl.Int64}))
+
+        assert pl.read_parquet(target).to_dict(as_series=False) == {
+            "a": [1, 2, 3],
+            "b": [None, None, "x"],
+        }
+        assert writer.rows == 3
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_single_batch_is_renamed(self, tmp_path):
+        """Test that one batch is published without a merge."""
+        target = tmp_path / "out.parquet"
+        with StreamingParquetWriter(target) as writer:
+            writer.write(pl.DataFrame({"a": [1]}))
+
+        assert pl.read_parquet(target)["a"].to_list() == [1]
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_failure_keeps_previous_file(self, tmp_path):
+        """Test that an exception discards the parts and keeps the old target."""
+        target = tmp_path / "out.parquet"
+        pl.DataFrame({"a": [0]}).write_parquet(target)
+
+        with pytest.raises(RuntimeError):
+            with StreamingParquetWriter(target) as writer:
+                writer.write(pl.DataFrame({"a": [1]}))
+                raise RuntimeError("flatten failed")
+
+        assert pl.read_parquet(target)["a"].to_list() == [0]
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_limits_from_environment(self, monkeypatch):
+        """Test that batch limits are read and validated."""
+        monkeypatch.setenv("BRAWLSTARS_RAW_BATCH_SIZE", "50")
+        monkeypatch.setenv("BRAWLSTARS_RAW_MEMORY_MB", "0.5")
+        assert get_raw_batch_limits() == (50, 512 * 1024)
+
+        monkeypatch.setenv("BRAWLSTARS_RAW_BATCH_SIZE", "0")
+        with pytest.raises(ValueError):
+            get_raw_batch_limits()
+
+
+class TestBatchedConversion:
+    """Test that batching does not change the raw stage output."""
+
+    @pytest.mark.parametrize("trusted", [True, False])
+    def test_small_batches_match_single_batch(
+        self, stub_club_api, ingested_dir, tmp_path, monkeypatch, trusted
+    ):
+        """Test one-payload batches against the default batch size."""
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            planner = IngestionPlanner(client)
+            planner.execute(planner.plan(club_tags=[stub_club_api.club_tag]))
+
+        frames = {}
+        for batch_size in ("1000", "1"):
+            monkeypatch.setenv("BRAWLSTARS_RAW_BATCH_SIZE", batch_size)
+            raw_dir = tmp_path / f"raw-{batch_size}"
+            json_utils.convert_all_json_to_parquet_partitioned(
+                ingested_base_dir=str(ingested_dir),
+                raw_base_dir=str(raw_dir),
+                trusted=trusted,
+            )
+            frames[batch_size] = {
+                path.relative_to(raw_dir): pl.read_parquet(path).drop("extracted_at")
+                for path in raw_dir.rglob("*.parquet")
+            }
+
+        assert len(frames["1"]) == 4
+        for path, df in frames["1000"].items():
+            assert df.equals(frames["1"][path])
+
+    def test_memory_limit_applies_to_trusted_battlelogs(
+        self, stub_club_api, ingested_dir, tmp_path, monkeypatch
+    ):
+        """Test that buffered battlelog payloads count towards the memory limit."""
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            planner = IngestionPlanner(client)
+            planner.execute(planner.plan(club_tags=[stub_club_api.club_tag]))
+        batches = []
+        flatten = json_utils.flatten_battlelogs
+
+        def recording_flatten(payloads):
+            batches.append(len(payloads))
+            return flatten(payloads)
+
+        monkeypatch.setattr(json_utils, "flatten_battlelogs", recording_flatten)
+        # Any payload reaches a 1-byte limit: every battlelog is its own batch
+        monkeypatch.setenv("BRAWLSTARS_RAW_MEMORY_MB", str(1 / 1024 / 1024))
+
+        json_utils.convert_all_json_to_parquet_partitioned(
+            ingested_base_dir=str(ingested_dir),
+            raw_base_dir=str(tmp_path / "raw"),
+            trusted=True,
+        )
+
+        assert len(batches) > 1
+        assert set(batches) == {1}
@@ -0,0 +1,102 @@
+"""
+Tests for the in-process pipeline API.
+"""
+
+import polars as pl
+import pytest
+
+from brawlstar_project.processing import pipeline
+from brawlstar_project.processing.cleaned import (
+    GoldBuildContext,
+    TaskResult,
+    build_context,
+)
+from brawlstar_project.processing.factory import processing_factory
+from brawlstar_project.processing.utils import dataset_path
+
+DATE = "2025-07-11"
+
+
+@pytest.fixture
+def stage_calls(monkeypatch):
+    """Replace the stage functions by recorders."""
+    calls = []
+    frames = {"player.parquet": pl.DataFrame({"tag": ["#A"]})}
+    monkeypatch.setattr(pipeline, "run_raw_stage", lambda: calls.append("raw"))
+    monkeypatch.setattr(
+        pipeline,
+        "run_processed_stage",
+        lambda date: calls.append(("processed", date)) or frames,
+    )
+    monkeypatch.setattr(
+        pipeline,
+        "run_cleaned_stage",
+        lambda date, frames=None: calls.append(("cleaned", date, frames)),
+    )
+    return calls, frames
+
+
+def test_stages_run_in_order_with_frames(stage_calls):
+    calls, frames = stage_calls
+
+    results = pipeline.run_pipeline(DATE, stages=["cleaned", "raw", "processed"])
+
+    assert calls == ["raw", ("processed", DATE), ("cleaned", DATE, frames)]
+    assert list(results) == ["raw", "processed", "cleaned"]
+    assert results["processed"].output is frames
+
+
+def test_frames_not_passed_without_in_memory(stage_calls):
+    calls, _ = stage_calls
+
+    pipeline.run_pipeline(DATE, stages=["processed", "cleaned"], in_memory=False)
+
+    assert calls[-1] == ("cleaned", DATE, None)
+
+
+def test_unknown_stage(stage_calls):
+    with pytest.raises(ValueError, match="Unknown stages"):
+        pipeline.run_pipeline(DATE, stages=["gold"])
+    assert stage_calls[0] == []
+
+
+def test_failed_gold_task_fails_the_stage(monkeypatch):
+    results = {
+        "fact_matches": TaskResult("fact_matches", "failed", error="boom"),
+        "dim_maps": TaskResult("dim_maps", "ok"),
+    }
+    monkeypatch.setattr(pipeline, "process_gold_layer", lambda date, frames: results)
+
+    with pytest.raises(RuntimeError, match="fact_matches"):
+        pipeline.run_pipeline(DATE, stages=["cleaned"])
+
+
+def test_process_partition_returns_written_frame(tmp_path, monkeypatch):
+    raw, processed = tmp_path / "raw", tmp_path / "processed"
+    monkeypatch.setattr(processing_factory, "DATA_RAW_DIR", raw)
+    monkeypatch.setattr(processing_factory, "DATA_PROCESSED_DIR", processed)
+    path = dataset_path(raw, "club.parquet", DATE)
+    path.parent.mkdir(parents=True)
+    pl.DataFrame({"tag": ["#C"], "trophies": [1]}).write_parquet(path)
+
+    frames = processing_factory.process_partition(
+        "club.parquet", "club", lambda df: df.with_columns(trophies=2), DATE
+    )
+    missing = processing_factory.process_partition(
+        "player.parquet", "player", lambda df: df, DATE
+    )
+
+    written = pl.read_parquet(dataset_path(processed, "club.parquet", DATE))
+    assert frames["club.parquet"].equals(written)
+    assert written["trophies"].to_list() == [2]
+    assert missing == {}
+
+
+def test_context_uses_in_memory_frames(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_context, "DATA_PROCESSED_DIR", tmp_path)
+    df = pl.DataFrame({"tag": ["#A"]})
+
+    context = GoldBuildContext(DATE, frames={"player.parquet": df})
+
+    assert context.source("player.parquet").collect().equals(df)
+    assert context.source("club.parquet") is None
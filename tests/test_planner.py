@@ -0,0 +1,60 @@
+"""
+Tests for the de-duplicated ingestion planner.
+"""
+
+from brawlstar_project.processing.factory import RunnerFactory
+from brawlstar_project.processing.ingested import (
+    BrawlStarsClient,
+    IngestionPlanner,
+    IngestionTask,
+)
+
+
+class TestIngestionPlanner:
+    """Test IngestionPlanner task de-duplication and execution."""
+
+    def test_plan_deduplicates_members_and_players(self, stub_club_api, ingested_dir):
+        """Test that shared members and configured players are planned once."""
+        stub_club_api.add_club("#80Y22P29J", ["#PC0PPLRU"])
+
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            plan = IngestionPlanner(client).plan(
+                club_tags=["2L00GJU9Y", "#80Y22P29J", "#2L00GJU9Y"],
+                player_tags=["#G02QL2U2", "G02QL2U2"],
+            )
+
+        assert plan.count_by_endpoint() == {"club": 2, "player": 3, "battlelog": 3}
+        assert plan.request_count == 8
+        assert len(set(plan.tasks)) == len(plan.tasks)
+        assert IngestionTask("club_members", "#80Y22P29J") in plan.completed
+
+    def test_execute_fetches_each_pair_once(self, stub_club_api, ingested_dir):
+        """Test that executing a plan makes one request per endpoint/tag."""
+        stub_club_api.add_club("#80Y22P29J", ["#PC0PPLRU", "#G02QL2U2"])
+
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            planner = IngestionPlanner(client)
+            plan = planner.plan(club_tags=["#2L00GJU9Y", "#80Y22P29J"])
+            result = planner.execute(plan)
+
+        paths = [request["path"] for request in stub_club_api.requests]
+        assert len(paths) == len(set(paths)) == 10
+        assert result["successful"] == 10
+        assert result["failed"] == 0
+        assert len(list(ingested_dir.glob("player/*/*/battlelog.json"))) == 3
+
+    def test_club_with_members_runner_uses_planner(self, stub_club_api, ingested_dir):
+        """Test that the club-players runner reports per-member failures."""
+        stub_club_api.routes.pop("/v1/players/%23ABCDEFGH/battlelog")
+        runner = RunnerFactory().get_runner("club-players")
+
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            result = runner.run(client, stub_club_api.club_tag, delay=0)
+
+        assert result == {
+            "status": "success",
+            "total": 3,
+            "successful": 2,
+            "failed": 1,
+            "retries": 0,
+        }
@@ -0,0 +1,119 @@
+"""
+Tests for the token-bucket rate limiter.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from brawlstar_project.processing.ingested import (
+    AsyncBrawlStarsClient,
+    BrawlStarsClient,
+    TokenBucketRateLimiter,
+)
+from brawlstar_project.processing.ingested.rate_limiter import parse_retry_after
+
+
+class TestTokenBucketRateLimiter:
+    """Test TokenBucketRateLimiter pacing."""
+
+    def test_burst_is_free_then_paced(self):
+        """Test that the burst is served immediately and later calls wait."""
+        limiter = TokenBucketRateLimiter(rate=10, burst=3)
+
+        waits = [limiter.reserve() for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(0.1, abs=0.01)
+        assert waits[4] == pytest.approx(0.2, abs=0.01)
+
+    def test_shared_across_threads(self):
+        """Test that concurrent threads never exceed the configured rate."""
+        limiter = TokenBucketRateLimiter(rate=50, burst=1)
+        start = time.monotonic()
+
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(11)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert time.monotonic() - start >= 0.19
+
+    def test_shared_across_tasks(self):
+        """Test that asyncio tasks are paced by the same bucket."""
+        limiter = TokenBucketRateLimiter(rate=50, burst=1)
+
+        async def run():
+            await asyncio.gather(*(limiter.acquire_async() for _ in range(11)))
+
+        start = time.monotonic()
+        asyncio.run(run())
+        assert time.monotonic() - start >= 0.19
+
+    def test_rate_limited_pauses_and_halves_rate(self):
+        """Test that a 429 pauses the bucket and slows it down."""
+        limiter = TokenBucketRateLimiter(rate=10, burst=5)
+
+        limiter.on_rate_limited(retry_after=0.5)
+
+        assert limiter.rate == 5
+        assert limiter.reserve() == pytest.approx(0.5, abs=0.02)
+
+    def test_rate_recovers_after_success(self):
+        """Test that successful calls recover the rate up to the maximum."""
+        limiter = TokenBucketRateLimiter(rate=1, burst=1, recovery_step=0.25)
+        limiter.on_rate_limited(retry_after=0)
+
+        for _ in range(10):
+            limiter.on_success()
+
+        assert limiter.rate == 1
+
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for seconds, dates and garbage."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestClientRateLimiting:
+    """Test rate limiting through the API clients."""
+
+    def test_sync_client_honors_retry_after(self, stub_api):
+        """Test that a 429 is retried after the Retry-After pause."""
+        stub_api.add_route(
+            "/v1/clubs/%23ABC", {}, status=429, headers={"Retry-After": "0.2"}
+        )
+        stub_api.add_route("/v1/clubs/%23ABC", {"tag": "#ABC"})
+        limiter = TokenBucketRateLimiter(rate=100, burst=10)
+
+        start = time.monotonic()
+        with BrawlStarsClient(
+            api_key="key", base_url=stub_api.base_url, rate_limiter=limiter
+        ) as client:
+            assert client.get_club("%23ABC") == {"tag": "#ABC"}
+
+        assert time.monotonic() - start >= 0.2
+        assert len(stub_api.requests) == 2
+        assert limiter.rate < 100
+
+    def test_async_client_honors_retry_after(self, stub_api):
+        """Test that the async client retries after a 429."""
+        stub_api.add_route(
+            "/v1/clubs/%23ABC", {}, status=429, headers={"Retry-After": "0.1"}
+        )
+        stub_api.add_route("/v1/clubs/%23ABC", {"tag": "#ABC"})
+        limiter = TokenBucketRateLimiter(rate=100, burst=10)
+
+        async def fetch():
+            async with AsyncBrawlStarsClient(
+                api_key="key", base_url=stub_api.base_url, rate_limiter=limiter
+            ) as client:
+                return await client.get_club("%23ABC")
+
+        assert asyncio.run(fetch()) == {"tag": "#ABC"}
+        assert len(stub_api.requests) == 2
@@ -0,0 +1,81 @@
+"""
+Tests for incremental raw-stage conversion.
+"""
+
+import os
+
+from brawlstar_project.processing.ingested import BrawlStarsClient, IngestionPlanner
+from brawlstar_project.processing.utils import json_utils
+from brawlstar_project.processing.utils.raw_manifest import RawManifest
+
+
+def _convert(ingested_dir, raw_dir, incremental=True):
+    json_utils.convert_all_json_to_parquet_partitioned(
+        ingested_base_dir=str(ingested_dir),
+        raw_base_dir=str(raw_dir),
+        incremental=incremental,
+    )
+
+
+def _mtimes(raw_dir) -> dict:
+    return {path: path.stat().st_mtime_ns for path in raw_dir.rglob("*.parquet")}
+
+
+class TestRawManifest:
+    """Test RawManifest bookkeeping."""
+
+    def test_is_current(self, tmp_path):
+        """Test that an output is current only for identical inputs."""
+        manifest = RawManifest(tmp_path)
+        output = tmp_path / "player" / "2025-01-01" / "player.parquet"
+        inputs = {"player/#A/2025-01-01/player.json": [1, 10]}
+
+        assert not manifest.is_current(output, inputs)
+        manifest.record(output, inputs, rows=0)
+        assert manifest.is_current(output, inputs)
+        assert not manifest.is_current(output, {"x": [1, 10]})
+
+        # Outputs with rows must still exist on disk
+        manifest.record(output, inputs, rows=3)
+        assert not manifest.is_current(output, inputs)
+
+    def test_save_and_reload(self, tmp_path):
+        """Test that the manifest survives a reload."""
+        manifest = RawManifest(tmp_path)
+        manifest.record(tmp_path / "club" / "d" / "club.parquet", {"a": [1, 2]}, 5)
+        manifest.save()
+
+        assert RawManifest(tmp_path).entries == manifest.entries
+
+
+class TestIncrementalConversion:
+    """Test that only dates with new or changed inputs are reconverted."""
+
+    def test_unchanged_inputs_are_skipped(self, stub_club_api, ingested_dir, tmp_path):
+        """Test skip, change detection and full refresh."""
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            planner = IngestionPlanner(client)
+            planner.execute(planner.plan(club_tags=[stub_club_api.club_tag]))
+        raw_dir = tmp_path / "raw"
+
+        _convert(ingested_dir, raw_dir)
+        first = _mtimes(raw_dir)
+        assert len(first) == 4
+
+        _convert(ingested_dir, raw_dir)
+        assert _mtimes(raw_dir) == first
+
+        # Touching one player file only reconverts player.parquet
+        (player_file, *_) = (ingested_dir / "player").rglob("player.json")
+        os.utime(player_file, ns=(1, 1))
+        _convert(ingested_dir, raw_dir)
+        changed = {
+            path.name
+            for path, mtime in _mtimes(raw_dir).items()
+            if first[path] != mtime
+        }
+        assert changed == {"player.parquet"}
+
+        second = _mtimes(raw_dir)
+        _convert(ingested_dir, raw_dir, incremental=False)
+        assert all(second[path] != mtime for path, mtime in _mtimes(raw_dir).items())
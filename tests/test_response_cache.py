@@ -0,0 +1,118 @@
+"""
+Tests for the on-disk API response cache.
+"""
+
+import time
+
+from brawlstar_project.processing.factory import RunnerFactory
+from brawlstar_project.processing.ingested import BrawlStarsClient, ResponseCache
+from brawlstar_project.processing.ingested.cache import is_cache_hit
+
+
+class TestResponseCache:
+    """Test ResponseCache freshness rules."""
+
+    def test_fresh_entry_is_served(self, tmp_path):
+        """Test that an entry within its TTL is a hit."""
+        cache = ResponseCache(tmp_path)
+        cache.store("club", "%23ABC", {"tag": "#ABC"}, etag=None)
+
+        payload, etag = cache.lookup("club", "#ABC")
+
+        assert payload == {"tag": "#ABC"}
+        assert is_cache_hit(payload)
+        assert cache.stats["hits"] == 1
+
+    def test_stale_entry_returns_etag(self, tmp_path):
+        """Test that an expired entry asks for revalidation."""
+        cache = ResponseCache(tmp_path, ttls={"club": 0})
+        cache.store("club", "#ABC", {"tag": "#ABC"}, etag='"v1"')
+
+        assert cache.lookup("club", "#ABC") == (None, '"v1"')
+
+    def test_uncacheable_endpoint(self, tmp_path):
+        """Test that battlelogs are never cached by default."""
+        cache = ResponseCache(tmp_path)
+        cache.store("battlelog", "#ABC", {"items": []}, etag='"v1"')
+
+        assert cache.lookup("battlelog", "#ABC") == (None, None)
+        assert not (tmp_path / "battlelog").exists()
+
+
+class TestClientCaching:
+    """Test the response cache through BrawlStarsClient."""
+
+    def test_club_is_fetched_once(self, stub_api, tmp_path):
+        """Test that a fresh club entry skips the network."""
+        stub_api.add_route("/v1/clubs/%23ABC", {"tag": "#ABC"})
+        cache = ResponseCache(tmp_path)
+
+        with BrawlStarsClient(
+            api_key="key", base_url=stub_api.base_url, cache=cache
+        ) as client:
+            first = client.get_club("%23ABC")
+            second = client.get_club("%23ABC")
+
+        assert first == second == {"tag": "#ABC"}
+        assert not is_cache_hit(first)
+        assert is_cache_hit(second)
+        assert len(stub_api.requests) == 1
+        assert cache.stats["misses"] == 1
+        assert cache.stats["hits"] == 1
+
+    def test_etag_revalidation(self, stub_api, tmp_path):
+        """Test that If-None-Match is sent and a 304 serves the cached body."""
+        stub_api.add_route(
+            "/v1/players/%23ABC", {"tag": "#ABC"}, headers={"ETag": '"v1"'}
+        )
+        stub_api.add_route("/v1/players/%23ABC", None, status=304)
+        cache = ResponseCache(tmp_path)
+
+        with BrawlStarsClient(
+            api_key="key", base_url=stub_api.base_url, cache=cache
+        ) as client:
+            client.get_player("%23ABC")
+            second = client.get_player("%23ABC")
+
+        assert second == {"tag": "#ABC"}
+        assert is_cache_hit(second)
+        assert stub_api.requests[1]["headers"]["If-None-Match"] == '"v1"'
+        assert cache.stats["revalidated"] == 1
+
+    def test_expired_entry_is_refetched(self, stub_api, tmp_path):
+        """Test that an entry past its TTL without ETag is downloaded again."""
+        stub_api.add_route("/v1/clubs/%23ABC", {"tag": "#ABC"})
+        cache = ResponseCache(tmp_path, ttls={"club": 0.05})
+
+        with BrawlStarsClient(
+            api_key="key", base_url=stub_api.base_url, cache=cache
+        ) as client:
+            client.get_club("%23ABC")
+            time.sleep(0.1)
+            client.get_club("%23ABC")
+
+        assert len(stub_api.requests) == 2
+
+
+class TestCacheHitsSkipSave:
+    """Test that cache hits skip re-validation and saving."""
+
+    def test_club_runner_skips_unchanged_save(
+        self, stub_club_api, ingested_dir, tmp_path
+    ):
+        """Test that a second run on the same day does not rewrite club files."""
+        cache = ResponseCache(tmp_path / "cache")
+        runner = RunnerFactory().get_runner("club")
+
+        with BrawlStarsClient(
+            api_key="key", base_url=stub_club_api.base_url, cache=cache
+        ) as client:
+            runner.run(client, stub_club_api.club_tag)
+            (club_json,) = ingested_dir.glob("club/*/*/club.json")
+            first_mtime = club_json.stat().st_mtime_ns
+            time.sleep(0.01)
+            result = runner.run(client, stub_club_api.club_tag)
+
+        assert result["status"] == "success"
+        assert club_json.stat().st_mtime_ns == first_mtime
+        assert cache.stats["hits"] == 2
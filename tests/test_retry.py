@@ -0,0 +1,153 @@
+"""
+Tests for API client retries with exponential backoff.
+"""
+
+import asyncio
+
+import pytest
+import requests
+
+from brawlstar_project.processing.factory import RunnerFactory
+from brawlstar_project.processing.ingested import (
+    AsyncBrawlStarsClient,
+    BrawlStarsClient,
+    RetryBudget,
+    RetryPolicy,
+)
+
+FAST_POLICY = RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.01)
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy and RetryBudget."""
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test that delays stay within the exponential cap."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+        for attempt in range(6):
+            delay = policy.backoff(attempt)
+            assert 0 <= delay <= min(5.0, 2**attempt)
+
+    def test_budget_is_exhausted(self):
+        """Test that the run budget stops granting retries."""
+        budget = RetryBudget(max_retries=2)
+
+        assert budget.try_consume()
+        assert budget.try_consume()
+        assert not budget.try_consume()
+        assert budget.remaining == 0
+
+
+class TestClientRetries:
+    """Test retries through the API clients."""
+
+    def test_transient_5xx_is_retried(self, stub_api):
+        """Test that a 503 followed by a 200 succeeds."""
+        stub_api.add_route("/v1/players/%23PC0PPLRU", {}, status=503)
+        stub_api.add_route("/v1/players/%23PC0PPLRU", {"tag": "#PC0PPLRU"})
+
+        with BrawlStarsClient(
+            api_key="key", base_url=stub_api.base_url, retry_policy=FAST_POLICY
+        ) as client:
+            assert client.get_player("%23PC0PPLRU") == {"tag": "#PC0PPLRU"}
+
+        assert len(stub_api.requests) == 2
+
+    def test_client_errors_are_not_retried(self, stub_api):
+        """Test that a 404 is raised without retrying."""
+        with BrawlStarsClient(
+            api_key="key", base_url=stub_api.base_url, retry_policy=FAST_POLICY
+        ) as client:
+            with pytest.raises(requests.HTTPError):
+                client.get_player("%23UNKNOWN")
+
+        assert len(stub_api.requests) == 1
+
+    def test_attempts_are_bounded(self, stub_api):
+        """Test that persistent 5xx fail after max_attempts."""
+        stub_api.add_route("/v1/players/%23PC0PPLRU", {}, status=500)
+
+        with BrawlStarsClient(
+            api_key="key", base_url=stub_api.base_url, retry_policy=FAST_POLICY
+        ) as client:
+            with pytest.raises(requests.HTTPError):
+                client.get_player("%23PC0PPLRU")
+
+        assert len(stub_api.requests) == 3
+
+    def test_budget_limits_retries(self, stub_api):
+        """Test that an exhausted budget disables retries."""
+        stub_api.add_route("/v1/players/%23PC0PPLRU", {}, status=500)
+        budget = RetryBudget(max_retries=1)
+
+        with BrawlStarsClient(
+            api_key="key",
+            base_url=stub_api.base_url,
+            retry_policy=FAST_POLICY,
+            retry_budget=budget,
+        ) as client:
+            with pytest.raises(requests.HTTPError):
+                client.get_player("%23PC0PPLRU")
+
+        assert len(stub_api.requests) == 2
+        assert budget.used == 1
+
+    def test_connection_error_is_retried(self):
+        """Test that connection errors are retried then raised."""
+        budget = RetryBudget(max_retries=10)
+        with BrawlStarsClient(
+            api_key="key",
+            base_url="http://127.0.0.1:9/v1/",
+            retry_policy=FAST_POLICY,
+            retry_budget=budget,
+        ) as client:
+            with pytest.raises(requests.ConnectionError):
+                client.get_club("%23ABC")
+
+        assert budget.used == 2
+
+    def test_async_client_retries(self, stub_api):
+        """Test that the async client retries a transient 502."""
+        stub_api.add_route("/v1/clubs/%23ABC", {}, status=502)
+        stub_api.add_route("/v1/clubs/%23ABC", {"tag": "#ABC"})
+
+        async def fetch():
+            async with AsyncBrawlStarsClient(
+                api_key="key", base_url=stub_api.base_url, retry_policy=FAST_POLICY
+            ) as client:
+                return await client.get_club("%23ABC")
+
+        assert asyncio.run(fetch()) == {"tag": "#ABC"}
+        assert len(stub_api.requests) == 2
+
+
+class TestRunnerRetryCounts:
+    """Test that runners report retries in their result dicts."""
+
+    def test_player_runner_reports_retries(self, stub_club_api, ingested_dir):
+        """Test that a flaky response is retried and counted."""
+        stub_club_api.routes["/v1/players/%23PC0PPLRU"].insert(0, (503, {}, {}))
+        runner = RunnerFactory().get_runner("player")
+
+        with BrawlStarsClient(
+            api_key="key", base_url=stub_club_api.base_url, retry_policy=FAST_POLICY
+        ) as client:
+            result = runner.run(client, "#PC0PPLRU")
+
+        assert result == {"status": "success", "retries": 1}
+
+    def test_async_runner_reports_retries(self, stub_club_api, ingested_dir):
+        """Test that the async runner counts retries per club."""
+        stub_club_api.routes["/v1/players/%23G02QL2U2/battlelog"].insert(
+            0, (500, {}, {})
+        )
+        runner = RunnerFactory().get_runner("club-players-async")
+        client = AsyncBrawlStarsClient(
+            api_key="key", base_url=stub_club_api.base_url, retry_policy=FAST_POLICY
+        )
+
+        result = runner.run(client, stub_club_api.club_tag)
+
+        assert result["successful"] == 3
+        assert result["retries"] == 1
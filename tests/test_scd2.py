@@ -0,0 +1,182 @@
+"""
+Tests for the SCD type 2 dimension history.
+"""
+
+from datetime import date
+
+import duckdb
+import polars as pl
+import pytest
+
+from brawlstar_project.processing.cleaned import DimClubsProcessor, SCD2Store, dim_clubs
+
+
+def _players(rows: list[tuple[str, int, str]]) -> pl.DataFrame:
+    """Snapshot from (tag, trophies, club_tag) triples."""
+    return pl.DataFrame(
+        rows, schema=["tag", "trophies", "club_tag"], orient="row"
+    ).with_columns(pl.lit("note").alias("untracked"))
+
+
+def _store(tmp_path) -> SCD2Store:
+    return SCD2Store(
+        tmp_path / "dim_history.parquet", key=["tag"], tracked=["trophies", "club_tag"]
+    )
+
+
+def _versions(store: SCD2Store) -> list[tuple]:
+    return (
+        store.scan()
+        .select("tag", "trophies", "valid_from", "valid_to")
+        .sort("tag", "valid_from")
+        .collect()
+        .rows()
+    )
+
+
+D1, D2, D3 = date(2025, 7, 10), date(2025, 7, 11), date(2025, 7, 12)
+
+
+@pytest.fixture
+def history(tmp_path) -> SCD2Store:
+    store = _store(tmp_path)
+    store.merge(_players([("#A", 100, "#C"), ("#B", 50, None)]), "2025-07-10")
+    store.merge(_players([("#A", 120, "#C"), ("#B", 50, None)]), "2025-07-11")
+    store.merge(_players([("#A", 120, "#D"), ("#N", 10, "#C")]), "2025-07-12")
+    return store
+
+
+class TestSCD2Store:
+    """Test daily merges and point-in-time lookups."""
+
+    def test_versions(self, history):
+        assert _versions(history) == [
+            ("#A", 100, D1, D2),
+            ("#A", 120, D2, D3),
+            ("#A", 120, D3, None),
+            # Missing from the last snapshot: still current
+            ("#B", 50, D1, None),
+            ("#N", 10, D3, None),
+        ]
+        assert [
+            path.relative_to(history.root).as_posix()
+            for path in sorted(history.root.glob("*/*.parquet"))
+        ] == [
+            "is_current=false/closed-2025-07-11.parquet",
+            "is_current=false/closed-2025-07-12.parquet",
+            "is_current=true/current.parquet",
+        ]
+
+    def test_unchanged_snapshot_writes_nothing(self, tmp_path):
+        store = _store(tmp_path)
+        snapshot = _players([("#A", 100, None)])
+        store.merge(snapshot, "2025-07-10")
+        mtime = store.current_path.stat().st_mtime_ns
+
+        stats = store.merge(snapshot.with_columns(untracked=pl.lit("x")), "2025-07-11")
+
+        assert stats == {"inserted": 0, "changed": 0, "unchanged": 1}
+        assert store.current_path.stat().st_mtime_ns == mtime
+
+    def test_null_typed_column_is_not_a_change(self, tmp_path):
+        store = _store(tmp_path)
+        store.merge(_players([("#A", 100, "#C"), ("#B", 50, None)]), "2025-07-10")
+        # A day where club_tag is all null and typed Null
+        snapshot = pl.DataFrame({"tag": ["#B"], "trophies": [50]}).with_columns(
+            club_tag=pl.lit(None), untracked=pl.lit("note")
+        )
+
+        stats = store.merge(snapshot, "2025-07-11")
+
+        assert stats == {"inserted": 0, "changed": 0, "unchanged": 1}
+
+    def test_same_day_merge_replaces_version(self, history):
+        expected = _versions(history)
+
+        history.merge(_players([("#A", 130, "#D")]), "2025-07-12")
+        history.merge(_players([("#A", 120, "#D")]), "2025-07-12")
+
+        assert _versions(history) == expected
+
+    def test_out_of_order_merge(self, history):
+        assert history.latest_date() == "2025-07-12"
+        with pytest.raises(ValueError, match="history is at 2025-07-12"):
+            history.merge(_players([("#A", 1, None)]), "2025-07-11")
+
+    @pytest.mark.parametrize(
+        "day, expected",
+        [
+            ("2025-07-09", []),
+            ("2025-07-10", [("#A", 100), ("#B", 50)]),
+            ("2025-07-11", [("#A", 120), ("#B", 50)]),
+            ("2025-07-13", [("#A", 120), ("#B", 50), ("#N", 10)]),
+        ],
+    )
+    def test_as_of(self, history, day, expected):
+        result = history.as_of(day).select("tag", "trophies").collect().sort("tag")
+
+        assert result.rows() == expected
+
+    def test_duckdb_reads_history(self, history):
+        count, current = duckdb.sql(
+            f"SELECT COUNT(*), COUNT(*) FILTER (WHERE valid_to IS NULL) "
+            f"FROM read_parquet('{history.root}/*/*.parquet', hive_partitioning = true)"
+        ).fetchone()
+
+        assert (count, current) == (5, 3)
+
+
+class TestDimensionHistory:
+    """Test that dimension processors merge their snapshot into the history."""
+
+    @pytest.fixture
+    def cleaned_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(dim_clubs, "DATA_CLEANED_DIR", tmp_path)
+        return tmp_path
+
+    @staticmethod
+    def _clubs(trophies: int) -> pl.DataFrame:
+        return pl.DataFrame(
+            {
+                "tag": ["#C"],
+                "name": ["club"],
+                "description": [None],
+                "trophies": [trophies],
+                "required_trophies": [0],
+                "member_count": [30],
+            }
+        )
+
+    def test_dim_clubs_history(self, cleaned_dir):
+        for day, trophies in [("2025-07-10", 1000), ("2025-07-11", 1100)]:
+            processor = DimClubsProcessor(day)
+            plan = processor.build_dimension(self._clubs(trophies).lazy())
+            processor.save_dimension(plan.collect())
+
+        snapshot = pl.read_parquet(cleaned_dir / "dim_clubs.parquet")
+        history = processor.get_history_store().scan().collect().sort("valid_from")
+        assert snapshot["trophies"].to_list() == [1100]
+        assert history["trophies"].to_list() == [1000, 1100]
+        assert history["valid_to"].to_list() == [D2, None]
+        assert "_process_date" not in history.columns
+
+    def test_history_disabled(self, cleaned_dir):
+        processor = DimClubsProcessor("2025-07-10", history=False)
+        processor.save_dimension(
+            processor.build_dimension(self._clubs(1000).lazy()).collect()
+        )
+
+        assert (cleaned_dir / "dim_clubs.parquet").exists()
+        assert not processor.get_history_path().exists()
+
+    def test_backfill_skips_history(self, cleaned_dir):
+        for day, trophies in [("2025-07-11", 1100), ("2025-07-10", 1000)]:
+            processor = DimClubsProcessor(day)
+            processor.save_dimension(
+                processor.build_dimension(self._clubs(trophies).lazy()).collect()
+            )
+
+        snapshot = pl.read_parquet(cleaned_dir / "dim_clubs.parquet")
+        history = processor.get_history_store().scan().collect()
+        assert snapshot["trophies"].to_list() == [1000]
+        assert history["trophies"].to_list() == [1100]
@@ -0,0 +1,142 @@
+"""
+Tests for the NDJSON segment store and its use by the ingested/raw stages.
+"""
+
+import threading
+
+import polars as pl
+
+from brawlstar_project.processing.ingested import (
+    BrawlStarsClient,
+    CheckpointJournal,
+    IngestionPlanner,
+)
+from brawlstar_project.processing.utils import json_utils
+from brawlstar_project.processing.utils.segment_store import SegmentStore
+
+
+class TestSegmentStore:
+    """Test SegmentStore appends, rotation and scans."""
+
+    def test_append_and_scan(self, tmp_path):
+        """Test that records are read back with their tag, last write winning."""
+        store = SegmentStore(tmp_path)
+        store.append({"v": 1}, "#A", "player", "player", date="2025-01-01")
+        store.append({"v": 1}, "#B", "player", "player", date="2025-01-01")
+        store.append({"v": 2}, "#A", "player", "player", date="2025-01-01")
+
+        assert dict(store.scan("player", "player", "2025-01-01")) == {
+            "#A": {"v": 2},
+            "#B": {"v": 1},
+        }
+        assert store.contains("#B", "player", "player", "2025-01-01")
+        assert not store.contains("#C", "player", "player", "2025-01-01")
+        assert store.dates("player") == {"2025-01-01"}
+
+    def test_segments_rotate_by_size(self, tmp_path):
+        """Test that a new segment starts once the size limit is reached."""
+        store = SegmentStore(tmp_path, max_segment_bytes=200)
+        for i in range(10):
+            store.append({"payload": "x" * 50}, f"#T{i}", "player", "battlelog", "d")
+
+        segments = store.segments("player", "battlelog", "d")
+        assert len(segments) > 1
+        assert all(path.stat().st_size <= 200 for path in segments)
+        assert len(dict(store.scan("player", "battlelog", "d"))) == 10
+
+    def test_concurrent_appends_do_not_interleave(self, tmp_path):
+        """Test that records appended from many threads stay whole."""
+        store = SegmentStore(tmp_path)
+
+        def write(worker: int) -> None:
+            for i in range(50):
+                store.append(
+                    {"payload": "y" * 500}, f"#{worker}-{i}", "club", "club", "d"
+                )
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(dict(store.scan("club", "club", "d"))) == 400
+
+    def test_truncated_record_is_skipped(self, tmp_path):
+        """Test that a record cut off by a crash is ignored."""
+        store = SegmentStore(tmp_path)
+        path = store.append({"v": 1}, "#A", "club", "club", "d")
+        with open(path, "a") as f:
+            f.write('{"tag": "#B", "da')
+
+        assert dict(store.scan("club", "club", "d")) == {"#A": {"v": 1}}
+
+
+class TestSegmentStorageMode:
+    """Test BRAWLSTARS_INGESTED_STORAGE=segments end to end."""
+
+    def test_ingest_resume_and_convert(
+        self, stub_club_api, ingested_dir, tmp_path, monkeypatch
+    ):
+        """Test that segments replace per-tag files and feed the raw stage."""
+        monkeypatch.setenv("BRAWLSTARS_INGESTED_STORAGE", "segments")
+        journal_dir = tmp_path / "journal"
+
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            planner = IngestionPlanner(client, journal=CheckpointJournal(journal_dir))
+            planner.execute(planner.plan(club_tags=[stub_club_api.club_tag]))
+
+        assert not (ingested_dir / "player").exists()
+        assert len(list((ingested_dir / "_segments").rglob("*.ndjson"))) == 4
+
+        # Resuming without the journal relies on the segment records
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            plan = IngestionPlanner(client, resume=True).plan(
+                club_tags=[stub_club_api.club_tag]
+            )
+        assert plan.tasks == []
+        assert plan.members_by_club[stub_club_api.club_tag] == (
+            stub_club_api.member_tags
+        )
+
+        json_utils.convert_all_json_to_parquet_partitioned(
+            ingested_base_dir=str(ingested_dir), raw_base_dir=str(tmp_path / "raw")
+        )
+
+        (players_file,) = (tmp_path / "raw" / "player").glob("*/player.parquet")
+        (battles_file,) = (tmp_path / "raw" / "player").glob("*/battlelog.parquet")
+        assert sorted(pl.read_parquet(players_file)["tag"]) == sorted(
+            stub_club_api.member_tags
+        )
+        assert not pl.read_parquet(battles_file).is_empty()
+
+    def test_segment_record_wins_over_file(
+        self, stub_club_api, ingested_dir, tmp_path, monkeypatch
+    ):
+        """Test that a tag stored as a file and a segment record is read once."""
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            planner = IngestionPlanner(client)
+            planner.execute(planner.plan(player_tags=["#PC0PPLRU", "#G02QL2U2"]))
+        # The same day is ingested again in segment mode for one player
+        monkeypatch.setenv("BRAWLSTARS_INGESTED_STORAGE", "segments")
+        json_utils.save_player_data_partitioned(
+            {
+                "tag": "#PC0PPLRU",
+                "name": "Renamed",
+                "trophies": 1000,
+                "highestTrophies": 1200,
+                "expLevel": 50,
+                "expPoints": 50000,
+                "brawlers": [],
+            },
+            "#PC0PPLRU",
+        )
+
+        json_utils.convert_all_json_to_parquet_partitioned(
+            ingested_base_dir=str(ingested_dir), raw_base_dir=str(tmp_path / "raw")
+        )
+
+        (players_file,) = (tmp_path / "raw" / "player").glob("*/player.parquet")
+        players = pl.read_parquet(players_file).sort("tag")
+        assert players["tag"].to_list() == ["#G02QL2U2", "#PC0PPLRU"]
+        assert players["name"].to_list()[1] == "Renamed"
@@ -0,0 +1,71 @@
+"""
+Tests for flattening ingested payloads without re-validating them.
+"""
+
+import polars as pl
+import pytest
+
+from brawlstar_project.entities.player.models import (
+    PlayerData,
+    create_flattened_player_data,
+)
+from brawlstar_project.processing.ingested import BrawlStarsClient, IngestionPlanner
+from brawlstar_project.processing.utils import json_utils
+
+PARQUET_FILES = [
+    "player/*/player.parquet",
+    "player/*/battlelog.parquet",
+    "club/*/club.parquet",
+    "club/*/club_members.parquet",
+]
+
+
+class TestTrustedFlatten:
+    """Test that trusted and validated flattening produce the same data."""
+
+    def test_saved_player_keeps_victories(self):
+        """Test that a saved PlayerData dump re-validates to the same values."""
+        raw = {
+            "tag": "#PC0PPLRU",
+            "name": "Player",
+            "trophies": 1000,
+            "highestTrophies": 1200,
+            "expLevel": 50,
+            "expPoints": 50000,
+            "3vs3Victories": 100,
+            "soloVictories": 50,
+            "brawlers": [],
+        }
+        saved = PlayerData.model_validate(raw).model_dump()
+
+        validated = create_flattened_player_data(saved)
+        trusted = create_flattened_player_data(saved, validate=False)
+
+        assert validated.three_vs_three_victories == 100
+        assert trusted.three_vs_three_victories == 100
+        assert trusted.solo_victories == validated.solo_victories == 50
+
+    @pytest.mark.parametrize("pattern", PARQUET_FILES)
+    def test_raw_stage_output_is_identical(
+        self, stub_club_api, ingested_dir, tmp_path, pattern
+    ):
+        """Test that the raw stage writes the same frames in both modes."""
+        with BrawlStarsClient(api_key="key", base_url=stub_club_api.base_url) as client:
+            planner = IngestionPlanner(client)
+            planner.execute(planner.plan(club_tags=[stub_club_api.club_tag]))
+
+        for trusted in (True, False):
+            json_utils.convert_all_json_to_parquet_partitioned(
+                ingested_base_dir=str(ingested_dir),
+                raw_base_dir=str(tmp_path / f"raw-{trusted}"),
+                trusted=trusted,
+            )
+
+        (trusted_file,) = (tmp_path / "raw-True").glob(pattern)
+        (validated_file,) = (tmp_path / "raw-False").glob(pattern)
+        trusted_df = pl.read_parquet(trusted_file).drop("extracted_at")
+        validated_df = pl.read_parquet(validated_file).drop("extracted_at")
+
+        assert not trusted_df.is_empty()
+        assert trusted_df.schema == validated_df.schema
+        assert trusted_df.equals(validated_df)